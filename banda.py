@@ -0,0 +1,370 @@
+"""
+Sistemas en banda: detección del ancho de banda y resolución especializada.
+
+Una matriz tiene banda (p, q) si A[i][j] = 0 cuando j < i - p o j > i + q.
+Los sistemas tridiagonales (p, q <= 1), comunes en splines y diferencias
+finitas, se resuelven con el algoritmo de Thomas en O(n); los de banda
+general con eliminación restringida a la banda en O(n·p·q). Ninguno de los
+dos intercambia filas: si aparece un pivote nulo se vuelve a la eliminación
+general con pivoteo.
+
+El registro de pasos es un LogPasos de PasoGauss condensado: un paso por
+pivote en la eliminación y uno por fila en la sustitución hacia atrás, en
+lugar de uno por operación de fila.
+"""
+from fraccion import Fraccion
+from gauss import GaussJordanEngine, LogPasos, NavegacionPasos, PasoGauss
+from matrices import MODOS_NUMERICOS, _como_listas, _motor_flotante
+
+# En modo flotante, un pivote con |p| <= TOLERANCIA · max|A| se considera cero
+TOLERANCIA = 1e-12
+
+# resolver_sistema guarda los pasos por defecto solo hasta este tamaño
+MAX_FILAS_PASOS = 60
+
+# crear_motor usa MotorBanda desde este tamaño; en sistemas más chicos se
+# muestran los pasos de Gauss-Jordan de siempre
+MIN_FILAS_MOTOR_BANDA = 4
+
+
+class _Aritmetica:
+    """Lo que cambia entre el modo exacto (Fraccion) y el flotante (float)."""
+
+    def __init__(self, modo):
+        if modo not in MODOS_NUMERICOS:
+            raise ValueError(f"Modo numérico inválido: {modo}. Use 'exacto' o 'flotante'")
+        self.exacto = modo == "exacto"
+        self.cero = Fraccion(0) if self.exacto else 0.0
+        self.uno = Fraccion(1) if self.exacto else 1.0
+        self.tol = 0.0
+
+    def valor(self, x):
+        if self.exacto:
+            return x if isinstance(x, Fraccion) else Fraccion(x)
+        return float(x)
+
+    def ajustar_tolerancia(self, maximo):
+        self.tol = TOLERANCIA * max(1.0, float(maximo))
+
+    def nulo(self, x):
+        return x.es_cero() if self.exacto else abs(x) <= self.tol
+
+    def texto(self, x):
+        return str(x) if self.exacto else f"{x:.6g}"
+
+
+def detectar_banda(A, columnas=None):
+    """
+    Devuelve (p, q): cuántas diagonales hay debajo (p) y encima (q) de la
+    principal con alguna entrada no nula. `columnas` limita la búsqueda a las
+    primeras columnas (para una matriz aumentada [A|b], columnas = n).
+    """
+    p = q = 0
+    for i, fila in enumerate(_como_listas(A)):
+        fin = len(fila) if columnas is None else columnas
+        no_nulas = [j for j in range(fin) if fila[j] != 0]
+        if no_nulas:
+            p = max(p, i - no_nulas[0])
+            q = max(q, no_nulas[-1] - i)
+    return p, q
+
+
+def _fila(n, ar, entradas, rhs):
+    """Fila densa de [A|b] con las entradas {columna: valor} y el término independiente."""
+    fila = [ar.cero] * n + [rhs]
+    for j, v in entradas.items():
+        fila[j] = v
+    return fila
+
+
+def _anotador(M, log):
+    """Función que aplica los cambios de fila a M y agrega el paso a log."""
+    def anotar(descripcion, cambios, estado, pivote=(None, None)):
+        for i, fila in cambios.items():
+            M[i] = fila
+        paso = PasoGauss(descripcion, *pivote)
+        paso.estado = estado
+        log.agregar(paso, M, list(cambios), checkpoint=estado[2])
+    return anotar
+
+
+def _iniciar_log(M, descripcion):
+    log = LogPasos(len(M))
+    anotar = _anotador(M, log)
+    anotar(descripcion, {}, (0, 0, False))
+    return log, anotar
+
+
+def _pivote_nulo(i):
+    return ValueError(f"Pivote nulo en la fila {i + 1}: la eliminación en banda necesitaría intercambiar filas")
+
+
+def _thomas(inferior, diagonal, superior, d, ar, anotar=None):
+    """
+    Algoritmo de Thomas. inferior y superior tienen n - 1 entradas, diagonal y
+    d tienen n. Si hay registro, cada fila queda normalizada (1 en la diagonal)
+    al eliminar y reducida a [0 … 1 … 0 | x_i] en la sustitución.
+    """
+    n = len(diagonal)
+    c = [ar.cero] * n  # superior / pivote
+    e = [ar.cero] * n  # lado derecho / pivote
+    for i in range(n):
+        if i == 0:
+            w, rhs = diagonal[0], d[0]
+        else:
+            w = diagonal[i] - inferior[i - 1] * c[i - 1]
+            rhs = d[i] - inferior[i - 1] * e[i - 1]
+        if ar.nulo(w):
+            raise _pivote_nulo(i)
+        if i < n - 1:
+            c[i] = superior[i] / w
+        e[i] = rhs / w
+        if anotar:
+            if i == 0 or ar.nulo(inferior[i - 1]):
+                desc = f"F{i + 1} → F{i + 1} / ({ar.texto(w)})"
+            else:
+                desc = f"F{i + 1} → (F{i + 1} − ({ar.texto(inferior[i - 1])})×F{i}) / ({ar.texto(w)})"
+            entradas = {i: ar.uno, i + 1: c[i]} if i < n - 1 else {i: ar.uno}
+            anotar(desc, {i: _fila(n, ar, entradas, e[i])}, (i, i, False), (i, i))
+
+    x = [ar.cero] * n
+    x[n - 1] = e[n - 1]
+    for i in range(n - 2, -1, -1):
+        x[i] = e[i] - c[i] * x[i + 1]
+        if anotar:
+            anotar(f"F{i + 1} → F{i + 1} − ({ar.texto(c[i])})×F{i + 2}",
+                   {i: _fila(n, ar, {i: ar.uno}, x[i])}, (i, i, False), (i, i))
+    return x
+
+
+def _eliminar_banda(banda, d, p, q, ar, anotar=None):
+    """
+    Eliminación sin intercambios restringida a la banda. banda[i][j - i + p]
+    es A[i][j] para i - p <= j <= i + q (fuera de la matriz vale cero).
+    Modifica banda y d; devuelve x.
+    """
+    n = len(banda)
+    for k in range(n):
+        fk = banda[k]
+        pivote = fk[p]
+        if ar.nulo(pivote):
+            raise _pivote_nulo(k)
+        fin = min(n, k + q + 1)
+        cambios = {}
+        operaciones = []
+        for i in range(k + 1, min(n, k + p + 1)):
+            fi = banda[i]
+            a = fi[k - i + p]
+            if ar.nulo(a):
+                continue
+            m = a / pivote
+            fi[k - i + p] = ar.cero
+            for j in range(k + 1, fin):
+                fi[j - i + p] = fi[j - i + p] - m * fk[j - k + p]
+            d[i] = d[i] - m * d[k]
+            if anotar:
+                operaciones.append(f"F{i + 1} → F{i + 1} − ({ar.texto(m)})×F{k + 1}")
+                cambios[i] = _fila(n, ar, {j: fi[j - i + p] for j in range(max(0, i - p), min(n, i + q + 1))}, d[i])
+        if anotar and operaciones:
+            anotar("; ".join(operaciones), cambios, (k, k, False), (k, k))
+
+    x = [ar.cero] * n
+    for i in range(n - 1, -1, -1):
+        fi = banda[i]
+        acc = d[i]
+        terminos = []
+        for j in range(i + 1, min(n, i + q + 1)):
+            a = fi[j - i + p]
+            if not ar.nulo(a):
+                acc = acc - a * x[j]
+                terminos.append(f" − ({ar.texto(a)})×F{j + 1}")
+        x[i] = acc / fi[p]
+        if anotar:
+            desc = f"F{i + 1} → (F{i + 1}{''.join(terminos)}) / ({ar.texto(fi[p])})"
+            anotar(desc, {i: _fila(n, ar, {i: ar.uno}, x[i])}, (i, i, False), (i, i))
+    return x
+
+
+def _cerrar_log(anotar, M, metodo):
+    n = len(M)
+    anotar(f"Proceso completado ({metodo})", {}, (n, n, True))
+
+
+def resolver_tridiagonal(inferior, diagonal, superior, d, modo="exacto", pasos=False):
+    """
+    Resuelve un sistema tridiagonal con el algoritmo de Thomas en O(n).
+
+    inferior: subdiagonal (n - 1 valores), diagonal (n), superior:
+    superdiagonal (n - 1), d: lado derecho (n). Devuelve (x, log), con log un
+    LogPasos de PasoGauss si pasos=True o None. Lanza ValueError si aparece
+    un pivote nulo (el método no intercambia filas).
+    """
+    n = len(diagonal)
+    if len(inferior) != n - 1 or len(superior) != n - 1 or len(d) != n:
+        raise ValueError("Las diagonales deben tener n - 1, n y n - 1 entradas y el lado derecho n")
+    ar = _Aritmetica(modo)
+    inferior = [ar.valor(x) for x in inferior]
+    diagonal = [ar.valor(x) for x in diagonal]
+    superior = [ar.valor(x) for x in superior]
+    d = [ar.valor(x) for x in d]
+    if not ar.exacto:
+        ar.ajustar_tolerancia(max(abs(x) for x in inferior + diagonal + superior))
+
+    if not pasos:
+        return _thomas(inferior, diagonal, superior, d, ar), None
+    M = [_fila(n, ar, {j: v for j, v in ((i - 1, inferior[i - 1] if i else None), (i, diagonal[i]),
+                                          (i + 1, superior[i] if i < n - 1 else None)) if v is not None}, d[i])
+         for i in range(n)]
+    log, anotar = _iniciar_log(M, "Estado inicial (sistema tridiagonal → algoritmo de Thomas)")
+    x = _thomas(inferior, diagonal, superior, d, ar, anotar)
+    _cerrar_log(anotar, M, "Thomas")
+    return x, log
+
+
+def resolver_banda(M_aumentada, p=None, q=None, modo="exacto", pasos=False):
+    """
+    Resuelve [A|b] con A cuadrada en banda (p inferior, q superior) en
+    O(n·p·q). Si p o q no se indican se detectan. Devuelve (x, log) como
+    resolver_tridiagonal.
+    """
+    M = _como_listas(M_aumentada)
+    n = len(M)
+    if n == 0 or any(len(fila) != n + 1 for fila in M):
+        raise ValueError("Se espera una matriz aumentada [A|b] con A cuadrada")
+    if p is None or q is None:
+        p_det, q_det = detectar_banda(M, columnas=n)
+        p = p_det if p is None else p
+        q = q_det if q is None else q
+    ar = _Aritmetica(modo)
+    banda = [[ar.valor(M[i][j]) if 0 <= j < n else ar.cero for j in range(i - p, i + q + 1)] for i in range(n)]
+    d = [ar.valor(fila[n]) for fila in M]
+    if not ar.exacto:
+        ar.ajustar_tolerancia(max(abs(x) for fila in banda for x in fila))
+
+    if not pasos:
+        return _eliminar_banda(banda, d, p, q, ar), None
+    densa = [[ar.valor(x) for x in fila] for fila in M]
+    log, anotar = _iniciar_log(densa, f"Estado inicial (matriz en banda: {p} inferior, {q} superior)")
+    x = _eliminar_banda(banda, d, p, q, ar, anotar)
+    _cerrar_log(anotar, densa, "eliminación en banda")
+    return x, log
+
+
+def _metodo(p, q, n):
+    """"thomas", "banda" o None (conviene la eliminación general)."""
+    if p <= 1 and q <= 1:
+        return "thomas"
+    if p + q < n - 1:
+        return "banda"
+    return None
+
+
+def _resolver_general(M, modo, pasos):
+    n = len(M)
+    flotante = _motor_flotante(modo)
+    if flotante is not None:
+        R = flotante.a_arreglo(M)
+        pivotes, _ = flotante.eliminar(R, hasta_columna=n, reducir=True)
+        if len(pivotes) < n:
+            raise ValueError("La matriz es singular: el sistema no tiene solución única")
+        return R[:, n].tolist(), None
+    engine = GaussJordanEngine([[Fraccion(x) if not isinstance(x, Fraccion) else x for x in fila] for fila in M])
+    engine.resolver(registrar=pasos)
+    if engine.analizar()[0] != "única":
+        raise ValueError("La matriz es singular: el sistema no tiene solución única")
+    return [fila[n] for fila in engine.matriz_actual], engine.log if pasos else None
+
+
+def resolver_sistema(M_aumentada, modo="exacto", pasos=None):
+    """
+    Resuelve [A|b] (A cuadrada e invertible) eligiendo el método según la banda:
+    tridiagonal → Thomas, banda angosta → eliminación en banda, si no →
+    Gauss-Jordan (exacto) o eliminación con pivoteo parcial (flotante).
+    También vuelve al método general si Thomas o la banda encuentran un
+    pivote nulo. pasos=None guarda el registro solo si n <= MAX_FILAS_PASOS.
+    Devuelve (x, log).
+    """
+    M = _como_listas(M_aumentada)
+    n = len(M)
+    if n == 0 or any(len(fila) != n + 1 for fila in M):
+        raise ValueError("Se espera una matriz aumentada [A|b] con A cuadrada")
+    if pasos is None:
+        pasos = n <= MAX_FILAS_PASOS
+    p, q = detectar_banda(M, columnas=n)
+    metodo = _metodo(p, q, n)
+    try:
+        if metodo == "thomas":
+            return resolver_tridiagonal([M[i][i - 1] for i in range(1, n)], [M[i][i] for i in range(n)],
+                                        [M[i][i + 1] for i in range(n - 1)], [fila[n] for fila in M],
+                                        modo=modo, pasos=pasos)
+        if metodo == "banda":
+            return resolver_banda(M, p, q, modo=modo, pasos=pasos)
+    except ValueError:
+        pass  # pivote nulo: hace falta pivotear
+    return _resolver_general(M, modo, pasos)
+
+
+class MotorBanda(NavegacionPasos):
+    """
+    Motor paso a paso para sistemas en banda con la misma interfaz que
+    GaussJordanEngine (siguiente, resolver, ir_a, anterior, analizar,
+    conjunto_solucion). Todos los pasos se calculan al crearlo; lanza
+    ValueError si la eliminación sin intercambios encuentra un pivote nulo.
+    """
+
+    def __init__(self, matriz_aumentada):
+        M = _como_listas(matriz_aumentada)
+        self.matriz_original = [[x for x in fila] for fila in M]
+        self.filas = len(M)
+        self.columnas = len(M[0]) if M else 0
+        n = self.filas
+        if n == 0 or self.columnas != n + 1:
+            raise ValueError("Se espera una matriz aumentada [A|b] con A cuadrada")
+        p, q = detectar_banda(M, columnas=n)
+        if _metodo(p, q, n) == "thomas":
+            self.metodo = "tridiagonal, algoritmo de Thomas"
+            self.solucion, self.log = resolver_tridiagonal(
+                [M[i][i - 1] for i in range(1, n)], [M[i][i] for i in range(n)],
+                [M[i][i + 1] for i in range(n - 1)], [fila[n] for fila in M], pasos=True)
+        else:
+            self.metodo = f"banda {p} inferior, {q} superior"
+            self.solucion, self.log = resolver_banda(M, p, q, pasos=True)
+        self.paso_actual = len(self.log)
+        self._restaurar(0)
+
+    def siguiente(self):
+        if self.posicion < len(self.log) - 1:
+            self._restaurar(self.posicion + 1)
+            return self.log[self.posicion]
+        return None
+
+    def resolver(self, registrar=True):
+        self._restaurar(len(self.log) - 1)
+        return self.matriz_actual
+
+    def _motor_final(self):
+        gj = GaussJordanEngine(self.log.matriz_en(-1))
+        gj.resolver(registrar=False)
+        return gj
+
+    def analizar(self):
+        return self._motor_final().analizar()
+
+    def conjunto_solucion(self, resultado=None):
+        return self._motor_final().conjunto_solucion(resultado)
+
+
+def crear_motor(matriz_aumentada):
+    """
+    MotorBanda si [A|b] es cuadrado, tiene al menos MIN_FILAS_MOTOR_BANDA
+    filas y A tiene banda angosta (y no hace falta pivotear); si no,
+    GaussJordanEngine.
+    """
+    M = _como_listas(matriz_aumentada)
+    n = len(M)
+    if n >= MIN_FILAS_MOTOR_BANDA and all(len(fila) == n + 1 for fila in M) and _metodo(*detectar_banda(M, columnas=n), n):
+        try:
+            return MotorBanda(M)
+        except ValueError:
+            pass
+    return GaussJordanEngine(M)
@@ -0,0 +1,288 @@
+"""
+Micro-benchmarks de los motores de la calculadora.
+
+Uso:
+    python benchmarks.py                 # corre todos
+    python benchmarks.py fraccion        # solo uno
+"""
+import math
+import os
+import random
+import sys
+import time
+
+import fraccion
+from banda import resolver_sistema, resolver_tridiagonal
+from dispersa import MatrizDispersa, resolver_disperso
+from fraccion import Fraccion
+from gauss import FactorizacionLU, GaussEngine, GaussJordanEngine
+import matrices
+from matrices import (determinante_cofactores, determinante_modular, eliminacion_bareiss, inversa_matriz,
+                      multiplicar_matrices)
+
+
+class FraccionReferencia:
+    """Copia de la Fraccion original (siempre cruza y calcula gcd), para comparar."""
+
+    def __init__(self, numerador, denominador=1):
+        if denominador == 0:
+            raise ZeroDivisionError("Denominador no puede ser cero")
+        g = math.gcd(abs(numerador), abs(denominador))
+        self.numerador = numerador // g
+        self.denominador = denominador // g
+        if self.denominador < 0:
+            self.numerador = -self.numerador
+            self.denominador = -self.denominador
+
+    def _como(self, other):
+        return FraccionReferencia(other) if isinstance(other, int) else other
+
+    def __add__(self, other):
+        other = self._como(other)
+        return FraccionReferencia(self.numerador * other.denominador + other.numerador * self.denominador,
+                                  self.denominador * other.denominador)
+
+    def __sub__(self, other):
+        other = self._como(other)
+        return FraccionReferencia(self.numerador * other.denominador - other.numerador * self.denominador,
+                                  self.denominador * other.denominador)
+
+    def __mul__(self, other):
+        other = self._como(other)
+        return FraccionReferencia(self.numerador * other.numerador, self.denominador * other.denominador)
+
+    def __truediv__(self, other):
+        other = self._como(other)
+        return FraccionReferencia(self.numerador * other.denominador, self.denominador * other.numerador)
+
+    def __eq__(self, other):
+        other = self._como(other)
+        return self.numerador * other.denominador == other.numerador * self.denominador
+
+    def __neg__(self):
+        return FraccionReferencia(-self.numerador, self.denominador)
+
+    def __str__(self):
+        return str(self.numerador) if self.denominador == 1 else f"{self.numerador}/{self.denominador}"
+
+    def es_cero(self):
+        return self.numerador == 0
+
+    def reciproco(self):
+        return FraccionReferencia(self.denominador, self.numerador)
+
+
+def _matriz_enteros(n, m, tipo, semilla=0, rango=9):
+    rnd = random.Random(semilla)
+    return [[tipo(rnd.randint(-rango, rango)) for _ in range(m)] for _ in range(n)]
+
+
+def _medir(funcion, repeticiones=3):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+def _gauss_jordan_completo(M):
+    engine = GaussJordanEngine(M)
+    while not engine.terminado:
+        engine.siguiente()
+    return engine
+
+
+def _producto(A, B):
+    # Triple lazo simple, sin pasos, para que sirva con cualquier tipo de fracción
+    return [[sum((A[i][k] * B[k][j] for k in range(1, len(B))), A[i][0] * B[0][j])
+             for j in range(len(B[0]))] for i in range(len(A))]
+
+
+def bench_fraccion(n=30):
+    """Fraccion actual vs. la original en eliminación y producto de enteros."""
+    print(f"== Fraccion: ruta rápida de enteros (n={n}) ==")
+    for nombre, tipo in (("original", FraccionReferencia), ("actual", Fraccion)):
+        M = _matriz_enteros(n, n + 1, tipo)
+        A = _matriz_enteros(n, n, tipo, semilla=1)
+        t_gj = _medir(lambda: _gauss_jordan_completo(M))
+        t_mul = _medir(lambda: _producto(A, A))
+        print(f"  {nombre:>9}: Gauss-Jordan {t_gj:8.3f} s | producto A·A {t_mul:8.3f} s")
+
+
+def bench_backend(n=50, rangos=(9, 10**6, 10**15)):
+    """Gauss-Jordan sobre sistemas n×(n+1) aleatorios con cada backend de Fraccion."""
+    print(f"== Backends de Fraccion: Gauss-Jordan {n}×{n + 1} ==")
+    anterior = fraccion.backend_actual()
+    try:
+        for rango in rangos:
+            for nombre in ("python", "gmpy2"):
+                try:
+                    fraccion.usar_backend(nombre)
+                except ValueError as e:
+                    print(f"  {nombre:>9}: no disponible ({e})")
+                    continue
+                M = _matriz_enteros(n, n + 1, Fraccion, rango=rango)
+                t = _medir(lambda: _gauss_jordan_completo(M), repeticiones=1)
+                print(f"  entradas ±{rango:<8.0e} {nombre:>7}: {t:8.3f} s")
+    finally:
+        fraccion.usar_backend(anterior)
+
+
+def _det_fracciones(A):
+    # Eliminación gaussiana clásica con divisiones en Fraccion (referencia)
+    M = [fila[:] for fila in A]
+    n = len(M)
+    det = Fraccion(1)
+    for i in range(n):
+        p = next((r for r in range(i, n) if not M[r][i].es_cero()), None)
+        if p is None:
+            return Fraccion(0)
+        if p != i:
+            M[i], M[p] = M[p], M[i]
+            det = -det
+        det = det * M[i][i]
+        for r in range(i + 1, n):
+            f = M[r][i] / M[i][i]
+            for k in range(i, n):
+                M[r][k] = M[r][k] - f * M[i][k]
+    return det
+
+
+def bench_bareiss(n=40):
+    """Determinante por Bareiss (enteros) vs. eliminación con Fraccion."""
+    print(f"== Determinante {n}×{n} de enteros ==")
+    A = _matriz_enteros(n, n, Fraccion, rango=99)
+    t_frac = _medir(lambda: _det_fracciones(A))
+    t_bar = _medir(lambda: eliminacion_bareiss(A))
+    print(f"  Fraccion: {t_frac:8.3f} s | Bareiss: {t_bar:8.3f} s | x{t_frac / t_bar:.1f}")
+
+
+def bench_resolver(n=100):
+    """Motores paso a paso vs. resolver(registrar=False) en sistemas n×(n+1)."""
+    print(f"== Resolver hasta el final: {n}×{n + 1} ==")
+    M = _matriz_enteros(n, n + 1, Fraccion)
+    for nombre, motor in (("Gauss-Jordan", GaussJordanEngine), ("Gauss", GaussEngine)):
+        t_pasos = _medir(lambda: motor(M).resolver(), repeticiones=1)
+        t_rapido = _medir(lambda: motor(M).resolver(registrar=False), repeticiones=1)
+        print(f"  {nombre:>12}: con pasos {t_pasos:8.3f} s | sin pasos {t_rapido:8.3f} s"
+              f" | x{t_pasos / t_rapido:.1f}")
+
+
+def bench_lu(n=30, lados=30):
+    """Un mismo A contra varios b: Gauss-Jordan por cada b vs. una sola LU."""
+    print(f"== {lados} lados derechos, A {n}×{n} ==")
+    A = _matriz_enteros(n, n, Fraccion)
+    bs = [[fila[0] for fila in _matriz_enteros(n, 1, Fraccion, semilla=s)] for s in range(lados)]
+    t_gj = _medir(lambda: [GaussJordanEngine([A[i] + [b[i]] for i in range(n)]).resolver(registrar=False)
+                           for b in bs], repeticiones=1)
+    t_lu = _medir(lambda: [lu.resolver(b) for lu in [FactorizacionLU(A)] for b in bs], repeticiones=1)
+    print(f"  Gauss-Jordan por b: {t_gj:8.3f} s | LU + sustituciones: {t_lu:8.3f} s | x{t_gj / t_lu:.1f}")
+
+
+def bench_laplace(n=9):
+    """Desarrollo de Laplace sin caché (O(n!)): en serie vs. en paralelo."""
+    print(f"== Cofactores {n}×{n} sin memorizar, {os.cpu_count()} núcleos ==")
+    A = _matriz_enteros(n, n, Fraccion)
+    t_serie = _medir(lambda: determinante_cofactores(A, "fila0", "ninguno", max_cache=0), repeticiones=1)
+    for profundidad in (1, 2):
+        t_par = _medir(lambda: determinante_cofactores(A, "fila0", "ninguno", max_cache=0, paralelo=True,
+                                                       profundidad_paralela=profundidad), repeticiones=1)
+        print(f"  serie {t_serie:8.3f} s | paralelo (profundidad {profundidad}) {t_par:8.3f} s"
+              f" | x{t_serie / t_par:.1f}")
+
+
+def bench_modular(tamanos=(100, 200, 300)):
+    """Determinante de enteros: Bareiss vs. modular (varios primos + TCR)."""
+    print("== Determinante exacto: Bareiss vs. modular ==")
+    for n in tamanos:
+        A = _matriz_enteros(n, n, Fraccion, rango=99)
+        t_bar = _medir(lambda: eliminacion_bareiss(A), repeticiones=1)
+        t_mod = _medir(lambda: determinante_modular(A, "ninguno"), repeticiones=1)
+        print(f"  {n:>4}×{n:<4} Bareiss {t_bar:8.3f} s | modular {t_mod:8.3f} s | x{t_bar / t_mod:.1f}")
+
+
+def bench_flotante(n=100):
+    """Inversa n×n: aritmética exacta (Fraccion) vs. modo flotante (NumPy)."""
+    print(f"== Inversa {n}×{n}: exacto vs. flotante ==")
+    A = _matriz_enteros(n, n, Fraccion)
+    t_exacto = _medir(lambda: inversa_matriz(A, "ninguno"), repeticiones=1)
+    t_flotante = _medir(lambda: inversa_matriz(A, "ninguno", "flotante"))
+    print(f"  exacto {t_exacto:8.3f} s | flotante {t_flotante:8.4f} s | x{t_exacto / t_flotante:.0f}")
+
+
+def _matriz_racional(n, m, semilla=0, rango=9):
+    rnd = random.Random(semilla)
+    return [[Fraccion(rnd.randint(-rango, rango), rnd.randint(1, rango)) for _ in range(m)] for _ in range(n)]
+
+
+def bench_multiplicacion(tamanos=(64, 128, 256)):
+    """Producto n×n exacto: triple lazo vs. bloques vs. multiplicar_matrices, con enteros y fracciones."""
+    print(f"== Multiplicación exacta (UMBRAL_STRASSEN={matrices.UMBRAL_STRASSEN}, solo con enteros) ==")
+    for n in tamanos:
+        for nombre, A, B in (("enteros", _matriz_enteros(n, n, Fraccion), _matriz_enteros(n, n, Fraccion, semilla=1)),
+                             ("fracciones", _matriz_racional(n, n), _matriz_racional(n, n, semilla=1))):
+            t_lazo = _medir(lambda: _producto(A, B), repeticiones=1)
+            t_bloques = _medir(lambda: matrices._producto_bloques(A, list(zip(*B))), repeticiones=1)
+            t_actual = _medir(lambda: multiplicar_matrices(A, B, "ninguno"), repeticiones=1)
+            print(f"  {n:>4}×{n:<4} {nombre:>10}: triple lazo {t_lazo:8.2f} s | bloques {t_bloques:8.2f} s"
+                  f" | multiplicar_matrices {t_actual:8.2f} s | x{t_lazo / t_actual:.1f}")
+
+
+def _tridiagonal(n):
+    entradas = [(i, i, 4) for i in range(n)]
+    entradas += [(i, i + 1, -1) for i in range(n - 1)] + [(i + 1, i, -1) for i in range(n - 1)]
+    return MatrizDispersa.desde_entradas(n, n, entradas)
+
+
+def bench_dispersa(n_denso=200, n_disperso=10**4):
+    """Sistemas tridiagonales: LU densa vs. eliminación dispersa (Markowitz)."""
+    print("== Tridiagonal exacta: densa vs. dispersa ==")
+    T = _tridiagonal(n_denso)
+    densa = T.a_listas()
+    b = [Fraccion(1)] * n_denso
+    t_denso = _medir(lambda: FactorizacionLU(densa).resolver(b), repeticiones=1)
+    t_disperso = _medir(lambda: resolver_disperso(T, b, "ninguno"), repeticiones=1)
+    print(f"  {n_denso}×{n_denso}: LU densa {t_denso:8.3f} s | dispersa {t_disperso:8.3f} s")
+    T = _tridiagonal(n_disperso)
+    b = [Fraccion(1)] * n_disperso
+    t_disperso = _medir(lambda: resolver_disperso(T, b, "ninguno"), repeticiones=1)
+    print(f"  {n_disperso}×{n_disperso}: dispersa {t_disperso:8.3f} s")
+
+
+def bench_banda(n_denso=200, n_banda=10**4):
+    """Sistemas tridiagonales: Gauss-Jordan denso vs. Thomas (exacto y flotante)."""
+    print("== Tridiagonal: Gauss-Jordan vs. Thomas ==")
+    M = [fila + [Fraccion(1)] for fila in _tridiagonal(n_denso).a_listas()]
+    t_denso = _medir(lambda: GaussJordanEngine(M).resolver(registrar=False), repeticiones=1)
+    t_thomas = _medir(lambda: resolver_sistema(M, pasos=False), repeticiones=1)
+    print(f"  {n_denso}×{n_denso}: Gauss-Jordan {t_denso:8.3f} s | detección + Thomas {t_thomas:8.4f} s")
+    diagonal = [Fraccion(4)] * n_banda
+    lateral = [Fraccion(-1)] * (n_banda - 1)
+    d = [Fraccion(1)] * n_banda
+    for modo in ("exacto", "flotante"):
+        t = _medir(lambda: resolver_tridiagonal(lateral, diagonal, lateral, d, modo=modo), repeticiones=1)
+        print(f"  {n_banda}×{n_banda} ({modo}): Thomas {t:8.3f} s")
+
+
+BENCHMARKS = {
+    "fraccion": bench_fraccion,
+    "backend": bench_backend,
+    "bareiss": bench_bareiss,
+    "resolver": bench_resolver,
+    "lu": bench_lu,
+    "laplace": bench_laplace,
+    "modular": bench_modular,
+    "flotante": bench_flotante,
+    "multiplicacion": bench_multiplicacion,
+    "dispersa": bench_dispersa,
+    "banda": bench_banda,
+}
+
+
+if __name__ == "__main__":
+    nombres = sys.argv[1:] or list(BENCHMARKS)
+    for nombre in nombres:
+        if nombre not in BENCHMARKS:
+            sys.exit(f"Benchmark desconocido: {nombre}. Opciones: {', '.join(BENCHMARKS)}")
+        BENCHMARKS[nombre]()
@@ -0,0 +1,264 @@
+"""
+Calculadora por línea de comandos (sin ventana, no importa tkinter).
+
+Resuelve problemas leídos de archivos JSON, JSON Lines o CSV y escribe un
+resultado JSON por línea, en el mismo orden de entrada.
+
+Uso:
+    python cli.py sistema.csv --op gauss-jordan
+    python cli.py ejercicios.jsonl --jobs 4 --salida resultados.jsonl
+    python cli.py a.json b.json --pasos resumen
+    python cli.py grande.csv --op determinante --aritmetica flotante
+
+Formato de un problema (JSON):
+    {"id": "ej1", "operacion": "inversa", "matriz": [["1", "2"], ["3/2", 4]]}
+    {"operacion": "biseccion", "funcion": "x**2 - 2", "a": 0, "b": 2, "tol": 1e-8}
+
+"funcion" es una expresión en x: números, + - * / // % ** (o ^), pi, e y
+funciones de math (sin, sqrt, math.atan, ...). Se valida antes de evaluarla
+y cualquier otra cosa (nombres, atributos, cadenas) se rechaza como error del
+problema; el archivo nunca ejecuta código.
+
+Con "aritmetica": "flotante" (o --aritmetica flotante) las operaciones de
+matrices usan float64 con NumPy en lugar de Fraccion.
+
+Un archivo .json puede tener un problema, una lista de problemas o
+{"problemas": [...]}; un .jsonl tiene un problema por línea; un .csv es una
+sola matriz (una fila por línea) y la operación se toma de --op.
+"""
+import argparse
+import csv
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from fraccion import Fraccion
+from gauss import GaussJordanEngine
+from matrices import determinante_matriz, inversa_matriz
+from numericos import biseccion, compilar_funcion, evaluar_funcion, falsa_posicion, newton_raphson, secante
+
+OPERACIONES_MATRIZ = ("gauss-jordan", "inversa", "determinante")
+OPERACIONES_RAICES = ("biseccion", "falsa-posicion", "newton-raphson", "secante")
+OPERACIONES = OPERACIONES_MATRIZ + OPERACIONES_RAICES
+
+
+# ====== Lectura de problemas ======
+
+def _a_fraccion(valor):
+    """Convierte un valor de entrada (int, float o texto "3", "-1/2", "0.25") a Fraccion."""
+    if isinstance(valor, int):
+        return Fraccion(valor)
+    try:
+        return Fraccion(Fraction(str(valor).strip()))
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"Valor inválido en la matriz: '{valor}'")
+
+
+def _leer_matriz(filas):
+    M = [[_a_fraccion(x) for x in fila] for fila in filas]
+    if not M or not M[0]:
+        raise ValueError("La matriz está vacía")
+    if any(len(fila) != len(M[0]) for fila in M):
+        raise ValueError("Todas las filas de la matriz deben tener la misma longitud")
+    return M
+
+
+def leer_problemas(ruta, operacion=None, aritmetica=None):
+    """Devuelve la lista de problemas (dicts) de un archivo .json, .jsonl o .csv."""
+    if ruta.endswith(".csv"):
+        if operacion is None:
+            raise ValueError(f"{ruta}: para archivos CSV hay que indicar --op")
+        with open(ruta, newline="", encoding="utf-8") as f:
+            filas = [fila for fila in csv.reader(f) if fila]
+        problema = {"id": ruta, "operacion": operacion, "matriz": filas}
+        if aritmetica is not None:
+            problema["aritmetica"] = aritmetica
+        return [problema]
+
+    with open(ruta, encoding="utf-8") as f:
+        if ruta.endswith(".jsonl"):
+            problemas = [json.loads(linea) for linea in f if linea.strip()]
+        else:
+            datos = json.load(f)
+            if isinstance(datos, dict):
+                problemas = datos.get("problemas", [datos])
+            else:
+                problemas = datos
+
+    if not isinstance(problemas, list):
+        raise ValueError(f"{ruta}: se esperaba un problema, una lista de problemas o {{\"problemas\": [...]}}")
+    for k, problema in enumerate(problemas):
+        if not isinstance(problema, dict):
+            raise ValueError(f"{ruta}: el problema {k + 1} no es un objeto JSON ({json.dumps(problema)})")
+        problema.setdefault("id", f"{ruta}:{k + 1}")
+        if operacion is not None:
+            problema.setdefault("operacion", operacion)
+        if aritmetica is not None:
+            problema.setdefault("aritmetica", aritmetica)
+    return problemas
+
+
+# ====== Resolución ======
+
+def _a_texto(x):
+    # Fraccion como texto exacto ("-3/2"); float tal cual
+    return x if isinstance(x, float) else str(x)
+
+
+def _gauss_jordan(problema, modo):
+    if problema.get("aritmetica") == "flotante":
+        import flotante
+        reducida, pasos = flotante.gauss_jordan(_leer_matriz(problema["matriz"]), registro=modo)
+        salida = {"matriz_reducida": reducida}
+        if modo != "ninguno":
+            salida["pasos"] = pasos
+        return salida
+
+    engine = GaussJordanEngine(_leer_matriz(problema["matriz"]))
+    engine.resolver(registrar=modo != "ninguno")
+    tipo, _, _ = resultado = engine.analizar()
+    salida = {
+        "tipo": tipo,
+        "matriz_reducida": [[str(x) for x in fila] for fila in engine.matriz_actual],
+        "conjunto_solucion": engine.conjunto_solucion(resultado),
+    }
+    if modo != "ninguno":
+        salida["pasos"] = [paso.descripcion for paso in engine.log]
+    return salida
+
+
+def _inversa(problema, modo):
+    inversa, pasos = inversa_matriz(_leer_matriz(problema["matriz"]), registro=modo,
+                                    modo=problema.get("aritmetica", "exacto"))
+    salida = {"inversa": [[_a_texto(x) for x in fila] for fila in inversa]}
+    if modo != "ninguno":
+        salida["pasos"] = pasos
+    return salida
+
+
+def _determinante(problema, modo):
+    det, pasos = determinante_matriz(_leer_matriz(problema["matriz"]), registro=modo,
+                                     modo=problema.get("aritmetica", "exacto"))
+    salida = {"determinante": _a_texto(det)}
+    if modo != "ninguno":
+        salida["pasos"] = pasos
+    return salida
+
+
+def _raiz(problema, modo):
+    expresion = problema["funcion"].replace("^", "**")
+    compilar_funcion(expresion)
+
+    def f(x):
+        return evaluar_funcion(expresion, x)
+
+    tol = float(problema.get("tol", 1e-6))
+    max_iter = int(problema.get("max_iter", 100))
+    usar_error = problema.get("usar_error", "absoluto")
+    operacion = problema["operacion"]
+    if operacion == "biseccion":
+        raiz, pasos, motivo = biseccion(f, float(problema["a"]), float(problema["b"]),
+                                        tol=tol, max_iter=max_iter, usar_error=usar_error)
+    elif operacion == "falsa-posicion":
+        raiz, pasos, motivo = falsa_posicion(f, float(problema["a"]), float(problema["b"]),
+                                             tol=tol, max_iter=max_iter, usar_error=usar_error)
+    elif operacion == "newton-raphson":
+        raiz, pasos, motivo = newton_raphson(f, float(problema["x0"]),
+                                             tol=tol, max_iter=max_iter, usar_error=usar_error)
+    else:
+        raiz, pasos, motivo = secante(f, float(problema["x0"]), float(problema["x1"]),
+                                      tol=tol, max_iter=max_iter, usar_error=usar_error)
+    salida = {"raiz": raiz, "iteraciones": len(pasos), "motivo": motivo}
+    if modo != "ninguno":
+        salida["pasos"] = pasos
+    return salida
+
+
+_RESOLVEDORES = {
+    "gauss-jordan": _gauss_jordan,
+    "inversa": _inversa,
+    "determinante": _determinante,
+    "biseccion": _raiz,
+    "falsa-posicion": _raiz,
+    "newton-raphson": _raiz,
+    "secante": _raiz,
+}
+
+
+def resolver_problema(problema, modo="ninguno"):
+    """
+    Resuelve un problema y devuelve un dict serializable a JSON.
+    Los errores del problema se informan en el resultado ("ok": False) en vez
+    de cortar todo el lote.
+    """
+    salida = {"id": problema.get("id"), "operacion": problema.get("operacion")}
+    try:
+        operacion = problema.get("operacion")
+        if operacion not in _RESOLVEDORES:
+            raise ValueError(f"Operación desconocida: {operacion}. Opciones: {', '.join(OPERACIONES)}")
+        salida.update(_RESOLVEDORES[operacion](problema, modo))
+        salida["ok"] = True
+    except (KeyError, ValueError, ZeroDivisionError, TypeError, ImportError) as e:
+        salida["ok"] = False
+        salida["error"] = f"Falta el campo {e}" if isinstance(e, KeyError) else str(e)
+    return salida
+
+
+def _resolver_con_modo(args):
+    problema, modo = args
+    return resolver_problema(problema, modo)
+
+
+def resolver_lote(problemas, modo="ninguno", jobs=1):
+    """Resuelve una lista de problemas, en paralelo con `jobs` procesos si jobs > 1."""
+    if jobs <= 1 or len(problemas) <= 1:
+        for problema in problemas:
+            yield resolver_problema(problema, modo)
+        return
+    tareas = [(problema, modo) for problema in problemas]
+    bloque = max(1, len(tareas) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(_resolver_con_modo, tareas, chunksize=bloque)
+
+
+# ====== Programa principal ======
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calculadora de matrices y raíces por lotes (sin ventana).")
+    parser.add_argument("archivos", nargs="+", help="archivos .json, .jsonl o .csv con los problemas")
+    parser.add_argument("--op", choices=OPERACIONES,
+                        help="operación por defecto (obligatoria para CSV)")
+    parser.add_argument("--pasos", choices=("ninguno", "resumen", "completo"), default="ninguno",
+                        help="incluir la explicación de los pasos en la salida (por defecto: ninguno)")
+    parser.add_argument("--aritmetica", choices=("exacto", "flotante"),
+                        help="aritmética por defecto para las operaciones de matrices (por defecto: exacto)")
+    parser.add_argument("--jobs", type=int, default=1, help="cantidad de procesos en paralelo")
+    parser.add_argument("--salida", help="archivo de salida (por defecto, la salida estándar)")
+    args = parser.parse_args(argv)
+
+    problemas = []
+    try:
+        for ruta in args.archivos:
+            problemas.extend(leer_problemas(ruta, args.op, args.aritmetica))
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    destino = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    fallidos = 0
+    try:
+        for resultado in resolver_lote(problemas, args.pasos, args.jobs):
+            if not resultado["ok"]:
+                fallidos += 1
+            destino.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+    finally:
+        if destino is not sys.stdout:
+            destino.close()
+
+    if fallidos:
+        print(f"{fallidos} de {len(problemas)} problemas con error", file=sys.stderr)
+    return 1 if fallidos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+Matrices dispersas (la mayoría de las entradas en cero) y eliminación
+dispersa exacta.
+
+MatrizDispersa guarda cada fila como un dict {columna: Fraccion} con solo
+las entradas no nulas. resolver_disperso elimina eligiendo los pivotes en
+orden de Markowitz, que limita el relleno (entradas que pasan de cero a no
+cero), y las operaciones de fila recorren solo las entradas no nulas.
+"""
+import heapq
+
+from fraccion import Fraccion
+from matrices import _como_registro
+
+
+class MatrizDispersa:
+    __slots__ = ("filas", "n_columnas")
+
+    def __init__(self, n_filas, n_columnas):
+        self.filas = [{} for _ in range(n_filas)]
+        self.n_columnas = n_columnas
+
+    @classmethod
+    def desde_listas(cls, A):
+        M = cls(len(A), len(A[0]) if len(A) else 0)
+        for i, fila in enumerate(A):
+            for j, x in enumerate(fila):
+                if x != 0:
+                    M.filas[i][j] = x if isinstance(x, Fraccion) else Fraccion(x)
+        return M
+
+    @classmethod
+    def desde_entradas(cls, n_filas, n_columnas, entradas):
+        """entradas: dict {(fila, columna): valor} o iterable de (fila, columna, valor)."""
+        M = cls(n_filas, n_columnas)
+        items = entradas.items() if isinstance(entradas, dict) else (((i, j), v) for i, j, v in entradas)
+        for (i, j), v in items:
+            M[i, j] = v
+        return M
+
+    def a_listas(self):
+        cero = Fraccion(0)
+        filas = []
+        for fila in self.filas:
+            densa = [cero] * self.n_columnas
+            for j, v in fila.items():
+                densa[j] = v
+            filas.append(densa)
+        return filas
+
+    @property
+    def no_nulos(self):
+        return sum(len(fila) for fila in self.filas)
+
+    def densidad(self):
+        total = len(self.filas) * self.n_columnas
+        return self.no_nulos / total if total else 0.0
+
+    def __len__(self):
+        return len(self.filas)
+
+    def __getitem__(self, clave):
+        """M[i, j] → Fraccion; M[i] → fila i densa (lista de Fraccion)."""
+        if isinstance(clave, tuple):
+            i, j = clave
+            return self.filas[i].get(j, Fraccion(0))
+        densa = [Fraccion(0)] * self.n_columnas
+        for j, v in self.filas[clave].items():
+            densa[j] = v
+        return densa
+
+    def __iter__(self):
+        for i in range(len(self.filas)):
+            yield self[i]
+
+    def __setitem__(self, clave, valor):
+        i, j = clave
+        valor = valor if isinstance(valor, Fraccion) else Fraccion(valor)
+        if valor.es_cero():
+            self.filas[i].pop(j, None)
+        else:
+            self.filas[i][j] = valor
+
+    def multiplicar_vector(self, x):
+        cero = Fraccion(0)
+        return [sum((v * x[j] for j, v in fila.items()), cero) for fila in self.filas]
+
+
+def resolver_disperso(A, b, registro=None):
+    """
+    Resuelve A x = b (A cuadrada e invertible) con eliminación dispersa exacta.
+
+    En cada paso se toma la columna activa con menos entradas y, dentro de
+    ella, la fila con menor costo de Markowitz (r - 1)·(c - 1), donde r y c
+    son las entradas no nulas de la fila y de la columna. Devuelve
+    (solución: list[Fraccion], pasos: list[str]).
+    """
+    if not isinstance(A, MatrizDispersa):
+        A = MatrizDispersa.desde_listas(A)
+    n = len(A.filas)
+    if A.n_columnas != n:
+        raise ValueError("La matriz debe ser cuadrada")
+    if len(b) != n:
+        raise ValueError("El vector b debe tener tantas entradas como filas tiene A")
+
+    reg = _como_registro(registro)
+    nnz_inicial = A.no_nulos
+    reg.agregar(f"Eliminación dispersa {n}×{n} con orden de Markowitz ({nnz_inicial} entradas no nulas)")
+
+    # Copias de trabajo: filas activas y, por columna, las filas activas que la usan
+    filas = {i: dict(fila) for i, fila in enumerate(A.filas)}
+    rhs = [x if isinstance(x, Fraccion) else Fraccion(x) for x in b]
+    columnas = {j: set() for j in range(n)}
+    for i, fila in filas.items():
+        for j in fila:
+            columnas[j].add(i)
+    monticulo = [(len(filas_j), j) for j, filas_j in columnas.items()]
+    heapq.heapify(monticulo)
+
+    orden = []      # (fila, columna, fila pivote) en orden de eliminación
+    relleno = 0
+    while monticulo:
+        cuenta, c = heapq.heappop(monticulo)
+        if c not in columnas or cuenta != len(columnas[c]):
+            continue  # entrada vieja del montículo
+        if cuenta == 0:
+            raise ValueError("La matriz es singular: el sistema no tiene solución única")
+
+        r = min(columnas[c], key=lambda i: (len(filas[i]), i))
+        fila_p = filas.pop(r)
+        pivote = fila_p[c]
+        if reg.detalle:
+            costo = (len(fila_p) - 1) * (cuenta - 1)
+            reg.agregar(f"Pivote A[{r + 1},{c + 1}] = {pivote} (costo de Markowitz {costo})")
+
+        for j in fila_p:
+            columnas[j].discard(r)
+        tocadas = set()
+        for i in list(columnas[c]):
+            fila_i = filas[i]
+            factor = fila_i.pop(c) / pivote
+            for j, v in fila_p.items():
+                if j == c:
+                    continue
+                nuevo = fila_i.get(j)
+                if nuevo is None:
+                    fila_i[j] = -factor * v
+                    columnas[j].add(i)
+                    relleno += 1
+                else:
+                    nuevo = nuevo - factor * v
+                    if nuevo.es_cero():
+                        del fila_i[j]
+                        columnas[j].discard(i)
+                    else:
+                        fila_i[j] = nuevo
+                tocadas.add(j)
+            rhs[i] = rhs[i] - factor * rhs[r]
+            if reg.detalle:
+                reg.agregar(f"F{i + 1} → F{i + 1} − ({factor})×F{r + 1}")
+        del columnas[c]
+        tocadas.update(fila_p)
+        tocadas.discard(c)
+        for j in tocadas:
+            if j in columnas:
+                heapq.heappush(monticulo, (len(columnas[j]), j))
+        orden.append((r, c, fila_p))
+
+    if len(orden) < n:
+        raise ValueError("La matriz es singular: el sistema no tiene solución única")
+
+    # Sustitución hacia atrás en el orden inverso de eliminación
+    x = [Fraccion(0)] * n
+    for r, c, fila_p in reversed(orden):
+        acc = rhs[r]
+        for j, v in fila_p.items():
+            if j != c:
+                acc = acc - v * x[j]
+        x[c] = acc / fila_p[c]
+
+    reg.agregar(f"Relleno (entradas nuevas): {relleno}")
+    if reg.detalle:
+        for j, v in enumerate(x):
+            reg.agregar(f"x{j + 1} = {v}")
+    return x, reg.pasos
@@ -0,0 +1,216 @@
+"""
+Modo flotante: las mismas operaciones de matrices.py en float64 con NumPy.
+
+Las matrices se convierten a arreglos de NumPy y la eliminación trabaja por
+columnas completas (operaciones de fila vectorizadas) con pivoteo parcial.
+Los resultados se devuelven como listas de float con la forma de siempre,
+(resultado, pasos), y los pasos siguen la política de RegistroPasos: en modo
+"completo" se explica cada pivote, no cada entrada.
+"""
+import numpy as np
+
+from matrices import _como_registro, formatear_matriz
+
+try:
+    from scipy.linalg import lu_factor, lu_solve
+except ImportError:  # se usa la factorización de factorizar_lu
+    lu_factor = lu_solve = None
+
+# Un pivote con |p| <= TOLERANCIA · max|A| se considera cero
+TOLERANCIA = 1e-12
+
+
+def a_arreglo(A):
+    """Convierte una matriz (Fraccion, int, float, MatrizRacional o arreglo) a un arreglo float64 nuevo."""
+    if isinstance(A, np.ndarray):
+        return A.astype(np.float64)
+    a_flotante = getattr(A, "a_flotante", None)
+    if a_flotante is not None:
+        return a_flotante()
+    return np.array([[float(x) for x in fila] for fila in A], dtype=np.float64)
+
+
+def _tolerancia(M):
+    return TOLERANCIA * max(1.0, float(np.abs(M).max(initial=0.0)))
+
+
+def sumar(A, B, registro=None):
+    reg = _como_registro(registro)
+    C = a_arreglo(A) + a_arreglo(B)
+    resultado = C.tolist()
+    if reg.activo:
+        reg.agregar("Suma de matrices (flotante):")
+        reg.agregar("Resultado:")
+        reg.agregar(formatear_matriz(resultado))
+    return resultado, reg.pasos
+
+
+def multiplicar(A, B, registro=None):
+    reg = _como_registro(registro)
+    C = a_arreglo(A) @ a_arreglo(B)
+    resultado = C.tolist()
+    if reg.activo:
+        reg.agregar(f"Multiplicación de matrices (flotante): ({len(A)}×{len(A[0])})·({len(B)}×{len(B[0])})")
+        reg.agregar("Resultado:")
+        reg.agregar(formatear_matriz(resultado))
+    return resultado, reg.pasos
+
+
+def eliminar(M, hasta_columna=None, reducir=False, reg=None):
+    """
+    Eliminación con pivoteo parcial sobre M (float64, se modifica en el lugar).
+
+    hasta_columna: columnas donde se buscan pivotes (por defecto todas).
+    reducir: si es True hace Gauss-Jordan (unos en los pivotes y ceros
+             arriba y abajo); si no, solo ceros debajo (forma escalonada).
+    Devuelve (pivotes, signo): lista de (fila, columna) y ±1 según los
+    intercambios.
+    """
+    m, n = M.shape
+    hasta_columna = n if hasta_columna is None else hasta_columna
+    tol = _tolerancia(M[:, :hasta_columna])
+    detalle = reg is not None and reg.detalle
+    pivotes = []
+    signo = 1
+    fila = 0
+    for col in range(hasta_columna):
+        if fila == m:
+            break
+        p = fila + int(np.argmax(np.abs(M[fila:, col])))
+        if abs(M[p, col]) <= tol:
+            M[fila:, col] = 0.0
+            if detalle:
+                reg.agregar(f"Columna {col + 1} sin pivote → se omite")
+            continue
+        if p != fila:
+            M[[fila, p]] = M[[p, fila]]
+            signo = -signo
+            if detalle:
+                reg.agregar(f"Intercambio fila {fila + 1} con fila {p + 1} (pivoteo parcial)")
+        pivote = M[fila, col]
+        if detalle:
+            reg.agregar(f"Pivote M[{fila + 1},{col + 1}] = {pivote:.6g}")
+
+        if reducir:
+            M[fila, col:] /= pivote
+            otras = np.arange(m) != fila
+            M[otras, col:] -= np.outer(M[otras, col], M[fila, col:])
+        else:
+            factores = M[fila + 1:, col] / pivote
+            M[fila + 1:, col:] -= np.outer(factores, M[fila, col:])
+        pivotes.append((fila, col))
+        fila += 1
+    return pivotes, signo
+
+
+def determinante(A, registro=None):
+    reg = _como_registro(registro)
+    n = len(A)
+    reg.agregar(f"Cálculo del determinante de matriz {n}×{n} (flotante, pivoteo parcial)")
+    M = a_arreglo(A)
+    pivotes, signo = eliminar(M, reg=reg)
+    if len(pivotes) < n:
+        det = 0.0
+        reg.agregar("Columna sin pivote → det = 0")
+    else:
+        det = signo * float(np.prod(np.diagonal(M)))
+        if reg.detalle:
+            reg.agregar(f"det = ({'+' if signo > 0 else '-'}1) × producto de la diagonal de U")
+    reg.agregar(f"Determinante final: {det}")
+    return det, reg.pasos
+
+
+def rango(A, registro=None):
+    reg = _como_registro(registro)
+    reg.agregar(f"Cálculo del rango de matriz {len(A)}×{len(A[0]) if A else 0} (flotante)")
+    M = a_arreglo(A)
+    pivotes, _ = eliminar(M, reg=reg)
+    reg.agregar(f"Rango = número de pivotes = {len(pivotes)}")
+    return len(pivotes), reg.pasos
+
+
+def inversa(A, registro=None):
+    reg = _como_registro(registro)
+    n = len(A)
+    reg.agregar(f"Cálculo de inversa de matriz {n}×{n} (flotante, Gauss-Jordan con pivoteo parcial)")
+    M = np.hstack([a_arreglo(A), np.eye(n)])
+    pivotes, _ = eliminar(M, hasta_columna=n, reducir=True, reg=reg)
+    if len(pivotes) < n:
+        raise ValueError("Matriz no es invertible (determinante = 0)")
+    resultado = M[:, n:].tolist()
+    if reg.activo:
+        reg.agregar("Matriz inversa encontrada:")
+        reg.agregar(formatear_matriz(resultado))
+    return resultado, reg.pasos
+
+
+# Columnas por bloque de factorizar_lu sin SciPy
+BLOQUE_LU = 32
+
+
+def factorizar_lu(A):
+    """
+    PA = LU con pivoteo parcial (scipy.linalg si está instalado). Devuelve
+    resolver(b), que calcula A⁻¹b en O(n²) con sustitución hacia adelante y
+    hacia atrás, o None si algún pivote es <= TOLERANCIA · max|A|.
+    """
+    M = a_arreglo(A)
+    tol = _tolerancia(M)
+    if lu_factor is not None:
+        lu, piv = lu_factor(M, check_finite=False)
+        if not (np.abs(np.diagonal(lu)) > tol).all():
+            return None
+        return lambda b: lu_solve((lu, piv), np.asarray(b, dtype=np.float64), check_finite=False)
+
+    # L (sin la diagonal de unos) y U quedan juntas en M. Por bloques de
+    # columnas: el panel se factoriza columna a columna en una copia contigua
+    # y el resto de la matriz se actualiza con un solo producto de matrices
+    n = M.shape[0]
+    perm = np.arange(n)
+    bloques = []
+    for i in range(0, n, BLOQUE_LU):
+        j = min(i + BLOQUE_LU, n)
+        panel = M[i:, i:j].copy()
+        orden = np.arange(n - i)
+        for k in range(j - i):
+            p = k + int(np.argmax(np.abs(panel[k:, k])))
+            if not abs(panel[p, k]) > tol:
+                return None
+            if p != k:
+                panel[[k, p]] = panel[[p, k]]
+                orden[[k, p]] = orden[[p, k]]
+            panel[k + 1:, k] /= panel[k, k]
+            panel[k + 1:, k + 1:] -= np.outer(panel[k + 1:, k], panel[k, k + 1:])
+        M[i:] = M[i:][orden]
+        M[i:, i:j] = panel
+        perm[i:] = perm[i:][orden]
+        D = M[i:j, i:j]
+        inv_L = np.linalg.inv(np.tril(D, -1) + np.eye(j - i))
+        if j < n:
+            M[i:j, j:] = inv_L @ M[i:j, j:]
+            M[j:, j:] -= M[j:, i:j] @ M[i:j, j:]
+        bloques.append((i, j, inv_L, np.linalg.inv(np.triu(D))))
+
+    # Las sustituciones van por los mismos bloques: los diagonales ya están
+    # invertidos (son chicos y triangulares), el resto son productos matriz·vector
+    def resolver(b):
+        x = np.asarray(b, dtype=np.float64)[perm]
+        for i, j, inv_L, _ in bloques:
+            x[i:j] = inv_L @ (x[i:j] - M[i:j, :i] @ x[:i])
+        for i, j, _, inv_U in reversed(bloques):
+            x[i:j] = inv_U @ (x[i:j] - M[i:j, j:] @ x[j:])
+        return x
+    return resolver
+
+
+def gauss_jordan(M_aumentada, registro=None):
+    """Forma escalonada reducida de una matriz aumentada [A|b] en float64."""
+    reg = _como_registro(registro)
+    M = a_arreglo(M_aumentada)
+    reg.agregar(f"Gauss-Jordan (flotante) sobre matriz {M.shape[0]}×{M.shape[1]}")
+    eliminar(M, hasta_columna=M.shape[1] - 1, reducir=True, reg=reg)
+    resultado = M.tolist()
+    if reg.activo:
+        reg.agregar("Forma escalonada reducida:")
+        reg.agregar(formatear_matriz(resultado))
+    return resultado, reg.pasos
@@ -1,7 +1,50 @@
 import math
+import numbers
+import operator
+import os
+import sys
+
+try:
+    import gmpy2
+except ImportError:  # gmpy2 es opcional
+    gmpy2 = None
+
+# Caché de valores pequeños (0, ±1, enteros y fracciones chicas).
+# Las fracciones son inmutables, así que se pueden compartir sin riesgo.
+# _tabla[den][num + CACHE_LIMITE_VALOR] es la fracción num/den (o None): una
+# fila por denominador, creada al primer uso; indexar es más barato que armar
+# una clave (num, den) y buscarla en un dict.
+CACHE_LIMITE_VALOR = 256      # |numerador| y denominador hasta este valor
+CACHE_MAX_ENTRADAS = 4096     # tamaño máximo de la caché
+_tabla = [None] * (CACHE_LIMITE_VALOR + 1)
+_entradas = 0
+# Los contadores solo se llevan con contar_cache(True): cuestan en cada operación
+_cache_stats = {"hits": 0, "misses": 0}
+
+# Backend de la aritmética: "python" (int + math.gcd, el predeterminado) o
+# "gmpy2" (gmpy2.mpq: suma, producto y reducción en GMP, en una llamada a C).
+# "auto" elige gmpy2 si está instalado. Se elige con usar_backend() o con la
+# variable de entorno FRACCION_BACKEND.
+BACKENDS = ("auto", "python", "gmpy2")
+_backend = "python"
+_gcd = math.gcd
+
+# Mismas constantes que usa fractions.Fraction para el hash
+_HASH_MODULO = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+
 class Fraccion:
-    def __init__(self, numerador, denominador=1):
-        if isinstance(numerador, str):
+    __slots__ = ("_num", "_den")
+
+    def __new__(cls, numerador, denominador=1):
+        if type(numerador) is int and type(denominador) is int:
+            # Caso más común (enteros de la entrada): sin más conversiones
+            if denominador == 1:
+                return _crear(numerador, 1)
+            num = numerador
+            den = denominador
+        elif isinstance(numerador, str):
             if '/' in numerador:
                 parts = numerador.split('/')
                 if len(parts) == 2:
@@ -12,6 +55,13 @@ class Fraccion:
             else:
                 num = int(numerador)
                 den = denominador
+        elif isinstance(numerador, int):
+            num = numerador
+            den = denominador
+        elif isinstance(numerador, numbers.Rational):
+            # Fraccion, fractions.Fraction, ...
+            num = numerador.numerator
+            den = numerador.denominator * denominador
         else:
             num = numerador
             den = denominador
@@ -20,89 +70,696 @@ class Fraccion:
             raise ZeroDivisionError("Denominador no puede ser cero")
 
         # Simplificar
-        gcd_val = math.gcd(abs(num), abs(den))
-        self.numerador = num // gcd_val
-        self.denominador = den // gcd_val
+        gcd_val = _gcd(num, den)
+        if gcd_val != 1:
+            num = num // gcd_val
+            den = den // gcd_val
 
         # Asegurar que el denominador sea positivo
-        if self.denominador < 0:
-            self.numerador = -self.numerador
-            self.denominador = -self.denominador
+        if den < 0:
+            num = -num
+            den = -den
+
+        if den <= CACHE_LIMITE_VALOR and -CACHE_LIMITE_VALOR <= num <= CACHE_LIMITE_VALOR:
+            return _crear(num, den)
+        f = _nuevo(Fraccion)
+        _poner_num(f, num)
+        _poner_den(f, den)
+        return f
+
+    @property
+    def numerador(self):
+        return self._num
+
+    @property
+    def denominador(self):
+        return self._den
+
+    # Nombres de numbers.Rational
+    numerator = numerador
+    denominator = denominador
+
+    def __setattr__(self, nombre, valor):
+        # Inmutable: los valores chicos se comparten desde la caché
+        raise AttributeError(f"Fraccion es inmutable: no se puede asignar '{nombre}'")
+
+    def __delattr__(self, nombre):
+        raise AttributeError(f"Fraccion es inmutable: no se puede borrar '{nombre}'")
+
+    def __reduce__(self):
+        return (Fraccion, (int(self.numerador), int(self.denominador)))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __add__(self, other):
+        na, da = self._num, self._den
         if isinstance(other, int):
-            other = Fraccion(other)
-        num = self.numerador * other.denominador + other.numerador * self.denominador
-        den = self.denominador * other.denominador
-        return Fraccion(num, den)
+            # n/d + k = (n + k·d)/d, que sigue reducida
+            return _crear(na + other * da, da)
+        if not isinstance(other, Fraccion):
+            if isinstance(other, (float, complex)):
+                return float(self) + other
+            other = _convertir(other)
+            if other is None:
+                return NotImplemented
+        nb, db = other._num, other._den
+        if da == db:
+            if da == 1:
+                return _crear(na + nb, 1)
+            num = na + nb
+            g = _gcd(num, da)
+            return _crear(num // g, da // g)
+        g = _gcd(da, db)
+        if g == 1:
+            return _crear(na * db + da * nb, da * db)
+        s = da // g
+        t = na * (db // g) + nb * s
+        g2 = _gcd(t, g)
+        if g2 == 1:
+            return _crear(t, s * db)
+        return _crear(t // g2, s * (db // g2))
+
+    def __radd__(self, other):
+        return self.__add__(other)
 
     def __sub__(self, other):
         if isinstance(other, int):
-            other = Fraccion(other)
-        num = self.numerador * other.denominador - other.numerador * self.denominador
-        den = self.denominador * other.denominador
-        return Fraccion(num, den)
+            return _crear(self._num - other * self._den, self._den)
+        if not isinstance(other, Fraccion):
+            if isinstance(other, (float, complex)):
+                return float(self) - other
+            other = _convertir(other)
+            if other is None:
+                return NotImplemented
+        return self + _crear(-other._num, other._den)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
 
     def __mul__(self, other):
+        na, da = self._num, self._den
         if isinstance(other, int):
-            other = Fraccion(other)
-        num = self.numerador * other.numerador
-        den = self.denominador * other.denominador
-        return Fraccion(num, den)
+            if da == 1:
+                return _crear(na * other, 1)
+            g = _gcd(other, da)
+            return _crear(na * (other // g), da // g)
+        if not isinstance(other, Fraccion):
+            if isinstance(other, (float, complex)):
+                return float(self) * other
+            other = _convertir(other)
+            if other is None:
+                return NotImplemented
+        nb, db = other._num, other._den
+        if da == 1 and db == 1:
+            return _crear(na * nb, 1)
+        g1 = _gcd(na, db)
+        if g1 > 1:
+            na //= g1
+            db //= g1
+        g2 = _gcd(nb, da)
+        if g2 > 1:
+            nb //= g2
+            da //= g2
+        return _crear(na * nb, da * db)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
 
     def __truediv__(self, other):
         if isinstance(other, int):
-            other = Fraccion(other)
-        if other.numerador == 0:
+            if other == 0:
+                raise ZeroDivisionError("División por cero")
+            other = _crear(other, 1)
+        elif not isinstance(other, Fraccion):
+            if isinstance(other, (float, complex)):
+                return float(self) / other
+            other = _convertir(other)
+            if other is None:
+                return NotImplemented
+        if other._num == 0:
             raise ZeroDivisionError("División por cero")
-        num = self.numerador * other.denominador
-        den = self.denominador * other.numerador
-        return Fraccion(num, den)
+        return self * other.reciproco()
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (float, complex)):
+            return other / float(self)
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return other / self
+
+    def __pow__(self, exponente):
+        if isinstance(exponente, numbers.Rational) and exponente.denominator == 1:
+            exponente = int(exponente.numerator)
+        if isinstance(exponente, int):
+            if exponente >= 0:
+                return _crear(self._num ** exponente, self._den ** exponente)
+            return self.reciproco() ** -exponente
+        return float(self) ** exponente
+
+    def __rpow__(self, base):
+        # base ** self: exacto si el exponente es entero y la base racional
+        if self.denominador == 1:
+            base_racional = _convertir(base)
+            if base_racional is not None:
+                return base_racional ** int(self.numerador)
+        return base ** float(self)
+
+    # ---------- división entera y resto (como fractions.Fraction) ----------
+
+    def __floordiv__(self, other):
+        if isinstance(other, float):
+            return float(self) // other
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return int((self.numerador * other.denominador) // (self.denominador * other.numerador))
+
+    def __rfloordiv__(self, other):
+        if isinstance(other, float):
+            return other // float(self)
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return other // self
+
+    def __mod__(self, other):
+        if isinstance(other, float):
+            return float(self) % other
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        na, da, nb, db = self.numerador, self.denominador, other.numerador, other.denominador
+        return Fraccion((na * db) % (nb * da), da * db)
+
+    def __rmod__(self, other):
+        if isinstance(other, float):
+            return other % float(self)
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return other % self
+
+    def __divmod__(self, other):
+        if isinstance(other, float):
+            return divmod(float(self), other)
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return self // other, self % other
+
+    def __rdivmod__(self, other):
+        if isinstance(other, float):
+            return divmod(other, float(self))
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return divmod(other, self)
 
     def __eq__(self, other):
         if isinstance(other, int):
-            other = Fraccion(other)
-        return (self.numerador * other.denominador ==
-                other.numerador * self.denominador)
+            return self._den == 1 and self._num == other
+        if not isinstance(other, Fraccion):
+            if isinstance(other, float):
+                if math.isnan(other) or math.isinf(other):
+                    return False
+                other = Fraccion(*other.as_integer_ratio())
+            else:
+                other = _convertir(other)
+                if other is None:
+                    return NotImplemented
+        return self._num == other._num and self._den == other._den
 
-    def __lt__(self, other):
+    def __hash__(self):
+        # Mismo algoritmo que fractions.Fraction: hash(Fraccion(1, 2)) == hash(0.5)
+        if self._den == 1:
+            return hash(self._num)
+        try:
+            dinv = pow(int(self._den), -1, _HASH_MODULO)
+        except ValueError:
+            hash_ = _HASH_INF
+        else:
+            hash_ = hash(hash(abs(int(self._num))) * dinv)
+        resultado = hash_ if self._num >= 0 else -hash_
+        return -2 if resultado == -1 else resultado
+
+    def _comparar(self, other, op):
+        """Compara self con other usando op sobre los productos cruzados."""
         if isinstance(other, int):
-            other = Fraccion(other)
-        return (self.numerador * other.denominador <
-                other.numerador * self.denominador)
+            return op(self._num, other * self._den)
+        if not isinstance(other, Fraccion):
+            if isinstance(other, float):
+                if math.isnan(other) or math.isinf(other):
+                    return op(0.0, other)
+                other = Fraccion(*other.as_integer_ratio())
+            else:
+                other = _convertir(other)
+                if other is None:
+                    return NotImplemented
+        return op(self._num * other._den, other._num * self._den)
+
+    def __lt__(self, other):
+        return self._comparar(other, operator.lt)
 
     def __le__(self, other):
-        if isinstance(other, int):
-            other = Fraccion(other)
-        return (self.numerador * other.denominador <=
-                other.numerador * self.denominador)
+        return self._comparar(other, operator.le)
 
     def __gt__(self, other):
-        return not self.__le__(other)
+        return self._comparar(other, operator.gt)
 
     def __ge__(self, other):
-        return not self.__lt__(other)
+        return self._comparar(other, operator.ge)
 
     def __neg__(self):
-        return Fraccion(-self.numerador, self.denominador)
+        return _crear(-self._num, self._den)
 
     def __abs__(self):
-        return Fraccion(abs(self.numerador), self.denominador)
+        return _crear(abs(self._num), self._den)
+
+    def __pos__(self):
+        return self
+
+    def __bool__(self):
+        return self._num != 0
 
     def __float__(self):
-        return self.numerador / self.denominador
+        return int(self._num) / int(self._den)
+
+    def __int__(self):
+        # Trunca hacia cero, como int(Fraction)
+        if self._num < 0:
+            return -int(-self._num // self._den)
+        return int(self._num // self._den)
+
+    __trunc__ = __int__
+
+    def __floor__(self):
+        return int(self.numerador // self.denominador)
+
+    def __ceil__(self):
+        return -int(-self.numerador // self.denominador)
+
+    def __round__(self, ndigits=None):
+        """Redondeo al par más cercano, como round(Fraction)."""
+        if ndigits is None:
+            num, den = self.numerador, self.denominador
+            piso, resto = divmod(num, den)
+            doble = 2 * resto
+            if doble < den or (doble == den and piso % 2 == 0):
+                return int(piso)
+            return int(piso) + 1
+        escala = 10 ** abs(ndigits)
+        if ndigits > 0:
+            return Fraccion(round(self * escala), escala)
+        return Fraccion(round(self / escala) * escala)
+
+    def __complex__(self):
+        return complex(float(self))
+
+    @property
+    def real(self):
+        return self
+
+    @property
+    def imag(self):
+        return 0
+
+    def conjugate(self):
+        return self
 
     def __str__(self):
-        if self.denominador == 1:
-            return str(self.numerador)
+        if self._den == 1:
+            return str(self._num)
         else:
-            return f"{self.numerador}/{self.denominador}"
+            return f"{self._num}/{self._den}"
 
     def __repr__(self):
-        return f"Fraccion({self.numerador}, {self.denominador})"
+        return f"Fraccion({self._num}, {self._den})"
 
     def es_cero(self):
-        return self.numerador == 0
+        return self._num == 0
 
     def reciproco(self):
-        return Fraccion(self.denominador, self.numerador)
\ No newline at end of file
+        num, den = self._num, self._den
+        if num == 0:
+            raise ZeroDivisionError("Denominador no puede ser cero")
+        if num < 0:
+            return _crear(-den, -num)
+        return _crear(den, num)
+
+
+numbers.Rational.register(Fraccion)
+
+# Fraccion prohíbe asignar atributos, así que _crear escribe los slots con
+# sus descriptores (casi tan barato como una asignación normal)
+_nuevo = object.__new__
+_poner_num = Fraccion._num.__set__
+_poner_den = Fraccion._den.__set__
+
+
+def _convertir(x):
+    """Convierte un racional (int, Fraction, ...) a Fraccion; None si no lo es."""
+    if isinstance(x, Fraccion):
+        return x
+    if isinstance(x, int):
+        return Fraccion(x)
+    if isinstance(x, numbers.Rational):
+        return Fraccion(x.numerator, x.denominator)
+    return None
+
+
+def _crear_rapido(num, den):
+    """
+    Constructor interno: confía en que num/den ya está reducida y den > 0,
+    así que no vuelve a calcular el gcd.
+    """
+    if den <= CACHE_LIMITE_VALOR and -CACHE_LIMITE_VALOR <= num <= CACHE_LIMITE_VALOR:
+        fila = _tabla[den]
+        if fila is not None:
+            f = fila[num + CACHE_LIMITE_VALOR]
+            if f is not None:
+                return f
+        return _internar(num, den)
+
+    f = _nuevo(Fraccion)
+    _poner_num(f, num)
+    _poner_den(f, den)
+    return f
+
+
+def _internar(num, den):
+    """Crea num/den y la guarda en la caché si todavía hay lugar."""
+    global _entradas
+    f = _nuevo(Fraccion)
+    _poner_num(f, num)
+    _poner_den(f, den)
+    if _entradas < CACHE_MAX_ENTRADAS:
+        fila = _tabla[den]
+        if fila is None:
+            fila = _tabla[den] = [None] * (2 * CACHE_LIMITE_VALOR + 1)
+        fila[num + CACHE_LIMITE_VALOR] = f
+        _entradas += 1
+    return f
+
+
+def _crear_contando(num, den):
+    """_crear_rapido llevando los contadores de hits/misses de la caché."""
+    if den <= CACHE_LIMITE_VALOR and -CACHE_LIMITE_VALOR <= num <= CACHE_LIMITE_VALOR:
+        fila = _tabla[den]
+        if fila is not None and fila[num + CACHE_LIMITE_VALOR] is not None:
+            _cache_stats["hits"] += 1
+        else:
+            _cache_stats["misses"] += 1
+    return _crear_rapido(num, den)
+
+
+_crear = _crear_rapido
+
+
+def contar_cache(activo=True):
+    """
+    Activa o desactiva los contadores de hits/misses de info_cache. Sirven
+    para depurar: con los contadores activos cada operación es más lenta.
+    """
+    global _crear
+    _crear = _crear_contando if activo else _crear_rapido
+
+
+def info_cache():
+    """Devuelve estadísticas de la caché de fracciones pequeñas."""
+    return {
+        "entradas": _entradas,
+        "max_entradas": CACHE_MAX_ENTRADAS,
+        "contando": _crear is _crear_contando,
+        "hits": _cache_stats["hits"],
+        "misses": _cache_stats["misses"],
+    }
+
+
+def limpiar_cache():
+    """Vacía la caché y reinicia los contadores."""
+    global _entradas
+    _tabla[:] = [None] * (CACHE_LIMITE_VALOR + 1)
+    _entradas = 0
+    _cache_stats["hits"] = 0
+    _cache_stats["misses"] = 0
+
+
+# ---------- backend "mpq" ----------
+
+class _MetodosMPQ:
+    """
+    Métodos de Fraccion para el backend "mpq": _num guarda un gmpy2.mpq ya
+    reducido y _den no se usa. usar_backend("mpq") los instala en Fraccion;
+    el resto de los métodos pasa por numerador/denominador y sirve igual.
+    """
+
+    def __new__(cls, numerador, denominador=1):
+        if type(numerador) is int and type(denominador) is int:
+            num = numerador
+            den = denominador
+        elif isinstance(numerador, str):
+            if '/' in numerador:
+                parts = numerador.split('/')
+                if len(parts) != 2:
+                    raise ValueError("Formato de fracción inválido")
+                num = int(parts[0])
+                den = int(parts[1])
+            else:
+                num = int(numerador)
+                den = denominador
+        elif isinstance(numerador, Fraccion):
+            num = numerador._num
+            den = denominador
+        elif isinstance(numerador, numbers.Rational):
+            num = numerador.numerator
+            den = numerador.denominator * denominador
+        else:
+            raise TypeError(f"Fraccion necesita un número racional, no {type(numerador).__name__}")
+        if den == 0:
+            raise ZeroDivisionError("Denominador no puede ser cero")
+        f = _nuevo(Fraccion)
+        _poner_num(f, _mpq(num, den))
+        return f
+
+    @property
+    def numerador(self):
+        return self._num.numerator
+
+    @property
+    def denominador(self):
+        return self._num.denominator
+
+    numerator = numerador
+    denominator = denominador
+
+    def __add__(self, other):
+        if isinstance(other, Fraccion):
+            q = self._num + other._num
+        elif isinstance(other, int):
+            q = self._num + other
+        elif isinstance(other, (float, complex)):
+            return float(self) + other
+        else:
+            other = _convertir(other)
+            if other is None:
+                return NotImplemented
+            q = self._num + other._num
+        f = _nuevo(Fraccion)
+        _poner_num(f, q)
+        return f
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Fraccion):
+            q = self._num - other._num
+        elif isinstance(other, int):
+            q = self._num - other
+        elif isinstance(other, (float, complex)):
+            return float(self) - other
+        else:
+            other = _convertir(other)
+            if other is None:
+                return NotImplemented
+            q = self._num - other._num
+        f = _nuevo(Fraccion)
+        _poner_num(f, q)
+        return f
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        if isinstance(other, Fraccion):
+            q = self._num * other._num
+        elif isinstance(other, int):
+            q = self._num * other
+        elif isinstance(other, (float, complex)):
+            return float(self) * other
+        else:
+            other = _convertir(other)
+            if other is None:
+                return NotImplemented
+            q = self._num * other._num
+        f = _nuevo(Fraccion)
+        _poner_num(f, q)
+        return f
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Fraccion):
+            divisor = other._num
+        elif isinstance(other, int):
+            divisor = other
+        elif isinstance(other, (float, complex)):
+            return float(self) / other
+        else:
+            other = _convertir(other)
+            if other is None:
+                return NotImplemented
+            divisor = other._num
+        if not divisor:
+            raise ZeroDivisionError("División por cero")
+        f = _nuevo(Fraccion)
+        _poner_num(f, self._num / divisor)
+        return f
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (float, complex)):
+            return other / float(self)
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return other / self
+
+    def __pow__(self, exponente):
+        if isinstance(exponente, numbers.Rational) and exponente.denominator == 1:
+            exponente = int(exponente.numerator)
+        if isinstance(exponente, int):
+            if exponente < 0 and not self._num:
+                raise ZeroDivisionError("Denominador no puede ser cero")
+            f = _nuevo(Fraccion)
+            _poner_num(f, self._num ** exponente)
+            return f
+        return float(self) ** exponente
+
+    def __eq__(self, other):
+        if isinstance(other, Fraccion):
+            return self._num == other._num
+        if isinstance(other, int):
+            return self._num == other
+        if isinstance(other, float):
+            if math.isnan(other) or math.isinf(other):
+                return False
+            return self._num == _mpq(*other.as_integer_ratio())
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return self._num == other._num
+
+    def __hash__(self):
+        # gmpy2 usa el mismo hash que fractions.Fraction
+        return hash(self._num)
+
+    def _comparar(self, other, op):
+        if isinstance(other, Fraccion):
+            return op(self._num, other._num)
+        if isinstance(other, int):
+            return op(self._num, other)
+        if isinstance(other, float):
+            if math.isnan(other) or math.isinf(other):
+                return op(0.0, other)
+            return op(self._num, _mpq(*other.as_integer_ratio()))
+        other = _convertir(other)
+        if other is None:
+            return NotImplemented
+        return op(self._num, other._num)
+
+    def __neg__(self):
+        f = _nuevo(Fraccion)
+        _poner_num(f, -self._num)
+        return f
+
+    def __abs__(self):
+        f = _nuevo(Fraccion)
+        _poner_num(f, abs(self._num))
+        return f
+
+    def __bool__(self):
+        return bool(self._num)
+
+    def __float__(self):
+        return float(self._num)
+
+    def __int__(self):
+        return int(self._num)
+
+    __trunc__ = __int__
+
+    def __str__(self):
+        q = self._num
+        if q.denominator == 1:
+            return str(q.numerator)
+        return f"{q.numerator}/{q.denominator}"
+
+    def __repr__(self):
+        return f"Fraccion({self._num.numerator}, {self._num.denominator})"
+
+    def es_cero(self):
+        return not self._num
+
+    def reciproco(self):
+        if not self._num:
+            raise ZeroDivisionError("Denominador no puede ser cero")
+        f = _nuevo(Fraccion)
+        _poner_num(f, 1 / self._num)
+        return f
+
+
+# Métodos que cambian con el backend "mpq"
+_METODOS_BACKEND = (
+    "__new__", "numerador", "denominador", "numerator", "denominator",
+    "__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__", "__truediv__", "__rtruediv__",
+    "__pow__", "__eq__", "__hash__", "_comparar", "__neg__", "__abs__", "__bool__",
+    "__float__", "__int__", "__trunc__", "__str__", "__repr__", "es_cero", "reciproco",
+)
+_METODOS_PYTHON = {nombre: vars(Fraccion)[nombre] for nombre in _METODOS_BACKEND}
+_METODOS_MPQ = {nombre: vars(_MetodosMPQ)[nombre] for nombre in _METODOS_BACKEND}
+_mpq = gmpy2.mpq if gmpy2 is not None else None
+
+
+def usar_backend(nombre="auto"):
+    """
+    Selecciona el backend de Fraccion: "python" o "gmpy2" (gmpy2.mpq).
+    "auto" usa gmpy2 si está instalado y si no, enteros de Python.
+    Las fracciones creadas con el backend anterior no se deben seguir
+    usando: conviene elegirlo al empezar. Devuelve el nombre del backend activo.
+    """
+    global _backend
+    if nombre not in BACKENDS:
+        raise ValueError(f"Backend desconocido: {nombre}. Opciones: {', '.join(BACKENDS)}")
+    if nombre == "auto":
+        nombre = "gmpy2" if gmpy2 is not None else "python"
+    if nombre == "gmpy2" and gmpy2 is None:
+        raise ValueError("El backend 'gmpy2' no está disponible (instale gmpy2)")
+    metodos = _METODOS_MPQ if nombre == "gmpy2" else _METODOS_PYTHON
+    for nombre_metodo, metodo in metodos.items():
+        setattr(Fraccion, nombre_metodo, metodo)
+    _backend = nombre
+    # Las fracciones cacheadas se crearon con el backend anterior
+    limpiar_cache()
+    return _backend
+
+
+def backend_actual():
+    """Nombre del backend de enteros en uso."""
+    return _backend
+
+
+usar_backend(os.environ.get("FRACCION_BACKEND", "python"))
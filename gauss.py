@@ -1,52 +1,319 @@
-from fraccion import Fraccion 
+import math
+from collections import OrderedDict
+
+from fraccion import Fraccion
 
 
 class PasoGauss:
-    def __init__(self, matriz, descripcion, pivote_row=None, pivote_col=None):
-        self.matriz = [[x for x in fila] for fila in matriz]  # Copia profunda
+    """
+    Un paso del registro de Gauss.
+
+    No guarda la matriz completa: solo las filas que cambiaron en el paso
+    (`cambios`), salvo cada cierto tiempo que guarda una copia completa
+    (`checkpoint`). La matriz del paso se reconstruye bajo demanda.
+    """
+
+    def __init__(self, descripcion, pivote_row=None, pivote_col=None):
         self.descripcion = descripcion
         self.pivote_row = pivote_row
         self.pivote_col = pivote_col
+        self.estado = None       # (fila_actual, col_actual, terminado) del motor
+        self.cambios = ()        # ((fila, valores), ...)
+        self.checkpoint = None   # matriz completa (tupla de tuplas) o None
+        self._log = None
+        self._indice = None
+
+    @property
+    def matriz(self):
+        return self._log.matriz_en(self._indice)
+
+
+class LogPasos:
+    """
+    Lista de PasoGauss codificada por deltas.
+
+    Se guarda un checkpoint completo cada vez que las filas modificadas desde
+    el anterior suman `intervalo_checkpoint`, así que la memoria crece con la
+    cantidad de filas cambiadas y reconstruir cualquier paso cuesta a lo sumo
+    una copia de la matriz más `intervalo_checkpoint` filas.
+    """
+
+    def __init__(self, intervalo_checkpoint):
+        self.intervalo_checkpoint = max(1, intervalo_checkpoint)
+        self._pasos = []
+        self._filas_desde_checkpoint = 0
+
+    def agregar(self, paso, matriz, filas_cambiadas, checkpoint=False):
+        if checkpoint or not self._pasos or self._filas_desde_checkpoint >= self.intervalo_checkpoint:
+            paso.checkpoint = tuple(tuple(fila) for fila in matriz)
+            self._filas_desde_checkpoint = 0
+        else:
+            paso.cambios = tuple((i, tuple(matriz[i])) for i in filas_cambiadas)
+            self._filas_desde_checkpoint += len(paso.cambios)
+        paso._log = self
+        paso._indice = len(self._pasos)
+        self._pasos.append(paso)
+
+    def matriz_en(self, k):
+        """Reconstruye la matriz después del paso k."""
+        if k < 0:
+            k += len(self._pasos)
+        j = k
+        while self._pasos[j].checkpoint is None:
+            j -= 1
+        M = [list(fila) for fila in self._pasos[j].checkpoint]
+        for t in range(j + 1, k + 1):
+            for i, fila in self._pasos[t].cambios:
+                M[i] = list(fila)
+        return M
+
+    def __len__(self):
+        return len(self._pasos)
+
+    def __getitem__(self, k):
+        return self._pasos[k]
+
+    def __iter__(self):
+        return iter(self._pasos)
+
+
+class NavegacionPasos:
+    """
+    Navegación por el registro de pasos: retroceder y saltar a cualquier paso.
+    Cada paso guarda el estado del motor (fila_actual, col_actual, terminado),
+    así que se puede retomar desde ahí; el costo de restaurar está acotado
+    por la distancia al checkpoint más cercano del LogPasos.
+    """
+
+    def _restaurar(self, k):
+        paso = self.log[k]
+        self.matriz_actual = self.log.matriz_en(k)
+        self.fila_actual, self.col_actual, self.terminado = paso.estado
+        self.posicion = k
+
+    def ir_a(self, k):
+        """Lleva el motor al paso k (0 = estado inicial). Si todavía no se calculó, avanza hasta él."""
+        k = max(0, k)
+        if k >= len(self.log):
+            if self.posicion != len(self.log) - 1:
+                self._restaurar(len(self.log) - 1)
+            while k >= len(self.log) and not self.terminado:
+                self.siguiente()
+        k = min(k, len(self.log) - 1)
+        if k != self.posicion:
+            self._restaurar(k)
+        return self.log[k]
+
+    def anterior(self):
+        """Retrocede un paso. Devuelve None si ya está en el estado inicial."""
+        if self.posicion == 0:
+            return None
+        return self.ir_a(self.posicion - 1)
+
+    @property
+    def total_pasos(self):
+        return len(self.log)
+
+
+def _filas_a_enteros(A):
+    """
+    Multiplica cada fila por el mcm de sus denominadores para obtener una
+    matriz de enteros. Devuelve (M_enteros, escalas).
+    """
+    filas_enteras = getattr(A, "filas_enteras", None)
+    if filas_enteras is not None:
+        return filas_enteras()
+    M = []
+    escalas = []
+    for fila in A:
+        d = 1
+        for x in fila:
+            d = math.lcm(d, x.denominador)
+        M.append([int(x.numerador * (d // x.denominador)) for x in fila])
+        escalas.append(int(d))
+    return M, escalas
+
+
+def _reducir(M, hasta_columna, reducida=True):
+    """
+    Eliminación sin registro sobre M (en el lugar), buscando pivotes solo en
+    las columnas < hasta_columna: Gauss-Jordan hasta la forma escalonada
+    reducida o, con reducida=False, solo hacia adelante (como GaussEngine).
+    Devuelve (fila, col, columnas pivote) donde terminó la búsqueda.
+
+    Las matrices en banda angosta, donde casi no hay relleno, se eliminan con
+    Fraccion operando solo sobre las entradas no nulas; el resto sin
+    fracciones (_reducir_enteros). Gauss-Jordan rellena todo lo que está
+    encima de la diagonal, así que ahí solo conviene con matrices tridiagonales.
+    """
+    limite = 2 if reducida else max(2, len(M) // 16)
+    if _banda_angosta(M, hasta_columna, limite):
+        return _reducir_fracciones(M, hasta_columna, reducida)
+    return _reducir_enteros(M, hasta_columna, reducida)
+
+
+def _banda_angosta(M, columnas, limite):
+    """True si p + q <= limite (p, q: diagonales no nulas debajo y encima de la principal)."""
+    p = q = 0
+    for i, fila in enumerate(M):
+        for j in range(columnas):
+            if fila[j]:
+                p = max(p, i - j)
+                break
+        for j in range(columnas - 1, -1, -1):
+            if fila[j]:
+                q = max(q, j - i)
+                break
+        if p + q > limite:
+            return False
+    return True
+
+
+def _reducir_fracciones(M, hasta_columna, reducida):
+    """Eliminación con Fraccion sobre las columnas no nulas de cada fila pivote."""
+    n_filas = len(M)
+    n_cols = len(M[0]) if M else 0
+    fila = col = 0
+    pivotes = []
+    while fila < n_filas and col < hasta_columna:
+        p = fila
+        while p < n_filas and not M[p][col]:
+            p += 1
+        if p == n_filas:
+            col += 1
+            continue
+        if p != fila:
+            M[fila], M[p] = M[p], M[fila]
+
+        piv = M[fila]
+        pivote = piv[col]
+        no_nulos = [j for j in range(col, n_cols) if piv[j]]
+        if reducida and pivote != 1:
+            inv = pivote.reciproco()
+            for j in no_nulos:
+                piv[j] = piv[j] * inv
+        for i in range(0 if reducida else fila + 1, n_filas):
+            fi = M[i]
+            a = fi[col]
+            if i == fila or not a:
+                continue
+            factor = -a if reducida else -(a / pivote)
+            for j in no_nulos:
+                fi[j] = fi[j] + piv[j] * factor
+
+        pivotes.append(col)
+        fila += 1
+        col += 1
+    return fila, col, pivotes
+
+
+def _reducir_enteros(M, hasta_columna, reducida):
+    """
+    Eliminación sin fracciones, como eliminacion_bareiss: las filas se
+    escalan a enteros y cada actualización F_i → (p·F_i − a·F_k) / p_anterior
+    es una división exacta. Cada fila entera es la fila que daría la aritmética de
+    Fraccion multiplicada por escala·p (en Gauss-Jordan una fila pivote,
+    normalizada, solo por p), así que al final se divide una vez por entrada
+    y el resultado es el mismo que con siguiente(). `ultimo[i]` es el p con
+    el que está escrita la fila i: las filas con a = 0 no se reescalan en
+    cada pivote, sino recién cuando hay que operar con ellas.
+    """
+    E, escalas = _filas_a_enteros(M)
+    n_filas = len(E)
+    ultimo = [1] * n_filas
+    divisores = [None] * n_filas
+    prev = 1
+    fila = col = 0
+    pivotes = []
+    while fila < n_filas and col < hasta_columna:
+        p = fila
+        while p < n_filas and E[p][col] == 0:
+            p += 1
+        if p == n_filas:
+            col += 1
+            continue
+        if p != fila:
+            E[fila], E[p] = E[p], E[fila]
+            escalas[fila], escalas[p] = escalas[p], escalas[fila]
+            ultimo[fila], ultimo[p] = ultimo[p], ultimo[fila]
+
+        if ultimo[fila] != prev:
+            u = ultimo[fila]
+            E[fila] = [x * prev // u for x in E[fila]]
+        piv_fila = E[fila]
+        piv = piv_fila[col]
+        # Hacia adelante la fila pivote ya no cambia: su divisor queda fijo
+        divisores[fila] = escalas[fila] * prev
+        ultimo[fila] = piv
+        for i in range(0 if reducida else fila + 1, n_filas):
+            if i == fila or E[i][col] == 0:
+                continue
+            fi = E[i]
+            if ultimo[i] != prev:
+                u = ultimo[i]
+                fi = [x * prev // u for x in fi]
+            a = fi[col]
+            E[i] = [(piv * x - a * y) // prev for x, y in zip(fi, piv_fila)]
+            ultimo[i] = piv
+
+        prev = piv
+        pivotes.append(col)
+        fila += 1
+        col += 1
+
+    for i in range(n_filas):
+        if i >= fila:
+            d = escalas[i] * ultimo[i]
+        elif reducida:
+            d = ultimo[i]
+        else:
+            d = divisores[i]
+        M[i] = [Fraccion(x, d) for x in E[i]]
+    return fila, col, pivotes
 
 
-class GaussJordanEngine:
-    def __init__(self, matriz_aumentada):
+class GaussJordanEngine(NavegacionPasos):
+    def __init__(self, matriz_aumentada, intervalo_checkpoint=None):
         self.matriz_original = [[x for x in fila] for fila in matriz_aumentada]
         self.matriz_actual = [[x for x in fila] for fila in matriz_aumentada]
-        self.log = []
         self.paso_actual = 0
         self.filas = len(matriz_aumentada)
+        self.log = LogPasos(intervalo_checkpoint or self.filas)
         self.columnas = len(matriz_aumentada[0]) if matriz_aumentada else 0
         self.terminado = False
         self.fila_actual = 0
         self.col_actual = 0
+        self.posicion = 0
 
         # Registrar estado inicial
         self._agregar_paso("Estado inicial")
 
-    def _agregar_paso(self, descripcion, pivote_row=None, pivote_col=None):
-        paso = PasoGauss(self.matriz_actual, descripcion, pivote_row, pivote_col)
-        self.log.append(paso)
+    def _agregar_paso(self, descripcion, pivote_row=None, pivote_col=None, filas=(), checkpoint=False):
+        paso = PasoGauss(descripcion, pivote_row, pivote_col)
+        paso.estado = (self.fila_actual, self.col_actual, self.terminado)
+        self.log.agregar(paso, self.matriz_actual, filas, checkpoint)
+        self.posicion = len(self.log) - 1
         self.paso_actual += 1
 
     def _intercambiar_filas(self, i, j):
         if i != j:
             self.matriz_actual[i], self.matriz_actual[j] = self.matriz_actual[j], self.matriz_actual[i]
-            self._agregar_paso(f"Intercambiar fila {i + 1} con fila {j + 1}", i, self.col_actual)
+            self._agregar_paso(f"Intercambiar fila {i + 1} con fila {j + 1}", i, self.col_actual, (i, j))
 
     def _multiplicar_fila(self, fila, escalar):
         for j in range(self.columnas):
             self.matriz_actual[fila][j] = self.matriz_actual[fila][j] * escalar
-        self._agregar_paso(f"Multiplicar fila {fila + 1} por {escalar}", fila, self.col_actual)
+        self._agregar_paso(f"Multiplicar fila {fila + 1} por {escalar}", fila, self.col_actual, (fila,))
 
     def _sumar_filas(self, fila_destino, fila_fuente, escalar):
+        destino = self.matriz_actual[fila_destino]
+        fuente = self.matriz_actual[fila_fuente]
+        # Solo las entradas no nulas de la fila fuente cambian algo
         for j in range(self.columnas):
-            self.matriz_actual[fila_destino][j] = (
-                self.matriz_actual[fila_destino][j]
-                + self.matriz_actual[fila_fuente][j] * escalar
-            )
+            if not fuente[j].es_cero():
+                destino[j] = destino[j] + fuente[j] * escalar
         desc = f"F{fila_destino + 1} → F{fila_destino + 1} + ({escalar})×F{fila_fuente + 1}"
-        self._agregar_paso(desc, fila_destino, self.col_actual)
+        self._agregar_paso(desc, fila_destino, self.col_actual, (fila_destino,))
 
     def _encontrar_pivote(self, fila_inicio, col):
         for i in range(fila_inicio, self.filas):
@@ -55,6 +322,11 @@ class GaussJordanEngine:
         return None
 
     def siguiente(self):
+        if self.posicion < len(self.log) - 1:
+            # Paso ya calculado (se había retrocedido): solo se restaura
+            self._restaurar(self.posicion + 1)
+            return self.log[self.posicion]
+
         if self.terminado:
             return None
 
@@ -93,6 +365,32 @@ class GaussJordanEngine:
         self._agregar_paso("Proceso completado")
         return self.log[-1]
 
+    def resolver(self, registrar=True):
+        """
+        Lleva el proceso hasta el final y devuelve la matriz reducida.
+        Con registrar=False no guarda cada operación de fila y elimina sin
+        fracciones (ver _reducir): solo queda un paso final con la matriz
+        completa. El resultado es el mismo que llamando a siguiente() hasta
+        terminar.
+        """
+        if registrar:
+            while not self.terminado or self.posicion < len(self.log) - 1:
+                self.siguiente()
+            return self.matriz_actual
+
+        if self.posicion < len(self.log) - 1:
+            self._restaurar(len(self.log) - 1)
+        if self.terminado:
+            return self.matriz_actual
+
+        # La forma reducida no depende de por dónde iba el motor: se parte de
+        # la matriz actual
+        fila, col, _ = _reducir(self.matriz_actual, self.columnas - 1)
+        self.fila_actual, self.col_actual = fila, col
+        self.terminado = True
+        self._agregar_paso("Proceso completado", checkpoint=True)
+        return self.matriz_actual
+
     # ---------- análisis detallado y forma paramétrica ----------
 
     def _info_pivotes_y_vars(self):
@@ -118,8 +416,7 @@ class GaussJordanEngine:
         """Analiza el sistema y devuelve información detallada sobre la solución."""
         # Asegurarse de que el proceso Gauss-Jordan terminó
         if not self.terminado:
-            while not self.terminado:
-                self.siguiente()
+            self.resolver(registrar=False)
 
         matriz = self.matriz_actual
         filas = self.filas
@@ -255,44 +552,48 @@ class GaussJordanEngine:
 
 # ===================== MÉTODO DE GAUSS (simple) =====================
 
-class GaussEngine:
+class GaussEngine(NavegacionPasos):
     """
     Método de Gauss (solo eliminación hacia adelante hasta forma escalonada).
     La GUI verá los pasos de Gauss. Para clasificar el sistema y obtener
     la solución en forma paramétrica, internamente reutilizamos Gauss-Jordan.
     """
 
-    def __init__(self, matriz_aumentada):
+    def __init__(self, matriz_aumentada, intervalo_checkpoint=None):
         self.matriz_original = [[x for x in fila] for fila in matriz_aumentada]
         self.matriz_actual = [[x for x in fila] for fila in matriz_aumentada]
-        self.log = []
         self.paso_actual = 0
         self.filas = len(matriz_aumentada)
+        self.log = LogPasos(intervalo_checkpoint or self.filas)
         self.columnas = len(matriz_aumentada[0]) if matriz_aumentada else 0
         self.terminado = False
         self.fila_actual = 0
         self.col_actual = 0
+        self.posicion = 0
 
         self._agregar_paso("Estado inicial (Gauss)")
 
-    def _agregar_paso(self, descripcion, pivote_row=None, pivote_col=None):
-        paso = PasoGauss(self.matriz_actual, descripcion, pivote_row, pivote_col)
-        self.log.append(paso)
+    def _agregar_paso(self, descripcion, pivote_row=None, pivote_col=None, filas=(), checkpoint=False):
+        paso = PasoGauss(descripcion, pivote_row, pivote_col)
+        paso.estado = (self.fila_actual, self.col_actual, self.terminado)
+        self.log.agregar(paso, self.matriz_actual, filas, checkpoint)
+        self.posicion = len(self.log) - 1
         self.paso_actual += 1
 
     def _intercambiar_filas(self, i, j):
         if i != j:
             self.matriz_actual[i], self.matriz_actual[j] = self.matriz_actual[j], self.matriz_actual[i]
-            self._agregar_paso(f"Intercambiar fila {i + 1} con fila {j + 1}", i, self.col_actual)
+            self._agregar_paso(f"Intercambiar fila {i + 1} con fila {j + 1}", i, self.col_actual, (i, j))
 
     def _sumar_filas(self, fila_destino, fila_fuente, escalar):
+        destino = self.matriz_actual[fila_destino]
+        fuente = self.matriz_actual[fila_fuente]
+        # Solo las entradas no nulas de la fila fuente cambian algo
         for j in range(self.columnas):
-            self.matriz_actual[fila_destino][j] = (
-                self.matriz_actual[fila_destino][j]
-                + self.matriz_actual[fila_fuente][j] * escalar
-            )
+            if not fuente[j].es_cero():
+                destino[j] = destino[j] + fuente[j] * escalar
         desc = f"F{fila_destino + 1} → F{fila_destino + 1} + ({escalar})×F{fila_fuente + 1}"
-        self._agregar_paso(desc, fila_destino, self.col_actual)
+        self._agregar_paso(desc, fila_destino, self.col_actual, (fila_destino,))
 
     def _encontrar_pivote(self, fila_inicio, col):
         for i in range(fila_inicio, self.filas):
@@ -307,6 +608,10 @@ class GaussEngine:
         - intercambia filas si es necesario,
         - hace ceros *debajo* del pivote.
         """
+        if self.posicion < len(self.log) - 1:
+            self._restaurar(self.posicion + 1)
+            return self.log[self.posicion]
+
         if self.terminado:
             return None
 
@@ -341,6 +646,28 @@ class GaussEngine:
         self._agregar_paso("Proceso completado (Gauss - forma escalonada)")
         return self.log[-1]
 
+    def resolver(self, registrar=True):
+        """
+        Lleva la eliminación hasta la forma escalonada y devuelve la matriz.
+        Con registrar=False no guarda cada operación de fila (ver
+        GaussJordanEngine.resolver); el resultado es el mismo.
+        """
+        if registrar:
+            while not self.terminado or self.posicion < len(self.log) - 1:
+                self.siguiente()
+            return self.matriz_actual
+
+        if self.posicion < len(self.log) - 1:
+            self._restaurar(len(self.log) - 1)
+        if self.terminado:
+            return self.matriz_actual
+
+        fila, col, _ = _reducir(self.matriz_actual, self.columnas - 1, reducida=False)
+        self.fila_actual, self.col_actual = fila, col
+        self.terminado = True
+        self._agregar_paso("Proceso completado (Gauss - forma escalonada)", checkpoint=True)
+        return self.matriz_actual
+
     # ----------- análisis: reutilizamos Gauss-Jordan internamente -----------
 
     def analizar(self):
@@ -349,13 +676,11 @@ class GaussEngine:
         escalonada actual para obtener tipo, pivotes y solución paramétrica.
         """
         if not self.terminado:
-            while not self.terminado:
-                self.siguiente()
+            self.resolver(registrar=False)
 
         # Crear un Gauss-Jordan auxiliar SOLO para analizar
         gj = GaussJordanEngine(self.matriz_actual)
-        while not gj.terminado:
-            gj.siguiente()
+        gj.resolver(registrar=False)
 
         # Usamos su método analizar, que ya devuelve el triple
         return gj.analizar()
@@ -393,3 +718,283 @@ class GaussEngine:
 
         cuerpo = "\n".join(ecuaciones) if ecuaciones else "(No se pudieron generar ecuaciones.)"
         return encabezado + cuerpo
+
+
+# ====== Factorización LU exacta (PA = LU) con caché ======
+
+class FactorizacionLU:
+    """
+    Factorización exacta PA = LU de una matriz cuadrada con Fraccion.
+
+    L es triangular inferior con unos en la diagonal, U triangular superior y
+    P se guarda como la lista `permutacion` (fila i de PA = fila permutacion[i]
+    de A). El pivote es la primera entrada no nula de la columna, igual que en
+    los motores de Gauss. Una vez factorizada, cada lado derecho nuevo se
+    resuelve en O(n²) con sustitución hacia adelante y hacia atrás.
+    """
+
+    def __init__(self, A):
+        n = len(A)
+        if any(len(fila) != n for fila in A):
+            raise ValueError("La matriz debe ser cuadrada")
+        self.n = n
+        U = [[Fraccion(x) for x in fila] for fila in A]
+        L = [[Fraccion(0)] * n for _ in range(n)]
+        perm = list(range(n))
+        signo = 1
+        singular = False
+
+        for k in range(n):
+            p = next((i for i in range(k, n) if not U[i][k].es_cero()), None)
+            if p is None:
+                # Columna sin pivote: U[k][k] queda en cero
+                singular = True
+                L[k][k] = Fraccion(1)
+                continue
+            if p != k:
+                U[k], U[p] = U[p], U[k]
+                L[k], L[p] = L[p], L[k]
+                perm[k], perm[p] = perm[p], perm[k]
+                signo = -signo
+            L[k][k] = Fraccion(1)
+            fk = U[k]
+            pivote = fk[k]
+            no_nulos = [j for j in range(k + 1, n) if not fk[j].es_cero()]
+            for i in range(k + 1, n):
+                fi = U[i]
+                if fi[k].es_cero():
+                    continue
+                m = fi[k] / pivote
+                L[i][k] = m
+                fi[k] = Fraccion(0)
+                for j in no_nulos:
+                    fi[j] = fi[j] - m * fk[j]
+
+        self.L = L
+        self.U = U
+        self.permutacion = perm
+        self.signo = signo
+        self.singular = singular
+
+    def determinante(self):
+        det = Fraccion(self.signo)
+        for k in range(self.n):
+            det = det * self.U[k][k]
+        return det
+
+    def resolver(self, b):
+        """Resuelve A x = b (b es una lista de n valores)."""
+        if len(b) != self.n:
+            raise ValueError("El vector b debe tener tantas entradas como filas tiene A")
+        if self.singular:
+            raise ValueError("La matriz es singular: el sistema no tiene solución única")
+        n, L, U = self.n, self.L, self.U
+
+        # L y = P b
+        y = [Fraccion(b[p]) for p in self.permutacion]
+        for i in range(1, n):
+            fi = L[i]
+            acc = y[i]
+            for j in range(i):
+                if not fi[j].es_cero():
+                    acc = acc - fi[j] * y[j]
+            y[i] = acc
+
+        # U x = y
+        x = [Fraccion(0)] * n
+        for i in range(n - 1, -1, -1):
+            fi = U[i]
+            acc = y[i]
+            for j in range(i + 1, n):
+                if not fi[j].es_cero():
+                    acc = acc - fi[j] * x[j]
+            x[i] = acc / fi[i]
+        return x
+
+    def resolver_varios(self, B):
+        """Resuelve A X = B; cada columna de B es un lado derecho. Devuelve X (n×k)."""
+        if len(B) != self.n:
+            raise ValueError("B debe tener tantas filas como A")
+        k = len(B[0]) if B else 0
+        columnas = [self.resolver([fila[c] for fila in B]) for c in range(k)]
+        return [[columnas[c][i] for c in range(k)] for i in range(self.n)]
+
+    def inversa_L(self, al_completar_columna=None):
+        """
+        L⁻¹ (triangular inferior con unos en la diagonal), columna por columna.
+        al_completar_columna(j, X) se llama con la inversa parcial tras cada columna.
+        """
+        n, L = self.n, self.L
+        X = [[Fraccion(0)] * n for _ in range(n)]
+        for j in range(n):
+            X[j][j] = Fraccion(1)
+            for i in range(j + 1, n):
+                fi = L[i]
+                acc = Fraccion(0)
+                for k in range(j, i):
+                    if not fi[k].es_cero() and not X[k][j].es_cero():
+                        acc = acc - fi[k] * X[k][j]
+                X[i][j] = acc
+            if al_completar_columna is not None:
+                al_completar_columna(j, X)
+        return X
+
+    def inversa_U(self, al_completar_columna=None):
+        """U⁻¹ (triangular superior), columna por columna; igual que inversa_L."""
+        if self.singular:
+            raise ValueError("Matriz no es invertible (determinante = 0)")
+        n, U = self.n, self.U
+        Y = [[Fraccion(0)] * n for _ in range(n)]
+        for j in range(n):
+            Y[j][j] = U[j][j].reciproco()
+            for i in range(j - 1, -1, -1):
+                fi = U[i]
+                acc = Fraccion(0)
+                for k in range(i + 1, j + 1):
+                    if not fi[k].es_cero() and not Y[k][j].es_cero():
+                        acc = acc + fi[k] * Y[k][j]
+                Y[i][j] = -acc / fi[i]
+            if al_completar_columna is not None:
+                al_completar_columna(j, Y)
+        return Y
+
+    def componer_inversa(self, U_inv, L_inv):
+        """A⁻¹ = U⁻¹·L⁻¹·P, aprovechando que ambos factores son triangulares."""
+        n, perm = self.n, self.permutacion
+        inversa = [[Fraccion(0)] * n for _ in range(n)]
+        for r in range(n):
+            fy = U_inv[r]
+            fila = [Fraccion(0)] * n
+            for k in range(r, n):
+                y = fy[k]
+                if y.es_cero():
+                    continue
+                fx = L_inv[k]
+                for c in range(k + 1):
+                    if not fx[c].es_cero():
+                        fila[c] = fila[c] + y * fx[c]
+            # Multiplicar por P a la derecha reubica las columnas
+            destino = inversa[r]
+            for c in range(n):
+                destino[perm[c]] = fila[c]
+        return inversa
+
+    def inversa(self):
+        """A⁻¹ por inversión de los factores triangulares (la mitad de trabajo que Gauss-Jordan sobre [A|I])."""
+        if self.singular:
+            raise ValueError("Matriz no es invertible (determinante = 0)")
+        return self.componer_inversa(self.inversa_U(), self.inversa_L())
+
+
+MAX_CACHE_LU = 32
+_cache_lu = OrderedDict()
+_cache_lu_stats = {"hits": 0, "misses": 0}
+
+
+def clave_matriz(A):
+    """Clave de caché según el contenido de A (Fraccion y int iguales dan la misma clave)."""
+    return tuple(tuple(fila) for fila in A)
+
+
+def factorizar_lu(A):
+    """
+    Devuelve la FactorizacionLU de A, reutilizando una ya calculada si A tiene
+    el mismo contenido. La caché guarda las últimas MAX_CACHE_LU matrices (LRU).
+    """
+    clave = clave_matriz(A)
+    lu = _cache_lu.get(clave)
+    if lu is not None:
+        _cache_lu.move_to_end(clave)
+        _cache_lu_stats["hits"] += 1
+        return lu
+    _cache_lu_stats["misses"] += 1
+    lu = FactorizacionLU(A)
+    _cache_lu[clave] = lu
+    while len(_cache_lu) > MAX_CACHE_LU:
+        _cache_lu.popitem(last=False)
+    return lu
+
+
+def info_cache_lu():
+    """Devuelve estadísticas de la caché de factorizaciones LU."""
+    return {
+        "entradas": len(_cache_lu),
+        "max_entradas": MAX_CACHE_LU,
+        "hits": _cache_lu_stats["hits"],
+        "misses": _cache_lu_stats["misses"],
+    }
+
+
+def limpiar_cache_lu():
+    """Vacía la caché de factorizaciones y reinicia los contadores."""
+    _cache_lu.clear()
+    _cache_lu_stats["hits"] = 0
+    _cache_lu_stats["misses"] = 0
+
+
+class FormaReducida:
+    """
+    Forma escalonada reducida de una matriz A (sin columna aumentada),
+    calculada en una sola pasada sin registro de pasos.
+
+    R es la matriz reducida y `pivotes` las columnas pivote (0-based). De ahí
+    salen el rango, una base del espacio columna (las columnas pivote de A) y
+    una base del espacio nulo (un vector por cada columna libre).
+    """
+
+    def __init__(self, A):
+        self.original = [[Fraccion(x) for x in fila] for fila in A]
+        self.filas = len(self.original)
+        self.columnas = len(self.original[0]) if self.original else 0
+        self.R = [fila[:] for fila in self.original]
+        _, _, self.pivotes = _reducir(self.R, self.columnas)
+
+    def rango(self):
+        return len(self.pivotes)
+
+    def columnas_pivote(self):
+        return list(self.pivotes)
+
+    def columnas_libres(self):
+        pivotes = set(self.pivotes)
+        return [j for j in range(self.columnas) if j not in pivotes]
+
+    def base_espacio_columnas(self):
+        """Columnas de A (no de R) en las posiciones pivote, como listas de Fraccion."""
+        return [[fila[j] for fila in self.original] for j in self.pivotes]
+
+    def base_espacio_nulo(self):
+        """
+        Un vector por columna libre f: x_f = 1, las otras libres en 0 y cada
+        variable pivote x_p = −R[k][f]. Lista vacía si el espacio nulo es {0}.
+        """
+        base = []
+        for f in self.columnas_libres():
+            v = [Fraccion(0)] * self.columnas
+            v[f] = Fraccion(1)
+            for k, p in enumerate(self.pivotes):
+                v[p] = -self.R[k][f]
+            base.append(v)
+        return base
+
+
+def forma_reducida(A):
+    """Matriz escalonada reducida de A y sus columnas pivote: (R, pivotes)."""
+    fr = FormaReducida(A)
+    return fr.R, fr.pivotes
+
+
+def rango(A):
+    return FormaReducida(A).rango()
+
+
+def columnas_pivote(A):
+    return FormaReducida(A).columnas_pivote()
+
+
+def base_espacio_columnas(A):
+    return FormaReducida(A).base_espacio_columnas()
+
+
+def base_espacio_nulo(A):
+    return FormaReducida(A).base_espacio_nulo()
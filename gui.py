@@ -1,14 +1,18 @@
+import queue
 import threading
 import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from fraccion import Fraccion
-from gauss import GaussJordanEngine, GaussEngine
+from banda import MotorBanda, crear_motor
+from gauss import FormaReducida, GaussJordanEngine, GaussEngine
+from sesion import SesionSistema
 from matrices import (
     sumar_matrices, multiplicar_matrices,
-    multiplicar_escalar_matriz, combinar_escalar_matrices,
+    multiplicar_escalar_matriz, combinar_escalar_matrices, combinar_productos,
+    Au_mas_Av, A_por_u_mas_v,
     formatear_matriz, Transpuesta, determinante_matriz,
-    determinante_cofactores)
+    determinante_cofactores, regla_cramer, RegistroPasos)
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
@@ -18,6 +22,9 @@ TEXT_BG = "#1E1E1E"
 TEXT_FG = "#FFFFFF"
 TEXT_FONT = ("Cascadia Code", 10)
 
+# Cada cuánto se pasan a la ventana los pasos que va generando un cálculo
+INTERVALO_PASOS_MS = 50
+
 
 def make_text(parent, height=12, wrap="word", font=TEXT_FONT):
     return tk.Text(parent,
@@ -347,6 +354,9 @@ class App(tk.Tk):
 
         # Variables de control
         self.engine = None
+        self.sesion = None           # SesionSistema del último [A|b] resuelto
+        self.sesion_lock = threading.Lock()
+        self._tareas_pasos = {}      # Text → cálculo que está escribiendo en él
         self.auto_running = False
         self.auto_thread = None
         self.btn_auto = None
@@ -584,13 +594,51 @@ class App(tk.Tk):
             A = self.matrix_input.get_matrix()
         except Exception as e:
             messagebox.showerror("Entrada inválida", str(e)); return
-        self.engine = GaussJordanEngine(A)
+        # Por defecto se muestran las operaciones de fila de Gauss-Jordan; el
+        # motor en banda (un paso por pivote) solo si se pidió
+        if self.gauss_usar_banda.get():
+            self.engine = crear_motor(A)
+        else:
+            self.engine = GaussJordanEngine(A)
         self._render_last_step()
+        if isinstance(self.engine, MotorBanda):
+            self._log(f"Matriz en banda detectada ({self.engine.metodo}): pasos condensados.")
+        elif self.gauss_usar_banda.get():
+            self._log("No se usa el motor en banda: se muestran los pasos de Gauss-Jordan.")
         self._log("Inicializado. Use 'Siguiente paso' o 'Reproducir'.")
         self._update_status("Listo para ejecutar.")
         self.lbl_result.config(text="—")
         if hasattr(self, "txt_solution"):
             self.txt_solution.delete(1.0, tk.END)
+        threading.Thread(target=self._resolver_en_sesion, args=(A, self.engine), daemon=True).start()
+
+    def _resolver_en_sesion(self, M, engine):
+        """
+        Resuelve [A|b] cuadrado con la SesionSistema (en un hilo aparte) y
+        muestra la solución sin esperar a los pasos. Si desde la vez anterior
+        solo cambiaron algunas entradas, la sesión actualiza con
+        Sherman–Morrison en lugar de volver a factorizar.
+        """
+        n = len(M)
+        if any(len(fila) != n + 1 for fila in M):
+            return
+        A = [fila[:n] for fila in M]
+        b = [fila[n] for fila in M]
+        with self.sesion_lock:
+            if self.sesion is None or self.sesion.n != n:
+                self.sesion = SesionSistema(A, b)
+            else:
+                self.sesion.actualizar(A, b)
+            x, metodo = self.sesion.x, self.sesion.ultimo_metodo
+        if x is not None:
+            texto = "\n".join(f"x{j + 1} = {v}" for j, v in enumerate(x))
+            self.after(0, self._mostrar_solucion_sesion, engine, f"Solución ({metodo}):\n{texto}\n")
+
+    def _mostrar_solucion_sesion(self, engine, texto):
+        # Solo si no se reinició ni se terminó de analizar mientras tanto
+        if self.engine is engine and not engine.terminado and hasattr(self, "txt_solution"):
+            self.txt_solution.delete(1.0, tk.END)
+            self.txt_solution.insert(tk.END, texto)
 
     def next_step(self):
         if not self.engine:
@@ -602,6 +650,26 @@ class App(tk.Tk):
         if self.engine.terminado:
             self._show_result()
 
+    def prev_step(self):
+        if not self.engine:
+            messagebox.showinfo("Información", "Primero presione 'Resolver (inicializar)'"); return
+        if self.engine.anterior() is None:
+            self._log("Ya está en el estado inicial.")
+            return
+        self._render_last_step()
+
+    def goto_step(self):
+        if not self.engine:
+            messagebox.showinfo("Información", "Primero presione 'Resolver (inicializar)'"); return
+        try:
+            k = int(self.spin_paso.get())
+        except ValueError:
+            messagebox.showerror("Entrada inválida", "El número de paso debe ser un entero"); return
+        self.engine.ir_a(k)
+        self._render_last_step()
+        if self.engine.terminado:
+            self._show_result()
+
     def toggle_auto(self):
         if not self.engine:
             messagebox.showinfo("Información", "Primero presione 'Resolver (inicializar)'"); return
@@ -647,10 +715,13 @@ class App(tk.Tk):
 
     def _render_last_step(self):
         if not self.engine or not self.engine.log: return
-        step = self.engine.log[-1]
+        k = self.engine.posicion
+        step = self.engine.log[k]
         self.matrix_view.set_matrix(step.matriz)
         self.matrix_view.highlight(step.pivote_row, step.pivote_col)
-        self._log(step.descripcion)
+        self._log(f"[{k}/{self.engine.total_pasos - 1}] {step.descripcion}")
+        self.spin_paso.delete(0, "end")
+        self.spin_paso.insert(0, str(k))
 
     def _log(self, text):
         self.txt_log.insert(tk.END, text + "\n")
@@ -685,6 +756,55 @@ class App(tk.Tk):
     def _update_status(self, s):
         self.status.config(text=s)
 
+    def _calcular_con_pasos(self, txt, funcion, al_terminar, al_fallar=None, separador="\n"):
+        """
+        Ejecuta funcion(registro) en un hilo aparte. Cada paso pasa por una
+        cola y el hilo de Tk los escribe en `txt` cada INTERVALO_PASOS_MS, así
+        que aparecen mientras se calcula sin trabar la ventana. Al terminar se
+        llama (en el hilo de Tk) al_terminar(resultado) o al_fallar(error).
+        Si se lanza otro cálculo sobre el mismo `txt`, lo que falte del
+        anterior se descarta.
+        """
+        cola = queue.Queue()
+        tarea = object()
+        self._tareas_pasos[txt] = tarea
+
+        def trabajar():
+            try:
+                cola.put(("fin", funcion(RegistroPasos(emitir=lambda p: cola.put(("paso", p))))))
+            except Exception as e:
+                cola.put(("error", e))
+
+        def vaciar():
+            if self._tareas_pasos.get(txt) is not tarea:
+                return
+            textos, final = [], None
+            while final is None:
+                try:
+                    tipo, valor = cola.get_nowait()
+                except queue.Empty:
+                    break
+                if tipo == "paso":
+                    textos.append(valor + separador)
+                else:
+                    final = (tipo, valor)
+            if textos:
+                txt.insert(tk.END, "".join(textos))
+            if final is None:
+                self.after(INTERVALO_PASOS_MS, vaciar)
+                return
+            del self._tareas_pasos[txt]
+            tipo, valor = final
+            if tipo == "fin":
+                al_terminar(valor)
+            elif al_fallar is not None:
+                al_fallar(valor)
+            else:
+                messagebox.showerror("Error", str(valor))
+
+        threading.Thread(target=trabajar, daemon=True).start()
+        self.after(INTERVALO_PASOS_MS, vaciar)
+
     # -------- Tab 1: Gauss-Jordan --------
     def _tab_gauss(self):
         tab = ttk.Frame(self.nb)
@@ -720,11 +840,23 @@ class App(tk.Tk):
             command=self.start_engine
         ).pack(side="left", padx=(0, 6))
 
+        ttk.Button(
+            ctrls, text="Paso anterior",
+            command=self.prev_step
+        ).pack(side="left", padx=3)
+
         ttk.Button(
             ctrls, text="Siguiente paso",
             command=self.next_step
         ).pack(side="left", padx=3)
 
+        self.spin_paso = tk.Spinbox(ctrls, from_=0, to=9999, width=5)
+        self.spin_paso.pack(side="left", padx=(9, 3))
+        ttk.Button(
+            ctrls, text="Ir a paso",
+            command=self.goto_step
+        ).pack(side="left", padx=3)
+
         self.btn_auto = ttk.Button(
             ctrls, text="Reproducir",
             command=self.toggle_auto
@@ -741,6 +873,14 @@ class App(tk.Tk):
             command=self.export_log
         ).pack(side="left", padx=3)
 
+        # Opcional: sistemas en banda con pasos condensados (Thomas / banda)
+        self.gauss_usar_banda = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            ctrls,
+            text="Pasos condensados si hay banda",
+            variable=self.gauss_usar_banda
+        ).pack(side="left", padx=10)
+
         # ================= NUEVA SECCIÓN: INPUT DE SISTEMA =================
         display_frame = ttk.Frame(tab)
         display_frame.pack(fill="x", padx=8, pady=(10, 0))
@@ -870,11 +1010,23 @@ class App(tk.Tk):
             command=self.start_engine_gauss
         ).pack(side="left", padx=(0, 6))
 
+        ttk.Button(
+            ctrls, text="Paso anterior",
+            command=self.prev_step_gauss
+        ).pack(side="left", padx=3)
+
         ttk.Button(
             ctrls, text="Siguiente paso",
             command=self.next_step_gauss
         ).pack(side="left", padx=3)
 
+        self.spin_paso_gauss = tk.Spinbox(ctrls, from_=0, to=9999, width=5)
+        self.spin_paso_gauss.pack(side="left", padx=(9, 3))
+        ttk.Button(
+            ctrls, text="Ir a paso",
+            command=self.goto_step_gauss
+        ).pack(side="left", padx=3)
+
         self.btn_auto_gauss = ttk.Button(
             ctrls, text="Reproducir",
             command=self.toggle_auto_gauss
@@ -1076,6 +1228,26 @@ class App(tk.Tk):
         if self.engine_gauss.terminado:
             self._show_result_gauss()
 
+    def prev_step_gauss(self):
+        if not self.engine_gauss:
+            messagebox.showinfo("Información", "Primero presione 'Resolver (inicializar)'"); return
+        if self.engine_gauss.anterior() is None:
+            self._log_gauss("Ya está en el estado inicial.")
+            return
+        self._render_last_step_gauss()
+
+    def goto_step_gauss(self):
+        if not self.engine_gauss:
+            messagebox.showinfo("Información", "Primero presione 'Resolver (inicializar)'"); return
+        try:
+            k = int(self.spin_paso_gauss.get())
+        except ValueError:
+            messagebox.showerror("Entrada inválida", "El número de paso debe ser un entero"); return
+        self.engine_gauss.ir_a(k)
+        self._render_last_step_gauss()
+        if self.engine_gauss.terminado:
+            self._show_result_gauss()
+
     def toggle_auto_gauss(self):
         if not self.engine_gauss:
             messagebox.showinfo("Información", "Primero presione 'Resolver (inicializar)'"); return
@@ -1120,10 +1292,13 @@ class App(tk.Tk):
 
     def _render_last_step_gauss(self):
         if not self.engine_gauss or not self.engine_gauss.log: return
-        step = self.engine_gauss.log[-1]
+        k = self.engine_gauss.posicion
+        step = self.engine_gauss.log[k]
         self.matrix_view_gauss.set_matrix(step.matriz)
         self.matrix_view_gauss.highlight(step.pivote_row, step.pivote_col)
-        self._log_gauss(step.descripcion)
+        self._log_gauss(f"[{k}/{self.engine_gauss.total_pasos - 1}] {step.descripcion}")
+        self.spin_paso_gauss.delete(0, "end")
+        self.spin_paso_gauss.insert(0, str(k))
 
     def _log_gauss(self, text):
         self.txt_log_gauss.insert(tk.END, text + "\n")
@@ -1192,12 +1367,11 @@ class App(tk.Tk):
     def _calc_suma(self):
         try:
             A = self.suma_A.get_matrix(); B = self.suma_B.get_matrix()
-            R, pasos = sumar_matrices(A, B)
         except Exception as e:
             messagebox.showerror("Error", str(e)); return
-        self.suma_out.delete(1.0, tk.END); self.suma_out.insert(tk.END, formatear_matriz(R))
-        self.suma_log.delete(1.0, tk.END)
-        for p in pasos: self.suma_log.insert(tk.END, p + "\n")
+        self.suma_log.delete(1.0, tk.END); self.suma_out.delete(1.0, tk.END)
+        self._calcular_con_pasos(self.suma_log, lambda reg: sumar_matrices(A, B, registro=reg),
+                                 lambda resultado: self.suma_out.insert(tk.END, formatear_matriz(resultado[0])))
 
     # -------- Tab 3: Multiplicación --------
     def _tab_mult(self):
@@ -1252,12 +1426,11 @@ class App(tk.Tk):
     def _calc_mult(self):
         try:
             A = self.mult_A.get_matrix(); B = self.mult_B.get_matrix()
-            R, pasos = multiplicar_matrices(A, B)
         except Exception as e:
             messagebox.showerror("Error", str(e)); return
-        self.mult_out.delete(1.0, tk.END); self.mult_out.insert(tk.END, formatear_matriz(R))
-        self.mult_log.delete(1.0, tk.END)
-        for p in pasos: self.mult_log.insert(tk.END, p + "\n")
+        self.mult_log.delete(1.0, tk.END); self.mult_out.delete(1.0, tk.END)
+        self._calcular_con_pasos(self.mult_log, lambda reg: multiplicar_matrices(A, B, registro=reg),
+                                 lambda resultado: self.mult_out.insert(tk.END, formatear_matriz(resultado[0])))
 
     # -------- Tab 4: Escalar × Matriz / Combinaciones --------
     def _tab_escalar(self):
@@ -1571,15 +1744,7 @@ class App(tk.Tk):
                     raise ValueError(
                         "Para (Escalar × A) × B, columnas de A deben ser igual a filas de B."
                     )
-                R_escalar, pasos1 = multiplicar_escalar_matriz(escA, A)
-                R, pasos2 = multiplicar_matrices(R_escalar, B)
-
-                pasos = []
-                pasos.append(f"Operación: ({escA}·A) × B")
-                pasos.append("")
-                pasos.extend(pasos1)
-                pasos.append("")
-                pasos.extend(pasos2)
+                R, pasos = combinar_productos([(escA, A, B)], nombres=[("A", "B")])
 
             elif modo_str == "αA ± βB":
                 B = self.es_B.get_matrix()
@@ -1611,17 +1776,7 @@ class App(tk.Tk):
                         "a filas de u y v."
                     )
 
-                suma_uv, pasos1 = sumar_matrices(u, v)
-                R, pasos2 = multiplicar_matrices(A, suma_uv)
-
-                pasos = []
-                pasos.append("Operación: A(u+v)")
-                pasos.append("")
-                pasos.append("Cálculo de u + v:")
-                pasos.extend(pasos1)
-                pasos.append("")
-                pasos.append("Cálculo de A(u+v):")
-                pasos.extend(pasos2)
+                R, pasos = A_por_u_mas_v(A, u, v)
 
             else:  # "Au + Av"
                 u = self.es_B.get_matrix()
@@ -1633,23 +1788,8 @@ class App(tk.Tk):
                         "a filas de u y de v."
                     )
 
-                Au, pasos_Au = multiplicar_matrices(A, u)
-                Av, pasos_Av = multiplicar_matrices(A, v)
-                suma, pasos_sum = sumar_matrices(Au, Av)
-
-                pasos = []
-                pasos.append("Operación: Au + Av")
-                pasos.append("")
-                pasos.append("Cálculo de Au:")
-                pasos.extend(pasos_Au)
-                pasos.append("")
-                pasos.append("Cálculo de Av:")
-                pasos.extend(pasos_Av)
-                pasos.append("")
-                pasos.append("Suma Au + Av:")
-                pasos.extend(pasos_sum)
-
-                R = suma
+                # Se evalúa como A(u + v): una sola multiplicación
+                R, pasos = Au_mas_Av(A, u, v)
 
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -1837,12 +1977,21 @@ class App(tk.Tk):
             self._update_status("Comprobación de invertibilidad finalizada.")
             return
 
-        # --- CALCULAR INVERSA COMPLETA (Gauss-Jordan con paso a paso) ---
+        # --- CALCULAR INVERSA COMPLETA (PA = LU, paso a paso) ---
         from matrices import inversa_matriz
-        try:
-            R, pasos = inversa_matriz(A)
-        except ValueError as ve:
-            msg = str(ve)
+
+        def mostrar(resultado):
+            R, pasos = resultado
+            self.inv_last_steps = pasos
+            self.inv_out.insert(tk.END, formatear_matriz(R))
+            self._update_status("Inversa calculada correctamente.")
+
+        def fallar(error):
+            msg = str(error)
+            if not isinstance(error, ValueError):
+                messagebox.showerror("Error inesperado", msg)
+                self._update_status("Error inesperado al calcular la inversa.")
+                return
             if "no es invertible" in msg or "determinante = 0" in msg:
                 messagebox.showwarning(
                     "Sin inversa",
@@ -1855,17 +2004,9 @@ class App(tk.Tk):
             else:
                 messagebox.showerror("Error", msg)
             self._update_status("No se pudo calcular la inversa.")
-            return
-        except Exception as e:
-            messagebox.showerror("Error inesperado", str(e))
-            self._update_status("Error inesperado al calcular la inversa.")
-            return
 
-        self.inv_last_steps = pasos
-        self.inv_out.insert(tk.END, formatear_matriz(R))
-        for p in pasos:
-            self.inv_log.insert(tk.END, p + "\n\n")
-        self._update_status("Inversa calculada correctamente.")
+        self._update_status("Calculando la inversa…")
+        self._calcular_con_pasos(self.inv_log, lambda reg: inversa_matriz(A, registro=reg), mostrar, fallar, "\n\n")
 
     def _inv_export(self):
         if not self.inv_last_steps:
@@ -1921,6 +2062,7 @@ class App(tk.Tk):
 
         # almacenamiento temporal
         self._il_engine = None
+        self._il_conclusion = ""
 
     def _calc_independencia(self):
         """
@@ -1950,9 +2092,8 @@ class App(tk.Tk):
         engine = GaussJordanEngine(aug)
         self._il_engine = engine
 
-        # Ejecutar hasta finalizar (guardamos pasos)
-        while not engine.terminado:
-            engine.siguiente()
+        # Ejecutar hasta finalizar (guardamos pasos: esta pestaña los muestra)
+        engine.resolver()
 
         # Mostrar pasos
         self.il_log.delete(1.0, tk.END)
@@ -1965,27 +2106,22 @@ class App(tk.Tk):
         if last:
             self.il_view.set_matrix(last.matriz)
 
-        # Analizar resultados
-        resultado = engine.analizar()
-        tipo, data, clasificacion = resultado
-
-        # Para sistema homogéneo A x = 0:
-        # - si solución trivial única => columnas de A son linealmente independientes
-        # - si solución no trivial (infinitas) => dependientes
-        conclusion = ""
-        if tipo == "única" and clasificacion.get("solucion", "") == "trivial":
-            conclusion = f"Conclusión: Las columnas (vectores) son LINEALMENTE INDEPENDIENTES.\n\nClasificación: {clasificacion}"
-        elif tipo == "inconsistente":
-            # teóricamente no debería pasar en homogéneo, pero lo cubrimos
-            conclusion = "Conclusión: El sistema es inconsistente (algo no esperado para homogéneo)."
+        # Conclusión a partir de la forma reducida de A (sin registro):
+        # columnas independientes <=> rango = número de columnas <=> espacio nulo = {0}
+        fr = FormaReducida(A)
+        if fr.rango() == n_cols:
+            conclusion = "Conclusión: Las columnas (vectores) son LINEALMENTE INDEPENDIENTES.\n\n"
+            conclusion += f"Rango = {n_cols}: A x = 0 solo tiene la solución trivial."
         else:
-            # infinitas -> dependencia
-            # mostrar relación de dependencia usando la representación paramétrica
-            sol_text = engine.conjunto_solucion(resultado)
             conclusion = "Conclusión: Las columnas (vectores) son LINEALMENTE DEPENDIENTES.\n\n"
-            conclusion += "Relación(es) de dependencia (forma paramétrica / base del espacio nulo):\n"
-            conclusion += sol_text
-
+            conclusion += f"Rango = {fr.rango()} < {n_cols} vectores. "
+            conclusion += "Columnas pivote: " + ", ".join(f"v{j + 1}" for j in fr.columnas_pivote()) + ".\n"
+            conclusion += "Relación(es) de dependencia (base del espacio nulo):\n"
+            for c in fr.base_espacio_nulo():
+                terminos = [f"({x})·v{j + 1}" for j, x in enumerate(c) if not x.es_cero()]
+                conclusion += "  " + " + ".join(terminos) + " = 0\n"
+
+        self._il_conclusion = conclusion
         self.il_log.insert(tk.END, "\n" + conclusion)
         self.lbl_result.config(text="Independencia analizada.")
         self._update_status("Análisis de independencia completado.")
@@ -2006,9 +2142,8 @@ class App(tk.Tk):
                     f.write(" [ " + " ".join(str(x) for x in fila[:-1]) + " | " + str(fila[-1]) + " ]\n")
                 f.write("\n")
             # agregar conclusión final
-            resultado = engine.analizar()
             f.write("\nConclusión final:\n")
-            f.write(engine.conjunto_solucion(resultado) + "\n")
+            f.write(self._il_conclusion + "\n")
         messagebox.showinfo("Listo", f"Registro exportado a: {fp}")
 
     # -------- Tab 8: Determinante --------
@@ -2097,34 +2232,32 @@ class App(tk.Tk):
         self.det_out.delete(1.0, tk.END)
         self.det_log.delete(1.0, tk.END)
 
-        # Calcular con el método seleccionado
-        try:
-            if self.det_use_laplace.get():
-                # Cofactores (Laplace): "auto", "col0", "fila0"
-                pref = self.det_laplace_pref.get()
-                det, pasos = determinante_cofactores(A, prefer=pref)
-            else:
-                # Eliminación Gaussiana (rápido)
-                det, pasos = determinante_matriz(A)
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            return
+        # Calcular con el método seleccionado (las opciones se leen acá, en el hilo de Tk)
+        if self.det_use_laplace.get():
+            # Cofactores (Laplace): "auto", "col0", "fila0"
+            pref = self.det_laplace_pref.get()
+            calcular = lambda reg: determinante_cofactores(A, prefer=pref, registro=reg)
+        else:
+            # Eliminación Gaussiana (rápido)
+            calcular = lambda reg: determinante_matriz(A, registro=reg)
 
-        # Guardar y mostrar
-        self._det_pasos = pasos
-        self._det_val = det
+        def mostrar(resultado):
+            det, pasos = resultado
+            # Guardar y mostrar
+            self._det_pasos = pasos
+            self._det_val = det
 
-        self.det_out.insert(tk.END, f"det(A) = {det}\n")
-        for p in pasos:
-            self.det_log.insert(tk.END, p + "\n\n")
+            self.det_out.insert(tk.END, f"det(A) = {det}\n")
 
-        # Si tu app tiene un label de resultado general:
-        if hasattr(self, "lbl_result"):
-            self.lbl_result.config(text=f"det(A) = {det}")
+            # Si tu app tiene un label de resultado general:
+            if hasattr(self, "lbl_result"):
+                self.lbl_result.config(text=f"det(A) = {det}")
 
-        # Y si tienes barra de estado:
-        if hasattr(self, "_update_status"):
-            self._update_status("Determinante calculado.")
+            # Y si tienes barra de estado:
+            if hasattr(self, "_update_status"):
+                self._update_status("Determinante calculado.")
+
+        self._calcular_con_pasos(self.det_log, calcular, mostrar, separador="\n\n")
 
     def _det_export(self):
         if not self._det_pasos:
@@ -2279,7 +2412,7 @@ class App(tk.Tk):
         self.cramer_log.delete(1.0, tk.END)
 
         try:
-            solucion, pasos = self._regla_cramer(A, b)
+            solucion, pasos = regla_cramer(A, b)
         except Exception as e:
             messagebox.showerror("Error", str(e))
             return
@@ -2295,56 +2428,6 @@ class App(tk.Tk):
 
         self._update_status("Regla de Cramer aplicada correctamente.")
 
-    def _regla_cramer(self, A, b):
-        """
-        Resuelve un sistema lineal Ax = b usando la Regla de Cramer.
-        Devuelve (solución: list[Fraccion], pasos: list[str])
-        """
-        from matrices import determinante_matriz, formatear_matriz
-        n = len(A)
-        pasos = []
-
-        # Paso 1: Calcular determinante de A
-        pasos.append("Paso 1: Calcular determinante de A")
-        det_A, pasos_det = determinante_matriz(A)
-        pasos.append(f"  A:")
-        pasos.append(formatear_matriz(A))
-        for p in pasos_det:
-            pasos.append(p)
-        pasos.append(f"det(A) = {det_A}")
-
-        if det_A.es_cero():
-            raise ValueError("A no es invertible (det(A) = 0). No se puede aplicar la Regla de Cramer.")
-
-        pasos.append("")  # Línea en blanco
-
-        # Paso 2: Para cada variable, calcular determinante de A_i(b)
-        solucion = []
-        for i in range(n):
-            pasos.append(f"Paso {i + 2}: Calcular x{i + 1}")
-
-            # Crear A_i(b): reemplazar columna i por b
-            A_i = [fila[:] for fila in A]  # Copia profunda
-            for j in range(n):
-                A_i[j][i] = b[j]
-
-            pasos.append(f"Matriz A_{i + 1}(b) (columna {i + 1} reemplazada por b):")
-            pasos.append(formatear_matriz(A_i))
-
-            # Calcular determinante de A_i(b)
-            det_A_i, pasos_det_i = determinante_matriz(A_i)
-            for p in pasos_det_i:
-                pasos.append(p)
-            pasos.append(f"det(A_{i + 1}(b)) = {det_A_i}")
-
-            # Calcular x_i = det(A_i(b)) / det(A)
-            x_i = det_A_i / det_A
-            pasos.append(f"x_{i + 1} = det(A_{i + 1}(b)) / det(A) = {det_A_i} / {det_A} = {x_i}")
-            solucion.append(x_i)
-            pasos.append("")  # Línea en blanco
-
-        return solucion, pasos
-
     def _tab_sarrus(self):
         tab = ttk.Frame(self.nb)
         self.nb.add(tab, text="Determinante (Sarrus)")
@@ -1,5 +1,15 @@
 from fraccion import Fraccion
-import copy
+from gauss import _filas_a_enteros, clave_matriz, factorizar_lu
+import math
+import operator
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: hay versión en Python puro
+    np = None
 
 
 def formatear_matriz(M):
@@ -15,101 +25,455 @@ def formatear_matriz(M):
     return "\n".join(filas_str)
 
 
-def sumar_matrices(A, B):
+# ====== Registro de pasos ======
+
+class RegistroPasos:
+    """
+    Política de registro de las explicaciones (pasos) de cada operación.
+
+    modo:
+        "completo": todas las explicaciones (lo de siempre)
+        "resumen":  solo encabezados y resultados
+        "ninguno":  no se genera ningún texto
+    emitir: función opcional que recibe cada paso apenas se produce
+            (la GUI la usa para ir escribiendo en su cuadro de texto).
+    guardar: si es False los pasos solo se emiten, no se acumulan.
+    """
+
+    MODOS = ("ninguno", "resumen", "completo")
+
+    def __init__(self, modo="completo", emitir=None, guardar=True):
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de registro inválido: {modo}. Opciones: {', '.join(self.MODOS)}")
+        self.modo = modo
+        self.activo = modo != "ninguno"
+        self.detalle = modo == "completo"
+        self.emitir = emitir
+        self.guardar = guardar
+        self.pasos = []
+
+    def agregar(self, texto):
+        if not self.activo:
+            return
+        if self.guardar:
+            self.pasos.append(texto)
+        if self.emitir is not None:
+            self.emitir(texto)
+
+    def extender(self, textos):
+        for texto in textos:
+            self.agregar(texto)
+
+
+def _como_registro(registro):
+    """Acepta None (registro completo), un nombre de modo o un RegistroPasos."""
+    if registro is None:
+        return RegistroPasos()
+    if isinstance(registro, str):
+        return RegistroPasos(registro)
+    return registro
+
+
+def _como_listas(A):
+    """Acepta una lista de listas o cualquier matriz con a_listas() (p. ej. MatrizRacional)."""
+    a_listas = getattr(A, "a_listas", None)
+    return a_listas() if a_listas is not None else A
+
+
+MODOS_NUMERICOS = ("exacto", "flotante")
+
+
+def _motor_flotante(modo):
+    """None para modo "exacto"; el módulo flotante para modo "flotante"."""
+    if modo not in MODOS_NUMERICOS:
+        raise ValueError(f"Modo numérico inválido: {modo}. Use 'exacto' o 'flotante'")
+    if modo == "exacto":
+        return None
+    if np is None:
+        raise ValueError("El modo flotante necesita NumPy")
+    import flotante
+    return flotante
+
+
+def iterar_pasos(funcion, *args, modo="completo", **kwargs):
+    """
+    Ejecuta funcion(*args, registro=..., **kwargs) y va entregando sus pasos
+    a medida que se generan. El resultado de la función queda como valor de
+    retorno del generador:
+
+        resultado = yield from iterar_pasos(inversa_matriz, A)
+    """
+    cola = queue.Queue()
+    fin = object()
+    salida = {}
+
+    def trabajar():
+        try:
+            registro = RegistroPasos(modo, emitir=cola.put, guardar=False)
+            salida["resultado"] = funcion(*args, registro=registro, **kwargs)
+        except BaseException as e:
+            salida["error"] = e
+        finally:
+            cola.put(fin)
+
+    threading.Thread(target=trabajar, daemon=True).start()
+    while True:
+        paso = cola.get()
+        if paso is fin:
+            break
+        yield paso
+
+    if "error" in salida:
+        raise salida["error"]
+    return salida["resultado"]
+
+
+def sumar_matrices(A, B, registro=None, modo="exacto"):
     """Suma dos matrices con pasos detallados"""
     if len(A) != len(B) or len(A[0]) != len(B[0]):
         raise ValueError("Las matrices deben tener las mismas dimensiones")
+    motor = _motor_flotante(modo)
+    if motor is not None:
+        return motor.sumar(A, B, registro)
+    A = _como_listas(A)
+    B = _como_listas(B)
 
-    pasos = []
+    reg = _como_registro(registro)
     resultado = []
 
-    pasos.append("Suma de matrices:")
-    pasos.append(f"A = \n{formatear_matriz(A)}")
-    pasos.append(f"B = \n{formatear_matriz(B)}")
-    pasos.append("")
+    if reg.activo:
+        reg.agregar("Suma de matrices:")
+        reg.agregar(f"A = \n{formatear_matriz(A)}")
+        reg.agregar(f"B = \n{formatear_matriz(B)}")
+        reg.agregar("")
 
     for i in range(len(A)):
         fila_resultado = []
         for j in range(len(A[0])):
             valor = A[i][j] + B[i][j]
             fila_resultado.append(valor)
-            pasos.append(
-                f"C[{i + 1},{j + 1}] = A[{i + 1},{j + 1}] + B[{i + 1},{j + 1}] = "
-                f"{A[i][j]} + {B[i][j]} = {valor}"
-            )
+            if reg.detalle:
+                reg.agregar(
+                    f"C[{i + 1},{j + 1}] = A[{i + 1},{j + 1}] + B[{i + 1},{j + 1}] = "
+                    f"{A[i][j]} + {B[i][j]} = {valor}"
+                )
         resultado.append(fila_resultado)
-        pasos.append("")
+        if reg.detalle:
+            reg.agregar("")
 
-    pasos.append("Resultado:")
-    pasos.append(formatear_matriz(resultado))
+    if reg.activo:
+        reg.agregar("Resultado:")
+        reg.agregar(formatear_matriz(resultado))
 
-    return resultado, pasos
+    return resultado, reg.pasos
 
 
-def multiplicar_matrices(A, B):
+def multiplicar_matrices(A, B, registro=None, modo="exacto"):
     """Multiplica dos matrices con pasos detallados"""
     if len(A[0]) != len(B):
         raise ValueError("El número de columnas de A debe igualar el número de filas de B")
-
-    pasos = []
-    resultado = [[Fraccion(0) for _ in range(len(B[0]))] for _ in range(len(A))]
-
-    pasos.append("Multiplicación de matrices:")
-    pasos.append(f"A ({len(A)}×{len(A[0])}) = \n{formatear_matriz(A)}")
-    pasos.append(f"B ({len(B)}×{len(B[0])}) = \n{formatear_matriz(B)}")
-    pasos.append("")
-
+    motor = _motor_flotante(modo)
+    if motor is not None:
+        return motor.multiplicar(A, B, registro)
+    # Las vistas transpuestas se leen tal cual, sin materializarlas
+    if not isinstance(A, VistaTranspuesta):
+        A = _como_listas(A)
+    if isinstance(B, VistaTranspuesta):
+        columnas_B = B.original
+    else:
+        B = _como_listas(B)
+        columnas_B = list(zip(*B))
+
+    reg = _como_registro(registro)
+    m, n, p = len(A), len(B), len(B[0])
+    detalle = reg.detalle and m * n * p <= MAX_PRODUCTOS_DETALLE
+
+    if reg.activo:
+        reg.agregar("Multiplicación de matrices:")
+        reg.agregar(f"A ({len(A)}×{len(A[0])}) = \n{formatear_matriz(A)}")
+        reg.agregar(f"B ({len(B)}×{len(B[0])}) = \n{formatear_matriz(B)}")
+        reg.agregar("")
+    if reg.detalle and not detalle:
+        reg.agregar(f"({m * n * p} productos: se omite el detalle de cada entrada)")
+        reg.agregar("")
+
+    if not detalle:
+        resultado = _producto(A, B, columnas_B)
+        if reg.activo:
+            reg.agregar("Resultado:")
+            reg.agregar(formatear_matriz(resultado))
+        return resultado, reg.pasos
+
+    resultado = [[Fraccion(0) for _ in range(p)] for _ in range(m)]
     for i in range(len(A)):
+        fila_A = A[i]
         for j in range(len(B[0])):
-            pasos.append(f"Calculando C[{i + 1},{j + 1}]:")
+            if reg.detalle:
+                reg.agregar(f"Calculando C[{i + 1},{j + 1}]:")
+            columna_B = columnas_B[j]
             suma_parcial = Fraccion(0)
             for k in range(len(B)):
-                producto = A[i][k] * B[k][j]
+                producto = fila_A[k] * columna_B[k]
                 suma_parcial = suma_parcial + producto
-                pasos.append(
-                    f"  + A[{i + 1},{k + 1}]×B[{k + 1},{j + 1}] = "
-                    f"{A[i][k]} × {B[k][j]} = {producto}"
-                )
+                if reg.detalle:
+                    reg.agregar(
+                        f"  + A[{i + 1},{k + 1}]×B[{k + 1},{j + 1}] = "
+                        f"{fila_A[k]} × {columna_B[k]} = {producto}"
+                    )
             resultado[i][j] = suma_parcial
-            pasos.append(f"  C[{i + 1},{j + 1}] = {suma_parcial}")
-            pasos.append("")
+            if reg.detalle:
+                reg.agregar(f"  C[{i + 1},{j + 1}] = {suma_parcial}")
+                reg.agregar("")
+
+    if reg.activo:
+        reg.agregar("Resultado:")
+        reg.agregar(formatear_matriz(resultado))
+
+    return resultado, reg.pasos
 
-    pasos.append("Resultado:")
-    pasos.append(formatear_matriz(resultado))
 
-    return resultado, pasos
+# Con más productos que esto, el registro "completo" no detalla cada entrada
+MAX_PRODUCTOS_DETALLE = 20 ** 3
+# Strassen-Winograd (solo con entradas enteras) si las tres dimensiones superan este valor
+UMBRAL_STRASSEN = 64
+# Ancho del bloque de columnas de B en el producto por bloques
+BLOQUE_PRODUCTO = 32
+
+
+def _producto(A, B, columnas_B):
+    """
+    A·B sin pasos. Si todas las entradas son enteras se multiplica con int
+    (Strassen-Winograd para operandos grandes) y se vuelve a Fraccion al
+    final; con fracciones, producto por bloques.
+    """
+    if isinstance(A, VistaTranspuesta):
+        A = [list(fila) for fila in A]
+    if not (_son_enteras(A) and _son_enteras(columnas_B)):
+        return _producto_bloques(A, columnas_B)
+    A = [[x.numerador for x in fila] for fila in A]
+    columnas_B = [[x.numerador for x in columna] for columna in columnas_B]
+    if min(len(A), len(B), len(columnas_B)) > UMBRAL_STRASSEN:
+        C = _strassen(A, [list(fila) for fila in zip(*columnas_B)], 0)
+    else:
+        C = _producto_bloques(A, columnas_B, 0)
+    return [[Fraccion(x) for x in fila] for fila in C]
+
+
+def _son_enteras(filas):
+    return all(x.denominador == 1 for fila in filas for x in fila)
+
+
+def _producto_bloques(A, columnas_B, cero=None):
+    """
+    Producto fila·columna recorriendo B por bloques de BLOQUE_PRODUCTO
+    columnas, que se reutilizan con todas las filas de A antes de pasar al
+    bloque siguiente.
+    """
+    m, p = len(A), len(columnas_B)
+    if cero is None:
+        cero = Fraccion(0)
+    C = [[cero] * p for _ in range(m)]
+    for j0 in range(0, p, BLOQUE_PRODUCTO):
+        bloque = range(j0, min(j0 + BLOQUE_PRODUCTO, p))
+        for i in range(m):
+            fila_A = A[i]
+            fila_C = C[i]
+            for j in bloque:
+                fila_C[j] = sum(map(operator.mul, fila_A, columnas_B[j]), cero)
+    return C
+
 
+def _sumar_bloques(X, Y):
+    return [[a + b for a, b in zip(x, y)] for x, y in zip(X, Y)]
 
-def multiplicar_escalar_matriz(escalar_str, A):
+
+def _restar_bloques(X, Y):
+    return [[a - b for a, b in zip(x, y)] for x, y in zip(X, Y)]
+
+
+def _strassen(A, B, cero=None):
+    """
+    Producto exacto por Strassen-Winograd (7 productos y 15 sumas de bloques
+    por nivel). Las dimensiones impares se completan con una fila o columna
+    de ceros; por debajo de UMBRAL_STRASSEN se usa el producto por bloques.
+    Con fracciones las sumas extra cuestan más de lo que ahorra; _producto
+    solo lo usa con enteros (cero=0).
+    """
+    m, n, p = len(A), len(B), len(B[0])
+    if min(m, n, p) <= UMBRAL_STRASSEN:
+        return _producto_bloques(A, list(zip(*B)), cero)
+
+    if cero is None:
+        cero = Fraccion(0)
+    if m % 2 or n % 2 or p % 2:
+        A2 = [fila + [cero] * (n % 2) for fila in A] + [[cero] * (n + n % 2)] * (m % 2)
+        B2 = [fila + [cero] * (p % 2) for fila in B] + [[cero] * (p + p % 2)] * (n % 2)
+        C = _strassen(A2, B2, cero)
+        return [fila[:p] for fila in C[:m]]
+
+    hm, hn, hp = m // 2, n // 2, p // 2
+    A11 = [fila[:hn] for fila in A[:hm]]
+    A12 = [fila[hn:] for fila in A[:hm]]
+    A21 = [fila[:hn] for fila in A[hm:]]
+    A22 = [fila[hn:] for fila in A[hm:]]
+    B11 = [fila[:hp] for fila in B[:hn]]
+    B12 = [fila[hp:] for fila in B[:hn]]
+    B21 = [fila[:hp] for fila in B[hn:]]
+    B22 = [fila[hp:] for fila in B[hn:]]
+
+    S1 = _sumar_bloques(A21, A22)
+    S2 = _restar_bloques(S1, A11)
+    S3 = _restar_bloques(A11, A21)
+    S4 = _restar_bloques(A12, S2)
+    T1 = _restar_bloques(B12, B11)
+    T2 = _restar_bloques(B22, T1)
+    T3 = _restar_bloques(B22, B12)
+    T4 = _restar_bloques(T2, B21)
+
+    P1 = _strassen(A11, B11, cero)
+    P2 = _strassen(A12, B21, cero)
+    P3 = _strassen(S4, B22, cero)
+    P4 = _strassen(A22, T4, cero)
+    P5 = _strassen(S1, T1, cero)
+    P6 = _strassen(S2, T2, cero)
+    P7 = _strassen(S3, T3, cero)
+
+    U2 = _sumar_bloques(P1, P6)
+    U3 = _sumar_bloques(U2, P7)
+    U4 = _sumar_bloques(U2, P5)
+    C11 = _sumar_bloques(P1, P2)
+    C12 = _sumar_bloques(U4, P3)
+    C21 = _restar_bloques(U3, P4)
+    C22 = _sumar_bloques(U3, P5)
+    return [x + y for x, y in zip(C11, C12)] + [x + y for x, y in zip(C21, C22)]
+
+
+def multiplicar_escalar_matriz(escalar_str, A, registro=None):
     """Multiplica escalar por matriz con pasos detallados"""
+    A = _como_listas(A)
     try:
         escalar = Fraccion(escalar_str)
     except Exception:
         raise ValueError(f"Escalar inválido: {escalar_str}")
 
-    pasos = []
+    reg = _como_registro(registro)
     resultado = []
 
-    pasos.append(f"Multiplicación escalar: {escalar} × A")
-    pasos.append(f"A = \n{formatear_matriz(A)}")
-    pasos.append("")
+    if reg.activo:
+        reg.agregar(f"Multiplicación escalar: {escalar} × A")
+        reg.agregar(f"A = \n{formatear_matriz(A)}")
+        reg.agregar("")
 
     for i in range(len(A)):
         fila_resultado = []
         for j in range(len(A[0])):
             valor = escalar * A[i][j]
             fila_resultado.append(valor)
-            pasos.append(f"B[{i + 1},{j + 1}] = {escalar} × {A[i][j]} = {valor}")
+            if reg.detalle:
+                reg.agregar(f"B[{i + 1},{j + 1}] = {escalar} × {A[i][j]} = {valor}")
         resultado.append(fila_resultado)
-        pasos.append("")
+        if reg.detalle:
+            reg.agregar("")
+
+    if reg.activo:
+        reg.agregar("Resultado:")
+        reg.agregar(formatear_matriz(resultado))
+
+    return resultado, reg.pasos
+
+
+def _escalar(valor, nombre):
+    try:
+        return valor if isinstance(valor, Fraccion) else Fraccion(valor)
+    except Exception:
+        raise ValueError(f"Escalar inválido para {nombre}: {valor}")
+
+
+def _termino(a, nombre):
+    """Texto de a·nombre para los pasos ("A", "-B", "3/2·C")."""
+    if a == 1:
+        return nombre
+    if a == -1:
+        return f"-{nombre}"
+    return f"{a}·{nombre}"
 
-    pasos.append("Resultado:")
-    pasos.append(formatear_matriz(resultado))
 
-    return resultado, pasos
+def _expresion(pares):
+    """Texto de Σ aₖ·nombreₖ a partir de pares (a, nombre)."""
+    return " + ".join(_termino(a, nombre) for a, nombre in pares).replace("+ -", "- ")
 
 
-def combinar_escalar_matrices(escalarA_str, A, escalarB_str, B, operador="+"):
+def _combinar(escalares, matrices):
+    """Σ αₖ·Mₖ en una sola pasada, sin matrices intermedias escaladas."""
+    m, n = len(matrices[0]), len(matrices[0][0])
+    uno, menos_uno = Fraccion(1), Fraccion(-1)
+    resultado = []
+    for i in range(m):
+        filas = [(a, M[i]) for a, M in zip(escalares, matrices)]
+        fila_resultado = []
+        for j in range(n):
+            acc = Fraccion(0)
+            for a, fila in filas:
+                x = fila[j]
+                if x.es_cero():
+                    continue
+                if a == uno:
+                    acc = acc + x
+                elif a == menos_uno:
+                    acc = acc - x
+                else:
+                    acc = acc + a * x
+            fila_resultado.append(acc)
+        resultado.append(fila_resultado)
+    return resultado
+
+
+def combinar_lineal(terminos, registro=None, nombres=None):
+    """
+    Calcula C = Σ αₖ·Mₖ en una sola pasada (sin materializar αₖ·Mₖ).
+
+    terminos: lista de (escalar, matriz); el escalar puede ser Fraccion, int
+    o texto ("3/2"). nombres: cómo llamar a las matrices en los pasos (por
+    defecto A, B, C, ...). Devuelve (matriz_resultado, pasos).
+    """
+    if not terminos:
+        raise ValueError("La combinación lineal necesita al menos un término")
+    nombres = nombres or [chr(ord("A") + k) for k in range(len(terminos))]
+    escalares = [_escalar(a, nombre) for (a, _), nombre in zip(terminos, nombres)]
+    matrices = [_como_listas(M) for _, M in terminos]
+    m, n = len(matrices[0]), len(matrices[0][0])
+    if any(len(M) != m or len(M[0]) != n for M in matrices):
+        raise ValueError("Las matrices de la combinación deben tener las mismas dimensiones")
+
+    reg = _como_registro(registro)
+    if reg.activo:
+        reg.agregar(f"Combinación lineal de matrices: {_expresion(zip(escalares, nombres))}")
+        for nombre, M in zip(nombres, matrices):
+            reg.agregar(f"{nombre} = \n{formatear_matriz(M)}")
+        reg.agregar("")
+
+    # Los términos con escalar 0 no aportan nada
+    activos = [k for k, a in enumerate(escalares) if not a.es_cero()] or [0]
+    resultado = _combinar([escalares[k] for k in activos], [matrices[k] for k in activos])
+
+    if reg.detalle and m * n * len(terminos) <= MAX_PRODUCTOS_DETALLE:
+        for i in range(m):
+            for j in range(n):
+                partes = " + ".join(f"{escalares[k]}·{matrices[k][i][j]}" for k in range(len(terminos))).replace("+ -", "- ")
+                reg.agregar(f"C[{i + 1},{j + 1}] = {partes} = {resultado[i][j]}")
+            reg.agregar("")
+    elif reg.detalle:
+        reg.agregar(f"({m * n} entradas: se omite el detalle de cada entrada)")
+        reg.agregar("")
+
+    if reg.activo:
+        reg.agregar("Resultado:")
+        reg.agregar(formatear_matriz(resultado))
+
+    return resultado, reg.pasos
+
+
+def combinar_escalar_matrices(escalarA_str, A, escalarB_str, B, operador="+", registro=None):
     """
     Calcula una combinación lineal de matrices del tipo:
         C = escalarA * A  +/-  escalarB * B
@@ -118,301 +482,822 @@ def combinar_escalar_matrices(escalarA_str, A, escalarB_str, B, operador="+"):
               "-" para escalarA*A - escalarB*B
     Devuelve (matriz_resultado, pasos)
     """
+    A = _como_listas(A)
+    B = _como_listas(B)
     # Validar dimensiones
     if len(A) != len(B) or len(A[0]) != len(B[0]):
         raise ValueError("Las matrices A y B deben tener las mismas dimensiones")
-
-    # Parsear escalares
-    try:
-        escalarA = Fraccion(escalarA_str)
-    except Exception:
-        raise ValueError(f"Escalar inválido para A: {escalarA_str}")
-
-    try:
-        escalarB = Fraccion(escalarB_str)
-    except Exception:
-        raise ValueError(f"Escalar inválido para B: {escalarB_str}")
-
+    escalarA = _escalar(escalarA_str, "A")
+    escalarB = _escalar(escalarB_str, "B")
     if operador not in ("+", "-"):
         raise ValueError("Operador inválido, use '+' o '-'")
+    if operador == "-":
+        escalarB = -escalarB
+    return combinar_lineal([(escalarA, A), (escalarB, B)], registro)
 
-    pasos = []
-    resultado = []
-
-    simbolo = "+" if operador == "+" else "-"
-    pasos.append(f"Combinación lineal de matrices: {escalarA}·A {simbolo} {escalarB}·B")
-    pasos.append(f"A = \n{formatear_matriz(A)}")
-    pasos.append(f"B = \n{formatear_matriz(B)}")
-    pasos.append("")
 
-    for i in range(len(A)):
-        fila_resultado = []
-        for j in range(len(A[0])):
-            prodA = escalarA * A[i][j]
-            prodB = escalarB * B[i][j]
-
-            if operador == "+":
-                valor = prodA + prodB
-                pasos.append(
-                    f"C[{i+1},{j+1}] = {escalarA}·A[{i+1},{j+1}] + {escalarB}·B[{i+1},{j+1}] = "
-                    f"{escalarA}·{A[i][j]} + {escalarB}·{B[i][j]} = {prodA} + {prodB} = {valor}"
-                )
+def combinar_productos(terminos, registro=None, nombres=None):
+    """
+    Calcula Σ αₖ·Aₖ·Xₖ, donde cada Xₖ es un vector columna (n×1) o un lote de
+    vectores (n×p, uno por columna).
+
+    Elige la forma más barata: los términos con la misma matriz A (mismo
+    contenido) se agrupan por distributividad, A·(αu + βv) en lugar de
+    α·Au + β·Av, así que cada A se multiplica una sola vez. En un término
+    suelto el escalar se aplica del lado más chico (a X o al resultado).
+    nombres: lista de pares (nombre de A, nombre de X) para los pasos; por
+    defecto A1, A2, ... (el mismo nombre si la matriz se repite) y x1, x2, ...
+    Devuelve (resultado, pasos).
+    """
+    if not terminos:
+        raise ValueError("La combinación necesita al menos un término")
+    terminos = [(a, _como_listas(A), _como_listas(X)) for a, A, X in terminos]
+    if not nombres:
+        nombres_A = {}
+        nombres = [(nombres_A.setdefault(clave_matriz(A), f"A{len(nombres_A) + 1}"), f"x{k + 1}")
+                   for k, (_, A, _) in enumerate(terminos)]
+    reg = _como_registro(registro)
+
+    # Agrupar por contenido de A, conservando el orden de aparición
+    escalares = [_escalar(a, nombre_X) for (a, _, _), (_, nombre_X) in zip(terminos, nombres)]
+    grupos = {}
+    for a, (_, A, X), (nombre_A, nombre_X) in zip(escalares, terminos, nombres):
+        if len(A[0]) != len(X):
+            raise ValueError(f"Dimensiones incompatibles: columnas de {nombre_A} deben ser igual a filas de {nombre_X}")
+        grupo = grupos.setdefault(clave_matriz(A), (A, nombre_A, []))
+        grupo[2].append((a, X, nombre_X))
+
+    if reg.activo:
+        formas = []
+        for A, nombre_A, miembros in grupos.values():
+            if len(miembros) == 1:
+                formas.append(_termino(miembros[0][0], f"{nombre_A}{miembros[0][2]}"))
             else:
-                valor = prodA - prodB
-                pasos.append(
-                    f"C[{i+1},{j+1}] = {escalarA}·A[{i+1},{j+1}] - {escalarB}·B[{i+1},{j+1}] = "
-                    f"{escalarA}·{A[i][j]} - {escalarB}·{B[i][j]} = {prodA} - {prodB} = {valor}"
-                )
-
-            fila_resultado.append(valor)
-        resultado.append(fila_resultado)
-        pasos.append("")
-
-    pasos.append("Resultado:")
-    pasos.append(formatear_matriz(resultado))
-
-    return resultado, pasos
+                formas.append(f"{nombre_A}({_expresion((a, nombre_X) for a, _, nombre_X in miembros)})")
+        reg.agregar(f"Operación: {_expresion((a, nA + nX) for a, (nA, nX) in zip(escalares, nombres))}")
+        if len(grupos) < len(terminos):
+            reg.agregar(f"Por distributividad se calcula {' + '.join(formas).replace('+ -', '- ')}: "
+                        f"{len(grupos)} multiplicación(es) en lugar de {len(terminos)}")
+        reg.agregar("")
+
+    parciales = []
+    for A, nombre_A, miembros in grupos.values():
+        if len(miembros) == 1 and len(A) < len(A[0]):
+            # Escalar el resultado (m×p) es más barato que escalar X (n×p)
+            a, X, nombre_X = miembros[0]
+            if reg.activo:
+                reg.agregar(f"Cálculo de {nombre_A}{nombre_X}:")
+            AX, _ = multiplicar_matrices(A, X, reg)
+            parciales.append((a, AX))
+            continue
+        if len(miembros) == 1 and miembros[0][0] == 1:
+            W, nombre_W = miembros[0][1], miembros[0][2]
+        else:
+            nombre_W = f"({_expresion((a, nombre_X) for a, _, nombre_X in miembros)})"
+            if reg.activo:
+                reg.agregar(f"Cálculo de {nombre_W}:")
+            W, _ = combinar_lineal([(a, X) for a, X, _ in miembros], reg, [nombre_X for _, _, nombre_X in miembros])
+            reg.agregar("")
+        if reg.activo:
+            reg.agregar(f"Cálculo de {nombre_A}{nombre_W}:")
+        AW, _ = multiplicar_matrices(A, W, reg)
+        parciales.append((Fraccion(1), AW))
+
+    if len(parciales) == 1 and parciales[0][0] == 1:
+        resultado = parciales[0][1]
+    else:
+        reg.agregar("")
+        reg.agregar("Suma de los productos:" if len(parciales) > 1 else "Escalar el producto:")
+        resultado, _ = combinar_lineal(parciales, reg, [f"P{k + 1}" for k in range(len(parciales))])
+    return resultado, reg.pasos
 
 
 # ====== Funciones extra para vectores y combinaciones lineales ======
 
-def sumar_vectores(u, v):
+def sumar_vectores(u, v, registro=None):
     """Suma dos 'vectores' (matrices del mismo tamaño) con pasos detallados."""
     if len(u) != len(v) or len(u[0]) != len(v[0]):
         raise ValueError("Los vectores deben tener las mismas dimensiones")
 
-    pasos = []
+    reg = _como_registro(registro)
     resultado = []
 
-    pasos.append("Suma de vectores (tratados como matrices):")
-    pasos.append(f"u = \n{formatear_matriz(u)}")
-    pasos.append(f"v = \n{formatear_matriz(v)}")
-    pasos.append("")
+    if reg.activo:
+        reg.agregar("Suma de vectores (tratados como matrices):")
+        reg.agregar(f"u = \n{formatear_matriz(u)}")
+        reg.agregar(f"v = \n{formatear_matriz(v)}")
+        reg.agregar("")
 
     for i in range(len(u)):
         fila_resultado = []
         for j in range(len(u[0])):
             valor = u[i][j] + v[i][j]
             fila_resultado.append(valor)
-            pasos.append(
-                f"w[{i + 1},{j + 1}] = u[{i + 1},{j + 1}] + v[{i + 1},{j + 1}] = "
-                f"{u[i][j]} + {v[i][j]} = {valor}"
-            )
+            if reg.detalle:
+                reg.agregar(
+                    f"w[{i + 1},{j + 1}] = u[{i + 1},{j + 1}] + v[{i + 1},{j + 1}] = "
+                    f"{u[i][j]} + {v[i][j]} = {valor}"
+                )
         resultado.append(fila_resultado)
-        pasos.append("")
+        if reg.detalle:
+            reg.agregar("")
 
-    pasos.append("Resultado de u + v:")
-    pasos.append(formatear_matriz(resultado))
+    if reg.activo:
+        reg.agregar("Resultado de u + v:")
+        reg.agregar(formatear_matriz(resultado))
 
-    return resultado, pasos
+    return resultado, reg.pasos
 
 
-def multiplicar_matriz_vector(A, x):
+def multiplicar_matriz_vector(A, x, registro=None):
     """Multiplica matriz A por 'vector' columna x con pasos detallados."""
+    A = _como_listas(A)
     if len(A[0]) != len(x):
         raise ValueError("Columnas de A deben igualar filas del vector")
 
-    pasos = []
-    pasos.append("Multiplicación A·x:")
-    pasos.append(f"A = \n{formatear_matriz(A)}")
-    pasos.append(f"x = \n{formatear_matriz(x)}")
-    pasos.append("")
+    reg = _como_registro(registro)
+    if reg.activo:
+        reg.agregar("Multiplicación A·x:")
+        reg.agregar(f"A = \n{formatear_matriz(A)}")
+        reg.agregar(f"x = \n{formatear_matriz(x)}")
+        reg.agregar("")
 
     resultado = []
     for i in range(len(A)):
         suma = Fraccion(0)
-        pasos.append(f"Fila {i+1}:")
+        if reg.detalle:
+            reg.agregar(f"Fila {i+1}:")
         for j in range(len(A[0])):
             prod = A[i][j] * x[j][0]
             suma = suma + prod
-            pasos.append(f"  {A[i][j]} × {x[j][0]} = {prod}")
-        pasos.append(f"  → y[{i+1}] = {suma}")
+            if reg.detalle:
+                reg.agregar(f"  {A[i][j]} × {x[j][0]} = {prod}")
+        if reg.detalle:
+            reg.agregar(f"  → y[{i+1}] = {suma}")
         resultado.append([suma])
-        pasos.append("")
+        if reg.detalle:
+            reg.agregar("")
+
+    if reg.activo:
+        reg.agregar("Resultado A·x:")
+        reg.agregar(formatear_matriz(resultado))
 
-    pasos.append("Resultado A·x:")
-    pasos.append(formatear_matriz(resultado))
+    return resultado, reg.pasos
 
-    return resultado, pasos
+
+def Au_mas_Av(A, u, v, registro=None):
+    """
+    Calcula Au + Av. Por distributividad se evalúa como A(u + v): una sola
+    multiplicación (ver A_por_u_mas_v). u y v pueden ser lotes n×p.
+    """
+    reg = _como_registro(registro)
+    if reg.activo:
+        reg.agregar("Operación: Au + Av")
+        reg.agregar("Por distributividad Au + Av = A(u + v): 1 multiplicación en lugar de 2")
+        reg.agregar("")
+    return _A_por_suma(A, u, v, reg)
+
+
+def A_por_u_mas_v(A, u, v, registro=None):
+    """Calcula A(u+v); u y v pueden ser vectores columna o lotes n×p."""
+    reg = _como_registro(registro)
+    if reg.activo:
+        reg.agregar("Operación: A(u + v)")
+        reg.agregar("")
+    return _A_por_suma(A, u, v, reg)
+
+
+def _A_por_suma(A, u, v, reg):
+    """Suma u + v y multiplica A una sola vez (lo comparten Au_mas_Av y A_por_u_mas_v)."""
+    A = _como_listas(A)
+    if len(A[0]) != len(_como_listas(u)):
+        raise ValueError("Dimensiones incompatibles: columnas de A deben ser igual a filas de u y v")
+    if reg.activo:
+        reg.agregar("Cálculo de (u + v):")
+    W, _ = combinar_lineal([(1, u), (1, v)], reg, ["u", "v"])
+    if reg.activo:
+        reg.agregar("")
+        reg.agregar("Cálculo de A(u + v):")
+    resultado, _ = multiplicar_matrices(A, W, reg)
+    return resultado, reg.pasos
 
 
-def Au_mas_Av(A, u, v):
-    """Calcula Au + Av con pasos detallados."""
-    Au, pasos1 = multiplicar_matriz_vector(A, u)
-    Av, pasos2 = multiplicar_matriz_vector(A, v)
-    suma, pasos3 = sumar_vectores(Au, Av)
+# ====== Resto de funciones tal como estaban ======
 
-    pasos = ["Operación: Au + Av", ""]
-    pasos.append("Cálculo de Au:")
-    pasos.extend(pasos1)
-    pasos.append("")
-    pasos.append("Cálculo de Av:")
-    pasos.extend(pasos2)
-    pasos.append("")
-    pasos.append("Suma Au + Av:")
-    pasos.extend(pasos3)
+class _ColumnaVista:
+    """Columna j de A vista como fila (la usa VistaTranspuesta)."""
+    __slots__ = ("_A", "_j")
 
-    return suma, pasos
+    def __init__(self, A, j):
+        self._A = A
+        self._j = j
 
+    def __len__(self):
+        return len(self._A)
 
-def A_por_u_mas_v(A, u, v):
-    """Calcula A(u+v) con pasos detallados."""
-    suma_uv, pasos1 = sumar_vectores(u, v)
-    R, pasos2 = multiplicar_matriz_vector(A, suma_uv)
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [fila[self._j] for fila in self._A[i]]
+        return self._A[i][self._j]
 
-    pasos = ["Operación: A(u + v)", ""]
-    pasos.append("Paso 1: Calcular u + v")
-    pasos.extend(pasos1)
-    pasos.append("")
-    pasos.append("Paso 2: Multiplicar A por (u+v)")
-    pasos.extend(pasos2)
+    def __iter__(self):
+        j = self._j
+        for fila in self._A:
+            yield fila[j]
 
-    return R, pasos
+    def __eq__(self, other):
+        return list(self) == list(other)
 
+    __hash__ = None
+
+
+class VistaTranspuesta:
+    """
+    Transpuesta de A sin copiar nada: T[i][j] lee A[j][i].
+    Se recorre e indexa como una lista de listas; a_listas() la materializa
+    cuando hace falta una copia (por ejemplo para modificarla).
+    """
+    __slots__ = ("original",)
+
+    def __init__(self, A):
+        self.original = A
+
+    def __len__(self):
+        return len(self.original[0]) if len(self.original) else 0
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [_ColumnaVista(self.original, j) for j in range(len(self))[i]]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Índice de fila fuera de rango")
+        return _ColumnaVista(self.original, i)
+
+    def __iter__(self):
+        for j in range(len(self)):
+            yield _ColumnaVista(self.original, j)
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def a_listas(self):
+        return [list(columna) for columna in zip(*self.original)]
 
-# ====== Resto de funciones tal como estaban ======
 
 def Transpuesta(A):
-    """Calcula la transpuesta de una matriz"""
+    """
+    Transpuesta de una matriz como vista (no copia los datos).
+    La transpuesta de una vista devuelve la matriz original.
+    """
+    if isinstance(A, VistaTranspuesta):
+        return A.original
+    if hasattr(A, "T") and hasattr(A, "a_listas"):
+        # MatrizRacional: su .T ya es una vista
+        return A.T
     if not A:
         return []
+    return VistaTranspuesta(A)
+
 
-    filas = len(A)
-    columnas = len(A[0])
+def eliminacion_bareiss(A, registro=None):
+    """
+    Eliminación de Bareiss (sin fracciones) hasta forma escalonada.
+
+    Las filas se escalan primero a enteros y luego cada actualización
+        F_i → (p·F_i − a·F_k) / p_anterior
+    usa división entera exacta, así que los números crecen como los menores
+    de A y no como los productos de denominadores.
+
+    Devuelve un dict con:
+        "escalonada": matriz escalonada de enteros
+        "rango": rango de A
+        "pivotes": lista de (fila, columna)
+        "escalas": escala de cada fila (en su posición final)
+        "signo": ±1 según el número de intercambios
+        "det": determinante (Fraccion) si A es cuadrada, si no None
+    Las explicaciones van a `registro` (por defecto no se genera texto).
+    """
+    reg = _como_registro(registro) if registro is not None else RegistroPasos("ninguno")
+    M, escalas = _filas_a_enteros(A)
+    m = len(M)
+    n = len(M[0]) if M else 0
+
+    if reg.detalle:
+        reg.agregar(f"Matriz inicial:\n{formatear_matriz(A)}")
+        escaladas = [(i, d) for i, d in enumerate(escalas) if d != 1]
+        for i, d in escaladas:
+            reg.agregar(f"Multiplicar fila {i + 1} por {d} para trabajar solo con enteros")
+        if escaladas:
+            reg.agregar(f"Matriz entera:\n{formatear_matriz(M)}")
+        reg.agregar("")
+
+    signo = 1
+    prev = 1
+    fila = 0
+    pivotes = []
+    for col in range(n):
+        if fila == m:
+            break
+
+        # Encontrar pivote
+        p = fila
+        while p < m and M[p][col] == 0:
+            p += 1
+        if p == m:
+            if reg.detalle:
+                reg.agregar(f"Columna {col + 1} sin pivote → se omite")
+            continue
+
+        if p != fila:
+            M[fila], M[p] = M[p], M[fila]
+            escalas[fila], escalas[p] = escalas[p], escalas[fila]
+            signo = -signo
+            if reg.detalle:
+                reg.agregar(f"Intercambio fila {fila + 1} con fila {p + 1} → det = -det")
+
+        piv_fila = M[fila]
+        piv = piv_fila[col]
+        pivotes.append((fila, col))
+        if reg.detalle:
+            reg.agregar(f"Pivote M[{fila + 1},{col + 1}] = {piv} (pivote anterior = {prev})")
+
+        for i in range(fila + 1, m):
+            Fi = M[i]
+            a = Fi[col]
+            if a == 0:
+                if piv != prev:
+                    for j in range(col + 1, n):
+                        Fi[j] = Fi[j] * piv // prev
+                    if reg.detalle:
+                        reg.agregar(f"F{i + 1} → ({piv}·F{i + 1}) / {prev}")
+                continue
+            for j in range(col + 1, n):
+                Fi[j] = (piv * Fi[j] - a * piv_fila[j]) // prev
+            Fi[col] = 0
+            if reg.detalle:
+                reg.agregar(f"F{i + 1} → ({piv}·F{i + 1} − ({a})·F{fila + 1}) / {prev}")
+
+        prev = piv
+        fila += 1
+        if reg.detalle:
+            reg.agregar(f"Matriz actual:\n{formatear_matriz(M)}")
+            reg.agregar("")
+
+    rango = fila
+    det = None
+    if m == n:
+        if rango < n:
+            det = Fraccion(0)
+        else:
+            producto_escalas = 1
+            for d in escalas:
+                producto_escalas *= d
+            det = Fraccion(signo * M[n - 1][n - 1], producto_escalas)
+        if reg.activo:
+            if rango < n:
+                reg.agregar("Fila de ceros encontrada → det = 0")
+            elif any(d != 1 for d in escalas):
+                reg.agregar(f"det = ({'+' if signo > 0 else '-'}1) × {M[n - 1][n - 1]} / "
+                             f"{' × '.join(str(d) for d in escalas)} (deshacer escalas) = {det}")
+            else:
+                reg.agregar(f"det = ({'+' if signo > 0 else '-'}1) × último pivote {M[n - 1][n - 1]} = {det}")
 
-    transpuesta = [[Fraccion(0) for _ in range(filas)] for _ in range(columnas)]
+    return {
+        "escalonada": M,
+        "rango": rango,
+        "pivotes": pivotes,
+        "escalas": escalas,
+        "signo": signo,
+        "det": det,
+    }
 
-    for i in range(filas):
-        for j in range(columnas):
-            transpuesta[j][i] = A[i][j]
 
-    return transpuesta
+def _escalonada_fracciones(info):
+    """
+    Convierte la escalonada entera de Bareiss en la de Gauss (en Fraccion):
+    U[k] = B[k] / (pivote anterior · escala de la fila).
+    """
+    M = info["escalonada"]
+    U = []
+    prev = 1
+    for k, fila in enumerate(M):
+        if k < len(info["pivotes"]):
+            div = prev * info["escalas"][k]
+            U.append([Fraccion(x, div) for x in fila])
+            prev = fila[info["pivotes"][k][1]]
+        else:
+            U.append([Fraccion(0) for _ in fila])
+    return U
 
 
-def determinante_matriz(A):
-    """Calcula determinante por eliminación gaussiana"""
+def determinante_matriz(A, registro=None, modo="exacto"):
+    """Calcula determinante por eliminación de Bareiss (sin fracciones)"""
     if len(A) != len(A[0]):
         raise ValueError("La matriz debe ser cuadrada")
+    motor = _motor_flotante(modo)
+    if motor is not None:
+        return motor.determinante(A, registro)
 
     n = len(A)
-    M = copy.deepcopy(A)
-    det = Fraccion(1)
-    pasos = []
+    reg = _como_registro(registro)
+    reg.agregar(f"Cálculo del determinante de matriz {n}×{n} (Bareiss, sin fracciones)")
+
+    det = eliminacion_bareiss(A, reg)["det"]
+
+    reg.agregar(f"Determinante final: {det}")
+    return det, reg.pasos
+
+
+def rango_matriz(A, registro=None, modo="exacto"):
+    """Calcula el rango de A (m×n) por eliminación de Bareiss"""
+    motor = _motor_flotante(modo)
+    if motor is not None:
+        return motor.rango(A, registro)
+    reg = _como_registro(registro)
+    reg.agregar(f"Cálculo del rango de matriz {len(A)}×{len(A[0]) if A else 0} (Bareiss)")
+    rango = eliminacion_bareiss(A, reg)["rango"]
+    reg.agregar(f"Rango = número de pivotes = {rango}")
+    return rango, reg.pasos
+
+
+# ====== Determinante y rango modulares (varios primos + TCR) ======
+
+# Primos menores que 2³¹: el producto de dos residuos entra en un int64
+LIMITE_PRIMOS = 2 ** 31
+_primos = []
+
+
+def _es_primo(n):
+    """Miller-Rabin determinista para n < 3.4·10¹⁴ (bases 2, 3, 5, 7, 11, 13, 17)."""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 11, 13, 17):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 3, 5, 7, 11, 13, 17):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
 
-    pasos.append(f"Cálculo del determinante de matriz {n}×{n}")
-    pasos.append(f"Matriz inicial:\n{formatear_matriz(M)}")
-    pasos.append("")
 
-    for i in range(n):
-        # Encontrar pivote
-        pivote = i
-        while pivote < n and M[pivote][i].es_cero():
-            pivote += 1
+def _primo(k):
+    """k-ésimo primo (desde 0) bajando desde LIMITE_PRIMOS; se guardan los ya hallados."""
+    candidato = _primos[-1] - 2 if _primos else LIMITE_PRIMOS - 1
+    while len(_primos) <= k:
+        if _es_primo(candidato):
+            _primos.append(candidato)
+        candidato -= 2
+    return _primos[k]
 
-        if pivote == n:
-            det = Fraccion(0)
-            pasos.append("Fila de ceros encontrada → det = 0")
-            break
 
-        if pivote != i:
-            M[i], M[pivote] = M[pivote], M[i]
-            det = det * Fraccion(-1)
-            pasos.append(f"Intercambio fila {i + 1} con fila {pivote + 1} → det = -det")
-            pasos.append(f"Matriz después del intercambio:\n{formatear_matriz(M)}")
+def _cota_hadamard(M):
+    """Cota de |det| de cualquier menor cuadrado de M: producto de las normas de las filas."""
+    cota = 1
+    for fila in M:
+        cota *= max(1, math.isqrt(sum(x * x for x in fila)) + 1)
+    return cota
 
-        # Usar fila i para eliminar
-        for j in range(i + 1, n):
-            if not M[j][i].es_cero():
-                factor = M[j][i] / M[i][i]
-                pasos.append(f"Eliminar elemento ({j + 1},{i + 1}) usando factor {factor}")
 
-                for k in range(i, n):
-                    M[j][k] = M[j][k] - factor * M[i][i]
+def _eliminar_modulo(M, p):
+    """
+    Eliminación de M (enteros) módulo el primo p.
+    Devuelve (rango, det mod p); det solo tiene sentido si M es cuadrada.
+    """
+    m = len(M)
+    n = len(M[0]) if M else 0
+    det = 1
+    fila = 0
+    if np is not None:
+        R = np.array([[x % p for x in f] for f in M], dtype=np.int64)
+        for col in range(n):
+            if fila == m:
+                break
+            no_nulos = np.flatnonzero(R[fila:, col])
+            if no_nulos.size == 0:
+                det = 0
+                continue
+            piv = fila + int(no_nulos[0])
+            if piv != fila:
+                R[[fila, piv]] = R[[piv, fila]]
+                det = -det
+            pivote = int(R[fila, col])
+            det = det * pivote % p
+            inv = pow(pivote, p - 2, p)
+            factores = R[fila + 1:, col] * inv % p
+            R[fila + 1:, col:] = (R[fila + 1:, col:] - np.outer(factores, R[fila, col:]) % p) % p
+            fila += 1
+    else:
+        R = [[x % p for x in f] for f in M]
+        for col in range(n):
+            if fila == m:
+                break
+            piv = next((i for i in range(fila, m) if R[i][col]), None)
+            if piv is None:
+                det = 0
+                continue
+            if piv != fila:
+                R[fila], R[piv] = R[piv], R[fila]
+                det = -det
+            pivote = R[fila][col]
+            det = det * pivote % p
+            inv = pow(pivote, p - 2, p)
+            fp = R[fila]
+            for i in range(fila + 1, m):
+                f = R[i][col] * inv % p
+                if f:
+                    Fi = R[i]
+                    for j in range(col, n):
+                        Fi[j] = (Fi[j] - f * fp[j]) % p
+            fila += 1
+    if fila < m:
+        det = 0
+    return fila, det % p
+
+
+def determinante_modular(A, registro=None):
+    """
+    Determinante exacto por aritmética modular: se elimina módulo varios
+    primos menores que 2³¹ (con NumPy si está instalado) y los residuos se
+    combinan con el Teorema Chino del Resto hasta superar dos veces la cota
+    de Hadamard, así que el resultado es exacto. Conviene para matrices
+    grandes, donde los enteros de Bareiss crecen mucho.
+    """
+    n = len(A)
+    if n == 0 or len(A[0]) != n:
+        raise ValueError("La matriz debe ser cuadrada")
 
-        det = det * M[i][i]
-        pasos.append(f"Multiplicar det por pivote M[{i + 1},{i + 1}] = {M[i][i]}")
-        pasos.append(f"det parcial = {det}")
-        pasos.append(f"Matriz actual:\n{formatear_matriz(M)}")
-        pasos.append("")
+    reg = _como_registro(registro)
+    reg.agregar(f"Cálculo del determinante de matriz {n}×{n} (modular, Teorema Chino del Resto)")
+
+    M, escalas = _filas_a_enteros(A)
+    producto_escalas = 1
+    for d in escalas:
+        producto_escalas *= d
+    if reg.detalle and producto_escalas != 1:
+        reg.agregar(f"Filas escaladas a enteros: det(A) = det(M) / {producto_escalas}")
+
+    cota = 2 * _cota_hadamard(M)
+    if reg.activo:
+        reg.agregar(f"Cota de Hadamard: |det| < 2^{cota.bit_length() - 1}")
+
+    # Teorema Chino del Resto incremental: det ≡ r (mod modulo)
+    r, modulo = 0, 1
+    k = 0
+    while modulo <= cota:
+        p = _primo(k)
+        _, d = _eliminar_modulo(M, p)
+        # r' ≡ r (mod modulo) y r' ≡ d (mod p)
+        t = (d - r) * pow(modulo, -1, p) % p
+        r += modulo * t
+        modulo *= p
+        k += 1
+        if reg.detalle:
+            reg.agregar(f"det mod {p} = {d}")
+    if r > modulo // 2:
+        r -= modulo
+
+    det = Fraccion(r, producto_escalas)
+    reg.agregar(f"Primos usados: {k}")
+    reg.agregar(f"Determinante final: {det}")
+    return det, reg.pasos
+
+
+def rango_modular(A, registro=None):
+    """
+    Rango exacto por aritmética modular. El rango módulo p nunca supera al
+    rango sobre los racionales y coincide salvo que p divida a todos los
+    menores máximos no nulos; como esos menores están acotados por Hadamard,
+    basta con primos cuyo producto supere la cota (y se corta antes si se
+    alcanza el rango máximo posible).
+    """
+    m = len(A)
+    n = len(A[0]) if A else 0
+    reg = _como_registro(registro)
+    reg.agregar(f"Cálculo del rango de matriz {m}×{n} (modular)")
 
-    pasos.append(f"Determinante final: {det}")
-    return det, pasos
+    M, _ = _filas_a_enteros(A)
+    cota = _cota_hadamard(M)
+    rango, modulo, k = 0, 1, 0
+    while modulo <= cota and rango < min(m, n):
+        p = _primo(k)
+        r, _ = _eliminar_modulo(M, p)
+        rango = max(rango, r)
+        modulo *= p
+        k += 1
+        if reg.detalle:
+            reg.agregar(f"rango mod {p} = {r}")
 
+    reg.agregar(f"Rango = {rango}")
+    return rango, reg.pasos
 
-def determinante_cofactores(A, prefer="auto"):
-    """Calcula determinante por método de cofactores"""
-    n = len(A)
 
-    if n == 1:
-        return A[0][0], ["Matriz 1×1 → det = A[1,1] = " + str(A[0][0])]
+# Máximo de menores guardados en la caché de cofactores
+MAX_CACHE_COFACTORES = 200_000
+
 
-    if n == 2:
-        det = A[0][0] * A[1][1] - A[0][1] * A[1][0]
+def determinante_cofactores(A, prefer="auto", registro=None, max_cache=MAX_CACHE_COFACTORES,
+                            paralelo=False, profundidad_paralela=1, procesos=None):
+    """
+    Calcula determinante por método de cofactores (desarrollo de Laplace).
+
+    prefer: "fila0" desarrolla siempre por la primera fila, "col0" por la
+            primera columna y "auto" por la fila o columna con más ceros.
+    registro: RegistroPasos o modo; con "ninguno" no se genera texto
+              (útil para n grande).
+    max_cache: cantidad máxima de menores memorizados.
+    paralelo: reparte los menores que quedan a `profundidad_paralela` niveles
+              del desarrollo entre `procesos` procesos (por defecto, uno por
+              núcleo). El resultado es el mismo que en serie. Los pasos
+              detallados de cada menor se generan en serie, así que
+              paralelo=True necesita registro "resumen" o "ninguno" (con
+              "completo", que es el valor por defecto, lanza ValueError).
+
+    Cada menor queda identificado por las filas y columnas que le quedan
+    (máscaras de bits), así que se calcula una sola vez: O(n·2ⁿ) en lugar
+    de O(n!). Cada proceso tiene su propia caché, así que el modo paralelo
+    rinde cuando la caché no alcanza (max_cache chico frente a 2ⁿ).
+    """
+    A = _como_listas(A)
+    n = len(A)
+    if n == 0 or len(A[0]) != n:
+        raise ValueError("La matriz debe ser cuadrada")
+    if prefer not in ("auto", "fila0", "col0"):
+        raise ValueError("Preferencia inválida, use 'auto', 'fila0' o 'col0'")
+
+    reg = _como_registro(registro)
+    if paralelo and reg.detalle:
+        raise ValueError("El modo paralelo no genera pasos detallados: use registro 'resumen' o 'ninguno'")
+    cache = {}
+    if paralelo and n - profundidad_paralela > 2:
+        _cofactores_en_paralelo(A, prefer, cache, max_cache, profundidad_paralela, procesos)
+    det, pasos = _cofactores(A, tuple(range(n)), tuple(range(n)), prefer, cache, max_cache, reg.detalle)
+    if reg.detalle:
+        reg.extender(pasos)
+    elif reg.activo:
+        reg.agregar(f"Determinante {n}×{n} por cofactores (desarrollo de Laplace)")
+        reg.agregar(f"Determinante final: {det}")
+    return det, reg.pasos
+
+
+def _elegir_linea(A, filas, cols, prefer):
+    """Devuelve ("fila" | "col", índice local) de la línea por la que se desarrolla."""
+    if prefer == "fila0":
+        return "fila", 0
+    if prefer == "col0":
+        return "col", 0
+
+    fila_ceros = [sum(1 for j in cols if A[i][j].es_cero()) for i in filas]
+    col_ceros = [sum(1 for i in filas if A[i][j].es_cero()) for j in cols]
+    if max(fila_ceros) >= max(col_ceros):
+        return "fila", fila_ceros.index(max(fila_ceros))
+    return "col", col_ceros.index(max(col_ceros))
+
+
+def _cofactores(A, filas, cols, prefer, cache, max_cache, con_pasos):
+    """Determinante del menor de A formado por `filas` × `cols`."""
+    k = len(filas)
+
+    if k == 1:
+        a = A[filas[0]][cols[0]]
+        return a, (["Matriz 1×1 → det = A[1,1] = " + str(a)] if con_pasos else [])
+
+    if k == 2:
+        (i0, i1), (j0, j1) = filas, cols
+        det = A[i0][j0] * A[i1][j1] - A[i0][j1] * A[i1][j0]
+        if not con_pasos:
+            return det, []
         pasos = [
             "Matriz 2×2:",
-            f"det = ({A[0][0]})×({A[1][1]}) - ({A[0][1]})×({A[1][0]})",
-            f"det = {A[0][0] * A[1][1]} - {A[0][1] * A[1][0]}",
+            f"det = ({A[i0][j0]})×({A[i1][j1]}) - ({A[i0][j1]})×({A[i1][j0]})",
+            f"det = {A[i0][j0] * A[i1][j1]} - {A[i0][j1] * A[i1][j0]}",
             f"det = {det}"
         ]
         return det, pasos
 
-    pasos = []
-    pasos.append(f"Calculando determinante {n}×{n} por cofactores")
-    pasos.append(f"Matriz:\n{formatear_matriz(A)}")
+    clave = (sum(1 << i for i in filas), sum(1 << j for j in cols))
+    det = cache.get(clave)
+    if det is not None:
+        return det, ([f"Menor ya calculado antes → det = {det}"] if con_pasos else [])
 
-    # Elegir fila/columna con más ceros
-    if prefer == "auto":
-        fila_ceros = [sum(1 for x in fila if x.es_cero()) for fila in A]
-        col_ceros = [sum(1 for i in range(n) if A[i][j].es_cero()) for j in range(n)]
+    pasos = []
+    if con_pasos:
+        pasos.append(f"Calculando determinante {k}×{k} por cofactores")
+        pasos.append(f"Matriz:\n{formatear_matriz([[A[i][j] for j in cols] for i in filas])}")
 
-        if max(fila_ceros) >= max(col_ceros):
-            prefer = "fila0"
-            fila = fila_ceros.index(max(fila_ceros))
-        else:
-            prefer = "col0"
-            col = col_ceros.index(max(col_ceros))
+    tipo, r = _elegir_linea(A, filas, cols, prefer)
+    if con_pasos:
+        pasos.append(f"Desarrollando por {'fila' if tipo == 'fila' else 'columna'} {r + 1}")
 
     det = Fraccion(0)
-    if prefer == "fila0":
-        fila = 0  # Simplificación: usar primera fila
-        pasos.append(f"Desarrollando por fila {fila + 1}")
+    for c in range(k):
+        # (fila, col) locales del elemento que se desarrolla
+        fi, cj = (r, c) if tipo == "fila" else (c, r)
+        elemento = A[filas[fi]][cols[cj]]
+        if elemento.es_cero():
+            continue
+
+        signo = Fraccion(1) if (fi + cj) % 2 == 0 else Fraccion(-1)
+        sub_filas = filas[:fi] + filas[fi + 1:]
+        sub_cols = cols[:cj] + cols[cj + 1:]
+        cofactor_det, cofactor_pasos = _cofactores(A, sub_filas, sub_cols, prefer,
+                                                   cache, max_cache, con_pasos)
+        termino = signo * elemento * cofactor_det
+        det = det + termino
+
+        if con_pasos:
+            menor = [[A[i][j] for j in sub_cols] for i in sub_filas]
+            pasos.append(f"Término ({fi + 1},{cj + 1}): signo={signo}, elemento={elemento}")
+            pasos.append(f"Menor:\n{formatear_matriz(menor)}")
+            pasos.extend(["  " + p for p in cofactor_pasos])
+            pasos.append(f"cofactor = {signo} × {elemento} × {cofactor_det} = {termino}")
+            pasos.append(f"Suma parcial: {det}")
+
+    if len(cache) < max_cache:
+        cache[clave] = det
+
+    if con_pasos:
+        pasos.append(f"Determinante final: {det}")
+    return det, pasos
 
-        for j in range(n):
-            if not A[fila][j].es_cero():
-                signo = Fraccion(1) if (fila + j) % 2 == 0 else Fraccion(-1)
-                menor = _submatriz(A, fila, j)
-                cofactor_det, cofactor_pasos = determinante_cofactores(menor, prefer)
-                termino = signo * A[fila][j] * cofactor_det
 
-                pasos.append(f"Término ({fila + 1},{j + 1}): signo={signo}, elemento={A[fila][j]}")
-                pasos.append(f"Menor:\n{formatear_matriz(menor)}")
-                pasos.extend(["  " + p for p in cofactor_pasos])
-                pasos.append(f"cofactor = {signo} × {A[fila][j]} × {cofactor_det} = {termino}")
+def _frontera_cofactores(A, filas, cols, prefer, profundidad, frontera):
+    """Menores (filas, cols) no nulos que aparecen a `profundidad` niveles del desarrollo."""
+    k = len(filas)
+    if profundidad == 0 or k <= 2:
+        if k > 2:
+            frontera.setdefault((filas, cols), None)
+        return
+    tipo, r = _elegir_linea(A, filas, cols, prefer)
+    for c in range(k):
+        fi, cj = (r, c) if tipo == "fila" else (c, r)
+        if A[filas[fi]][cols[cj]].es_cero():
+            continue
+        _frontera_cofactores(A, filas[:fi] + filas[fi + 1:], cols[:cj] + cols[cj + 1:],
+                             prefer, profundidad - 1, frontera)
 
-                det = det + termino
-                pasos.append(f"Suma parcial: {det}")
 
-    pasos.append(f"Determinante final: {det}")
-    return det, pasos
+# Estado de cada proceso del modo paralelo (lo carga _iniciar_proceso_cofactores)
+_estado_proceso_cofactores = {}
+
 
+def _iniciar_proceso_cofactores(pares, prefer, max_cache):
+    _estado_proceso_cofactores["A"] = [[Fraccion(num, den) for num, den in fila] for fila in pares]
+    _estado_proceso_cofactores["prefer"] = prefer
+    _estado_proceso_cofactores["max_cache"] = max_cache
+    _estado_proceso_cofactores["cache"] = {}
 
-def _submatriz(A, fila_omitir, col_omitir):
-    """Crea submatriz omitiendo fila y columna dadas"""
-    return [
-        [A[i][j] for j in range(len(A)) if j != col_omitir]
-        for i in range(len(A)) if i != fila_omitir
-    ]
 
+def _menor_en_proceso(menor):
+    filas, cols = menor
+    e = _estado_proceso_cofactores
+    det, _ = _cofactores(e["A"], filas, cols, e["prefer"], e["cache"], e["max_cache"], False)
+    return int(det.numerador), int(det.denominador)
 
-def determinante_sarrus(A):
+
+def _cofactores_en_paralelo(A, prefer, cache, max_cache, profundidad, procesos):
+    """
+    Calcula en un ProcessPoolExecutor los menores de la frontera y los deja en
+    `cache`, para que el desarrollo en serie los tome de ahí. La matriz viaja
+    una sola vez por proceso y cada Fraccion como par (num, den) de int.
+    """
+    n = len(A)
+    frontera = {}
+    _frontera_cofactores(A, tuple(range(n)), tuple(range(n)), prefer, profundidad, frontera)
+    if not frontera:
+        return
+    pares = [[(int(Fraccion(x).numerador), int(Fraccion(x).denominador)) for x in fila] for fila in A]
+    menores = list(frontera)
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso_cofactores,
+                             initargs=(pares, prefer, max_cache)) as pool:
+        for (filas, cols), (num, den) in zip(menores, pool.map(_menor_en_proceso, menores)):
+            cache[(sum(1 << i for i in filas), sum(1 << j for j in cols))] = Fraccion(num, den)
+
+
+def determinante_sarrus(A, registro=None):
     """Calcula determinante por regla de Sarrus (solo 3x3)"""
+    A = _como_listas(A)
     n = len(A)
     if n != 3:
         raise ValueError("La regla de Sarrus solo aplica para matrices 3×3")
 
-    pasos = []
-    pasos.append("Regla de Sarrus para matriz 3×3")
-    pasos.append(f"Matriz:\n{formatear_matriz(A)}")
+    reg = _como_registro(registro)
+    reg.agregar("Regla de Sarrus para matriz 3×3")
+    if reg.activo:
+        reg.agregar(f"Matriz:\n{formatear_matriz(A)}")
 
     # Términos positivos (diagonales principales)
     pos1 = A[0][0] * A[1][1] * A[2][2]
@@ -426,127 +1311,165 @@ def determinante_sarrus(A):
 
     det = pos1 + pos2 + pos3 - neg1 - neg2 - neg3
 
-    pasos.append("Términos positivos:")
-    pasos.append(f"  A₁₁×A₂₂×A₃₃ = {A[0][0]}×{A[1][1]}×{A[2][2]} = {pos1}")
-    pasos.append(f"  A₁₂×A₂₃×A₃₁ = {A[0][1]}×{A[1][2]}×{A[2][0]} = {pos2}")
-    pasos.append(f"  A₁₃×A₂₁×A₃₂ = {A[0][2]}×{A[1][0]}×{A[2][1]} = {pos3}")
+    if not reg.detalle:
+        reg.agregar(f"det = {det}")
+        return det, reg.pasos
 
-    pasos.append("Términos negativos:")
-    pasos.append(f"  A₁₃×A₂₂×A₃₁ = {A[0][2]}×{A[1][1]}×{A[2][0]} = {neg1}")
-    pasos.append(f"  A₁₁×A₂₃×A₃₂ = {A[0][0]}×{A[1][2]}×{A[2][1]} = {neg2}")
-    pasos.append(f"  A₁₂×A₂₁×A₃₃ = {A[0][1]}×{A[1][0]}×{A[2][2]} = {neg3}")
+    reg.agregar("Términos positivos:")
+    reg.agregar(f"  A₁₁×A₂₂×A₃₃ = {A[0][0]}×{A[1][1]}×{A[2][2]} = {pos1}")
+    reg.agregar(f"  A₁₂×A₂₃×A₃₁ = {A[0][1]}×{A[1][2]}×{A[2][0]} = {pos2}")
+    reg.agregar(f"  A₁₃×A₂₁×A₃₂ = {A[0][2]}×{A[1][0]}×{A[2][1]} = {pos3}")
 
-    pasos.append(f"det = ({pos1} + {pos2} + {pos3}) - ({neg1} + {neg2} + {neg3})")
-    pasos.append(f"det = {pos1 + pos2 + pos3} - {neg1 + neg2 + neg3}")
-    pasos.append(f"det = {det}")
+    reg.agregar("Términos negativos:")
+    reg.agregar(f"  A₁₃×A₂₂×A₃₁ = {A[0][2]}×{A[1][1]}×{A[2][0]} = {neg1}")
+    reg.agregar(f"  A₁₁×A₂₃×A₃₂ = {A[0][0]}×{A[1][2]}×{A[2][1]} = {neg2}")
+    reg.agregar(f"  A₁₂×A₂₁×A₃₃ = {A[0][1]}×{A[1][0]}×{A[2][2]} = {neg3}")
 
-    return det, pasos
-
-
-def comprobar_invertibilidad(A):
-    """Comprueba si una matriz es invertible usando Gauss"""
-    n = len(A)
-    M = copy.deepcopy(A)
-    pasos = []
-    pivotes = []
+    reg.agregar(f"det = ({pos1} + {pos2} + {pos3}) - ({neg1} + {neg2} + {neg3})")
+    reg.agregar(f"det = {pos1 + pos2 + pos3} - {neg1 + neg2 + neg3}")
+    reg.agregar(f"det = {det}")
 
-    pasos.append("Comprobando invertibilidad por eliminación Gaussiana")
-    pasos.append(f"Matriz {n}×{n}:\n{formatear_matriz(M)}")
+    return det, reg.pasos
 
-    for i in range(n):
-        # Buscar pivote
-        pivote = i
-        while pivote < n and M[pivote][i].es_cero():
-            pivote += 1
 
-        if pivote == n:
-            pasos.append(f"No se encontró pivote en columna {i + 1} → matriz no invertible")
-            return False, M, pasos, pivotes, Fraccion(0)
+def comprobar_invertibilidad(A, registro=None):
+    """Comprueba si una matriz es invertible usando eliminación de Bareiss"""
+    A = _como_listas(A)
+    n = len(A)
+    reg = _como_registro(registro)
 
-        if pivote != i:
-            M[i], M[pivote] = M[pivote], M[i]
-            pasos.append(f"Intercambio fila {i + 1} con fila {pivote + 1}")
+    reg.agregar("Comprobando invertibilidad por eliminación Gaussiana (Bareiss, sin fracciones)")
+    reg.agregar(f"Matriz {n}×{n}")
 
-        pivotes.append((i, i))
+    info = eliminacion_bareiss(A, reg)
+    M = _escalonada_fracciones(info)
+    pivotes = info["pivotes"]
 
-        # Eliminar
-        for j in range(i + 1, n):
-            if not M[j][i].es_cero():
-                factor = M[j][i] / M[i][i]
-                pasos.append(f"Eliminar fila {j + 1} usando factor {factor}")
+    if info["rango"] < n:
+        col = next((j for j, (_, c) in enumerate(pivotes) if c != j), len(pivotes))
+        reg.agregar(f"No se encontró pivote en columna {col + 1} → matriz no invertible")
+        return False, M, reg.pasos, pivotes, Fraccion(0)
 
-                for k in range(i, n):
-                    M[j][k] = M[j][k] - factor * M[i][k]
+    det = info["det"]
+    if reg.detalle:
+        reg.agregar(f"Matriz triangular superior obtenida:\n{formatear_matriz(M)}")
+    reg.agregar(f"Producto de pivotes = {det}")
+    reg.agregar("Matriz ES invertible (rank = n)")
 
-        pasos.append(f"Matriz después de columna {i + 1}:\n{formatear_matriz(M)}")
+    return True, M, reg.pasos, pivotes, det
 
-    # Calcular determinante aproximado (producto de pivotes)
-    det = Fraccion(1)
-    for i in range(n):
-        det = det * M[i][i]
 
-    pasos.append("Matriz triangular superior obtenida")
-    pasos.append(f"Producto de pivotes ≈ {det}")
-    pasos.append("Matriz ES invertible (rank = n)")
+def regla_cramer(A, b, registro=None):
+    """
+    Resuelve A x = b con la Regla de Cramer factorizando A una sola vez.
+    Como x_i = det(A_i(b)) / det(A), cada det(A_i(b)) sale de det(A)·x_i,
+    así que basta la LU de A y una resolución en vez de n+1 determinantes.
+    Devuelve (solución: list[Fraccion], pasos: list[str])
+    """
+    A = _como_listas(A)
+    n = len(A)
+    if n == 0 or any(len(fila) != n for fila in A):
+        raise ValueError("La matriz A debe ser cuadrada")
+    if len(b) != n:
+        raise ValueError("El vector b debe tener la misma dimensión que A")
+
+    reg = _como_registro(registro)
+
+    # Paso 1: una sola factorización PA = LU
+    reg.agregar("Paso 1: Calcular determinante de A (factorización PA = LU)")
+    if reg.detalle:
+        reg.agregar(f"  A:\n{formatear_matriz(A)}")
+    lu = factorizar_lu(A)
+    det_A = lu.determinante()
+    if reg.detalle:
+        reg.agregar(f"U (triangular superior):\n{formatear_matriz(lu.U)}")
+        signo = "" if lu.signo == 1 else "-"
+        diagonal = " × ".join(f"({lu.U[k][k]})" for k in range(n))
+        reg.agregar(f"det(A) = {signo}{diagonal}")
+    reg.agregar(f"det(A) = {det_A}")
+
+    if det_A.es_cero():
+        raise ValueError("A no es invertible (det(A) = 0). No se puede aplicar la Regla de Cramer.")
+
+    # Paso 2: resolver con la factorización (sustitución adelante y atrás)
+    solucion = lu.resolver(b)
+    reg.agregar("")
+    reg.agregar("Paso 2: Resolver A x = b con la factorización (L y = P b, U x = y)")
+    if reg.detalle:
+        reg.agregar("De x_i = det(A_i(b)) / det(A) se obtiene det(A_i(b)) = det(A)·x_i")
+    reg.agregar("")
+
+    # Paso 3 en adelante: explicación por variable
+    for i, x_i in enumerate(solucion):
+        reg.agregar(f"Paso {i + 3}: Calcular x{i + 1}")
+        det_A_i = det_A * x_i
+        if reg.detalle:
+            A_i = [fila[:i] + [b[j]] + fila[i + 1:] for j, fila in enumerate(A)]
+            reg.agregar(f"Matriz A_{i + 1}(b) (columna {i + 1} reemplazada por b):")
+            reg.agregar(formatear_matriz(A_i))
+        reg.agregar(f"det(A_{i + 1}(b)) = {det_A_i}")
+        reg.agregar(f"x_{i + 1} = det(A_{i + 1}(b)) / det(A) = {det_A_i} / {det_A} = {x_i}")
+        reg.agregar("")
+
+    return solucion, reg.pasos
+
+
+# Cantidad máxima de matrices intermedias que inversa_matriz escribe en los pasos
+MAX_INSTANTANEAS_INVERSA = 6
+
+
+def _instantaneas(reg, total, maximo):
+    """
+    Devuelve instantanea(titulo, M) para llamarla `total` veces: solo escribe
+    la matriz en `maximo` de esas llamadas, repartidas de forma pareja (la
+    última siempre incluida). Sin registro detallado no formatea nada.
+    """
+    llamadas = [0]
 
-    return True, M, pasos, pivotes, det
+    def instantanea(titulo, M):
+        e = llamadas[0]
+        llamadas[0] += 1
+        if reg.detalle and maximo > 0 and (e + 1) * maximo // total > e * maximo // total:
+            reg.agregar(f"{titulo}\n{formatear_matriz(M)}")
+    return instantanea
 
 
-def inversa_matriz(A):
-    """Calcula la inversa de una matriz por Gauss-Jordan"""
+def inversa_matriz(A, registro=None, modo="exacto", max_instantaneas=MAX_INSTANTANEAS_INVERSA):
+    """
+    Calcula la inversa de una matriz: PA = LU una sola vez, luego L⁻¹ y U⁻¹
+    (inversas triangulares) y A⁻¹ = U⁻¹·L⁻¹·P.
+    En modo "completo" se muestran a lo sumo max_instantaneas matrices
+    intermedias (L, U y las inversas parciales).
+    """
     n = len(A)
     if len(A[0]) != n:
         raise ValueError("La matriz debe ser cuadrada")
-
-    # Crear matriz aumentada [A | I]
-    M = []
-    for i in range(n):
-        fila = A[i][:]  # Copiar fila de A
-        # Añadir identidad
-        fila.extend([Fraccion(1) if j == i else Fraccion(0) for j in range(n)])
-        M.append(fila)
-
-    pasos = []
-    pasos.append(f"Cálculo de inversa de matriz {n}×{n}")
-    pasos.append(f"Matriz aumentada [A|I]:\n{formatear_matriz(M)}")
-
-    # Aplicar Gauss-Jordan
-    for i in range(n):
-        # Buscar pivote
-        pivote = i
-        while pivote < n and M[pivote][i].es_cero():
-            pivote += 1
-
-        if pivote == n:
-            raise ValueError("Matriz no es invertible (determinante = 0)")
-
-        if pivote != i:
-            M[i], M[pivote] = M[pivote], M[i]
-            pasos.append(f"Intercambio fila {i + 1} con fila {pivote + 1}")
-
-        # Normalizar fila pivote
-        pivote_val = M[i][i]
-        if pivote_val != Fraccion(1):
-            for j in range(2 * n):
-                M[i][j] = M[i][j] / pivote_val
-            pasos.append(f"Normalizar fila {i + 1} dividiendo por {pivote_val}")
-
-        # Eliminar en otras filas
-        for k in range(n):
-            if k != i and not M[k][i].es_cero():
-                factor = M[k][i]
-                for j in range(2 * n):
-                    M[k][j] = M[k][j] - factor * M[i][j]
-                pasos.append(f"Eliminar elemento ({k + 1},{i + 1}) usando factor {factor}")
-
-        pasos.append(f"Después de procesar columna {i + 1}:\n{formatear_matriz(M)}")
-
-    # Extraer inversa
-    inversa = []
-    for i in range(n):
-        inversa.append(M[i][n:])
-
-    pasos.append("Matriz inversa encontrada:")
-    pasos.append(formatear_matriz(inversa))
-
-    return inversa, pasos
+    motor = _motor_flotante(modo)
+    if motor is not None:
+        return motor.inversa(A, registro)
+    A = _como_listas(A)
+
+    reg = _como_registro(registro)
+    reg.agregar(f"Cálculo de inversa de matriz {n}×{n} (PA = LU e inversas triangulares)")
+    lu = factorizar_lu(A)
+    if lu.singular:
+        raise ValueError("Matriz no es invertible (determinante = 0)")
+
+    instantanea = _instantaneas(reg, 2 + 2 * n, max_instantaneas)
+    if reg.detalle:
+        intercambios = [f"{i + 1}←{p + 1}" for i, p in enumerate(lu.permutacion) if i != p]
+        reg.agregar("Factorización PA = LU" +
+                    (f" con filas permutadas ({', '.join(intercambios)})" if intercambios else " (sin intercambios)"))
+    instantanea("L =", lu.L)
+    instantanea("U =", lu.U)
+    L_inv = lu.inversa_L(lambda j, X: instantanea(f"L⁻¹ (columnas 1 a {j + 1}):", X))
+    U_inv = lu.inversa_U(lambda j, Y: instantanea(f"U⁻¹ (columnas 1 a {j + 1}):", Y))
+    if reg.detalle:
+        reg.agregar("A⁻¹ = U⁻¹·L⁻¹·P")
+    inversa = lu.componer_inversa(U_inv, L_inv)
+
+    if reg.activo:
+        reg.agregar("Matriz inversa encontrada:")
+        reg.agregar(formatear_matriz(inversa))
+
+    return inversa, reg.pasos
@@ -1,3 +1,5 @@
+import ast
+import functools
 import math
 from fraccion import Fraccion
 
@@ -85,28 +87,71 @@ def biseccion(f, a, b, tol=1e-6, max_iter=100, usar_error="absoluto"):
     return c, pasos, f"Máximo de iteraciones ({max_iter}) alcanzado"
 
 
+# Lo único que puede usar una función escrita como texto, además de x
+_NOMBRES = {
+    'math': math,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'exp': math.exp,
+    'log': math.log,
+    'log10': math.log10,
+    'sqrt': math.sqrt,
+    'pi': math.pi,
+    'e': math.e
+}
+_FUNCIONES_MATH = {nombre for nombre in dir(math) if not nombre.startswith('_')}
+_NODOS = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Attribute, ast.Constant, ast.Load,
+          ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub)
+
+
+def _validar_expresion(arbol):
+    """
+    Recorre el árbol y rechaza todo lo que no sea un número, x, un nombre de
+    _NOMBRES, un operador aritmético o una llamada a una de esas funciones (o
+    a math.<función>). Los números pasan a float, así una potencia enorme
+    desborda en lugar de calcular un entero gigante.
+    """
+    for nodo in ast.walk(arbol):
+        if not isinstance(nodo, _NODOS):
+            raise ValueError(f"No permitido en la función: {type(nodo).__name__}")
+        if isinstance(nodo, ast.Constant):
+            if type(nodo.value) not in (int, float):
+                raise ValueError(f"Constante no permitida en la función: {nodo.value!r}")
+            nodo.value = float(nodo.value)
+        elif isinstance(nodo, ast.Name) and nodo.id != 'x' and nodo.id not in _NOMBRES:
+            raise ValueError(f"Nombre desconocido en la función: {nodo.id}")
+        elif isinstance(nodo, ast.Attribute):
+            if not (isinstance(nodo.value, ast.Name) and nodo.value.id == 'math' and nodo.attr in _FUNCIONES_MATH):
+                raise ValueError(f"Atributo no permitido en la función: {nodo.attr}")
+        elif isinstance(nodo, ast.Call) and nodo.keywords:
+            raise ValueError("Las funciones no aceptan argumentos con nombre")
+
+
+@functools.lru_cache(maxsize=256)
+def compilar_funcion(func_str):
+    """
+    Valida y compila una expresión en x. Lanza ValueError si no es una
+    expresión aritmética con las funciones permitidas (ver _validar_expresion).
+    """
+    try:
+        arbol = ast.parse(func_str.strip(), mode='eval')
+        _validar_expresion(arbol)
+    except (SyntaxError, OverflowError) as e:
+        raise ValueError(f"Expresión inválida: {func_str!r} ({e})")
+    return compile(arbol, '<funcion>', 'eval')
+
+
 def evaluar_funcion(func_str, x):
     """
     Evalúa una función matemática en un punto x
     Soporta: +, -, *, /, **, sin, cos, tan, exp, log, sqrt, etc.
+    La expresión se valida antes (compilar_funcion): no se ejecuta nada más
+    que aritmética, así que sirve para textos que vienen de archivos.
     """
-    # Crear namespace seguro
-    namespace = {
-        'math': math,
-        'x': x,
-        'sin': math.sin,
-        'cos': math.cos,
-        'tan': math.tan,
-        'exp': math.exp,
-        'log': math.log,
-        'log10': math.log10,
-        'sqrt': math.sqrt,
-        'pi': math.pi,
-        'e': math.e
-    }
-
+    codigo = compilar_funcion(func_str)
     try:
-        result = eval(func_str, {"__builtins__": {}}, namespace)
+        result = eval(codigo, {"__builtins__": {}}, dict(_NOMBRES, x=x))
         return float(result)
     except Exception as e:
         raise ValueError(f"Error evaluando f({x}): {str(e)}")
@@ -0,0 +1,204 @@
+"""
+MatrizRacional: matriz densa de racionales guardada en dos arreglos de NumPy
+(numeradores y denominadores, uno por entrada) en lugar de listas de Fraccion.
+
+Mientras los valores entran en int64 se usan arreglos int64; si una operación
+podría desbordar, la matriz se promueve a enteros de Python (dtype=object) y
+sigue siendo exacta. Las funciones de matrices.py, gauss.py y flotante.py la
+aceptan en lugar de una lista de listas.
+"""
+import math
+
+import numpy as np
+
+from fraccion import Fraccion
+
+# Margen para detectar desbordes: se trabaja en int64 solo si los resultados
+# intermedios quedan por debajo de 2⁶² en valor absoluto.
+_LIMITE_INT64 = 2 ** 62
+
+
+def _maximo(a):
+    return int(np.abs(a).max(initial=0))
+
+
+def _reducir(num, den):
+    """Reduce num/den entrada por entrada y deja den > 0 (en el lugar)."""
+    g = np.gcd(num, den)
+    g[g == 0] = 1
+    num //= g
+    den //= g
+    negativos = den < 0
+    num[negativos] = -num[negativos]
+    den[negativos] = -den[negativos]
+
+
+class MatrizRacional:
+    __slots__ = ("num", "den")
+
+    def __init__(self, num, den=None):
+        """
+        num, den: arreglos 2D de enteros con la misma forma (den=None → 1).
+        No se copian: la matriz comparte memoria con ellos (y, si son vistas
+        de otros arreglos, no puede pasar de int64 a enteros de Python).
+        """
+        num = np.asarray(num)
+        if num.ndim != 2:
+            raise ValueError("La matriz debe ser bidimensional")
+        if den is None:
+            den = np.ones(num.shape, dtype=num.dtype)
+        den = np.asarray(den)
+        if den.shape != num.shape:
+            raise ValueError("Numeradores y denominadores deben tener la misma forma")
+        if (den == 0).any():
+            raise ZeroDivisionError("Denominador no puede ser cero")
+        if num.dtype != den.dtype:
+            num, den = num.astype(object), den.astype(object)
+        self.num = num
+        self.den = den
+
+    @classmethod
+    def desde_listas(cls, A):
+        """Construye la matriz a partir de una lista de listas (Fraccion, int o texto)."""
+        filas = [[x if isinstance(x, Fraccion) else Fraccion(x) for x in fila] for fila in A]
+        if not filas or any(len(fila) != len(filas[0]) for fila in filas):
+            raise ValueError("Todas las filas de la matriz deben tener la misma longitud")
+        nums = [[int(x.numerador) for x in fila] for fila in filas]
+        dens = [[int(x.denominador) for x in fila] for fila in filas]
+        cabe = all(-_LIMITE_INT64 < v < _LIMITE_INT64 for fila in nums for v in fila) and \
+            all(v < _LIMITE_INT64 for fila in dens for v in fila)
+        dtype = np.int64 if cabe else object
+        return cls(np.array(nums, dtype=dtype), np.array(dens, dtype=dtype))
+
+    def a_listas(self):
+        """Lista de listas de Fraccion (la representación de siempre)."""
+        return [[Fraccion(int(n), int(d)) for n, d in zip(fn, fd)]
+                for fn, fd in zip(self.num.tolist(), self.den.tolist())]
+
+    def a_flotante(self):
+        return self.num.astype(np.float64) / self.den.astype(np.float64)
+
+    def filas_enteras(self):
+        """
+        Cada fila multiplicada por el mcm de sus denominadores.
+        Devuelve (lista de filas de int, escalas) como gauss._filas_a_enteros.
+        """
+        escalas = [math.lcm(*fila) for fila in self.den.tolist()]
+        filas = [[n * (e // d) for n, d in zip(fn, fd)]
+                 for fn, fd, e in zip(self.num.tolist(), self.den.tolist(), escalas)]
+        return filas, escalas
+
+    # ---------- forma, vistas y acceso ----------
+
+    @property
+    def forma(self):
+        return self.num.shape
+
+    @property
+    def es_int64(self):
+        return self.num.dtype == np.int64
+
+    @property
+    def T(self):
+        """Transpuesta como vista (no copia los datos)."""
+        return MatrizRacional(self.num.T, self.den.T)
+
+    def copia(self):
+        return MatrizRacional(self.num.copy(), self.den.copy())
+
+    def __len__(self):
+        return self.num.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, clave):
+        """
+        M[i] → fila i como lista de Fraccion (copia);
+        M[i, j] → Fraccion; M[a:b, c:d] → MatrizRacional que es una vista.
+        """
+        if isinstance(clave, tuple):
+            n, d = self.num[clave], self.den[clave]
+            if np.ndim(n) == 0:
+                return Fraccion(int(n), int(d))
+            if np.ndim(n) == 1:
+                return [Fraccion(int(a), int(b)) for a, b in zip(n.tolist(), d.tolist())]
+            return MatrizRacional(n, d)
+        if isinstance(clave, slice):
+            return MatrizRacional(self.num[clave], self.den[clave])
+        return [Fraccion(int(a), int(b)) for a, b in zip(self.num[clave].tolist(), self.den[clave].tolist())]
+
+    def __setitem__(self, clave, valor):
+        i, j = clave
+        valor = Fraccion(valor)
+        n, d = int(valor.numerador), int(valor.denominador)
+        if self.es_int64 and not (-_LIMITE_INT64 < n < _LIMITE_INT64 and d < _LIMITE_INT64):
+            self._promover()
+        self.num[i, j] = n
+        self.den[i, j] = d
+
+    def __eq__(self, other):
+        if not isinstance(other, MatrizRacional):
+            return NotImplemented
+        return self.forma == other.forma and bool((self.num == other.num).all() and (self.den == other.den).all())
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"MatrizRacional({self.a_listas()})"
+
+    # ---------- operaciones de fila (en el lugar, vectorizadas) ----------
+
+    def _promover(self):
+        """
+        Pasa a enteros de Python (dtype=object). Los arreglos nuevos ya no
+        comparten memoria con nadie, así que una vista (M[a:b], M.T) no se
+        puede promover: los cambios no llegarían a la matriz original.
+        """
+        if self.num.base is not None or self.den.base is not None:
+            raise ValueError("La operación no entra en int64 y la matriz es una vista: "
+                             "haga la operación sobre la matriz original o sobre una copia()")
+        self.num = self.num.astype(object)
+        self.den = self.den.astype(object)
+
+    def intercambiar_filas(self, i, j):
+        if i != j:
+            self.num[[i, j]] = self.num[[j, i]]
+            self.den[[i, j]] = self.den[[j, i]]
+
+    def escalar_fila(self, i, escalar):
+        """F_i → c·F_i"""
+        c = Fraccion(escalar)
+        cn, cd = int(c.numerador), int(c.denominador)
+        if self.es_int64 and (abs(cn) >= _LIMITE_INT64 or cd >= _LIMITE_INT64
+                              or _maximo(self.num[i]) * abs(cn) >= _LIMITE_INT64
+                              or _maximo(self.den[i]) * cd >= _LIMITE_INT64):
+            self._promover()
+        num = self.num[i] * cn
+        den = self.den[i] * cd
+        _reducir(num, den)
+        self.num[i] = num
+        self.den[i] = den
+
+    def sumar_fila(self, destino, fuente, escalar):
+        """F_destino → F_destino + c·F_fuente"""
+        c = Fraccion(escalar)
+        cn, cd = int(c.numerador), int(c.denominador)
+        an, ad = self.num[destino], self.den[destino]
+        bn, bd = self.num[fuente], self.den[fuente]
+        if self.es_int64:
+            # a/b + c·e/f = (a·cd·f + cn·e·b) / (b·cd·f); el escalar solo
+            # también tiene que entrar en int64 aunque las filas sean nulas
+            cota_escalar = max(abs(cn), cd)
+            cota_den = _maximo(ad) * cd * _maximo(bd)
+            cota_num = _maximo(an) * cd * _maximo(bd) + abs(cn) * _maximo(bn) * _maximo(ad)
+            if max(cota_escalar, cota_den, cota_num) >= _LIMITE_INT64:
+                self._promover()
+                an, ad = self.num[destino], self.den[destino]
+                bn, bd = self.num[fuente], self.den[fuente]
+        num = an * (cd * bd) + (cn * bn) * ad
+        den = ad * (cd * bd)
+        _reducir(num, den)
+        self.num[destino] = num
+        self.den[destino] = den
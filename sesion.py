@@ -0,0 +1,224 @@
+"""
+Sesión de resolución de A x = b que se actualiza cuando cambia una entrada
+o una fila de A, o entradas de b, sin volver a factorizar.
+
+Cambiar la fila i de A es una modificación de rango uno, A' = A + e_i·vᵀ,
+así que por la fórmula de Sherman–Morrison
+
+    A'⁻¹ y = A⁻¹ y − z·(vᵀ A⁻¹ y) / (1 + vᵀ z),   con z = A⁻¹ e_i,
+
+y la nueva solución sale en O(n²) (una resolución con la factorización
+guardada) en lugar de O(n³). Las actualizaciones se encadenan sobre la
+última factorización hasta MAX_ACTUALIZACIONES; después se factoriza de
+nuevo.
+
+En modo exacto 1 + vᵀz = 0 significa que la nueva matriz es singular. En
+modo flotante, si ese denominador es casi cero o el residuo de la solución
+actualizada es grande, se resuelve de nuevo desde cero.
+"""
+from fraccion import Fraccion
+from gauss import factorizar_lu
+from matrices import _como_listas, _motor_flotante
+
+try:
+    import numpy as np
+except ImportError:  # solo hace falta en modo flotante
+    np = None
+
+# Cantidad de actualizaciones de rango uno antes de refactorizar
+MAX_ACTUALIZACIONES = 32
+
+# Modo flotante: |1 + vᵀz| <= TOLERANCIA · (1 + |v|·|z|) se trata como cero,
+# y un residuo mayor que TOLERANCIA_RESIDUO · (|A|·|x| + |b|) fuerza a resolver de nuevo
+TOLERANCIA = 1e-10
+TOLERANCIA_RESIDUO = 1e-8
+
+
+class SesionSistema:
+    """
+    Guarda A, b, la última factorización y la solución x.
+
+    Las operaciones cambiar_entrada, cambiar_fila, cambiar_b y actualizar
+    devuelven la nueva solución (None si la matriz quedó singular).
+    `ultimo_metodo` dice cómo se obtuvo: "factorización", "Sherman–Morrison"
+    o "sin cambios".
+    """
+
+    def __init__(self, A, b, modo="exacto", max_actualizaciones=MAX_ACTUALIZACIONES):
+        self._flotante = _motor_flotante(modo)
+        A = _como_listas(A)
+        self.n = len(A)
+        if self.n == 0 or any(len(fila) != self.n for fila in A):
+            raise ValueError("La matriz debe ser cuadrada")
+        if len(b) != self.n:
+            raise ValueError("El vector b debe tener tantas entradas como filas tiene A")
+        self.exacto = modo == "exacto"
+        self.max_actualizaciones = max_actualizaciones
+        if self.exacto:
+            self.A = [[x if isinstance(x, Fraccion) else Fraccion(x) for x in fila] for fila in A]
+            self.b = [x if isinstance(x, Fraccion) else Fraccion(x) for x in b]
+        else:
+            self.A = np.array([[float(x) for x in fila] for fila in A], dtype=np.float64)
+            self.b = np.array([float(x) for x in b], dtype=np.float64)
+        self.actualizaciones = 0
+        self.factorizaciones = 0
+        self._factorizar()
+
+    # ---------- factorización base y resolución ----------
+
+    def _factorizar(self):
+        """Factoriza la A actual desde cero y resuelve."""
+        self.factorizaciones += 1
+        self._cambios = []   # (i, v, z, den) de cada actualización sobre la base
+        self._base = None
+        self.ultimo_metodo = "factorización"
+        if self.exacto:
+            lu = factorizar_lu(self.A)
+            if not lu.singular:
+                self._base = lu.resolver
+        else:
+            self._base = self._flotante.factorizar_lu(self.A)
+        self.x = self._resolver(self.b) if self._base is not None else None
+        return self.x
+
+    def _resolver(self, y):
+        """A⁻¹ y con la factorización base y las actualizaciones encadenadas."""
+        w = self._base(y)
+        for i, v, z, den in self._cambios:
+            w = self._restar(w, z, self._producto(v, w) / den)
+        return w
+
+    def _producto(self, v, w):
+        """vᵀw con v disperso ({columna: valor})."""
+        if self.exacto:
+            return sum((c * w[j] for j, c in v.items()), Fraccion(0))
+        return sum(c * w[j] for j, c in v.items())
+
+    def _restar(self, w, z, escalar):
+        """w − escalar·z"""
+        if self.exacto:
+            if escalar.es_cero():
+                return w
+            return [wi - zi * escalar for wi, zi in zip(w, z)]
+        return w - escalar * z
+
+    def _unitario(self, i):
+        if self.exacto:
+            e = [Fraccion(0)] * self.n
+            e[i] = Fraccion(1)
+            return e
+        e = np.zeros(self.n)
+        e[i] = 1.0
+        return e
+
+    def _valor(self, x):
+        if self.exacto:
+            return x if isinstance(x, Fraccion) else Fraccion(x)
+        return float(x)
+
+    def _residuo_grande(self, x):
+        r = np.abs(self.A @ x - self.b).max()
+        escala = np.abs(self.A).sum(axis=1).max() * np.abs(x).max() + np.abs(self.b).max()
+        return not np.isfinite(r) or r > TOLERANCIA_RESIDUO * max(1.0, escala)
+
+    # ---------- actualización de rango uno ----------
+
+    def _actualizar_fila(self, i, v):
+        """Aplica A ← A + e_i·vᵀ (v: dict {columna: valor}, ya sumado a self.A)."""
+        if not v:
+            self.ultimo_metodo = "sin cambios"
+            return self.x
+        if self._base is None or len(self._cambios) >= self.max_actualizaciones:
+            return self._factorizar()
+
+        z = self._resolver(self._unitario(i))
+        vz = self._producto(v, z)
+        den = 1 + vz
+        if self.exacto:
+            if den.es_cero():
+                # La nueva matriz es singular; se refactoriza en el próximo cambio
+                self._base = None
+                self.x = None
+                self.ultimo_metodo = "Sherman–Morrison"
+                return None
+        else:
+            norma_v = max(abs(c) for c in v.values())
+            if abs(den) <= TOLERANCIA * (1.0 + norma_v * float(np.abs(z).max())):
+                return self._factorizar()
+
+        x = self._restar(self.x, z, self._producto(v, self.x) / den)
+        if not self.exacto and self._residuo_grande(x):
+            return self._factorizar()
+        self._cambios.append((i, v, z, den))
+        self.actualizaciones += 1
+        self.ultimo_metodo = "Sherman–Morrison"
+        self.x = x
+        return x
+
+    def cambiar_entrada(self, i, j, valor):
+        """A[i][j] ← valor"""
+        valor = self._valor(valor)
+        delta = valor - self.A[i][j]
+        self.A[i][j] = valor
+        return self._actualizar_fila(i, {j: delta} if delta != 0 else {})
+
+    def cambiar_fila(self, i, fila):
+        """A[i] ← fila"""
+        if len(fila) != self.n:
+            raise ValueError("La fila debe tener n entradas")
+        v = {}
+        for j, x in enumerate(fila):
+            x = self._valor(x)
+            delta = x - self.A[i][j]
+            if delta != 0:
+                v[j] = delta
+                self.A[i][j] = x
+        return self._actualizar_fila(i, v)
+
+    def cambiar_b(self, i, valor):
+        """b[i] ← valor: x ← x + (valor − b[i])·A⁻¹e_i"""
+        valor = self._valor(valor)
+        delta = valor - self.b[i]
+        self.b[i] = valor
+        if delta == 0:
+            self.ultimo_metodo = "sin cambios"
+            return self.x
+        if self._base is None:
+            return self._factorizar()
+        x = self._restar(self.x, self._resolver(self._unitario(i)), -delta)
+        if not self.exacto and self._residuo_grande(x):
+            return self._factorizar()
+        self.ultimo_metodo = "Sherman–Morrison"
+        self.x = x
+        return x
+
+    def actualizar(self, A, b):
+        """
+        Lleva la sesión a (A, b) nuevos: cada fila de A que cambió es una
+        actualización de rango uno y cada entrada de b una corrección; si
+        cambiaron más filas que MAX_ACTUALIZACIONES se factoriza de nuevo.
+        """
+        A = _como_listas(A)
+        if len(A) != self.n or any(len(fila) != self.n for fila in A) or len(b) != self.n:
+            raise ValueError("La matriz y el vector deben tener el mismo tamaño que los de la sesión")
+        filas = [i for i in range(self.n)
+                 if any(self._valor(x) != self.A[i][j] for j, x in enumerate(A[i]))]
+        if len(filas) > self.max_actualizaciones:
+            for i in filas:
+                for j, x in enumerate(A[i]):
+                    self.A[i][j] = self._valor(x)
+            for i, x in enumerate(b):
+                self.b[i] = self._valor(x)
+            return self._factorizar()
+
+        metodos = set()
+        for i in filas:
+            self.cambiar_fila(i, A[i])
+            metodos.add(self.ultimo_metodo)
+        for i, x in enumerate(b):
+            if self._valor(x) != self.b[i]:
+                self.cambiar_b(i, x)
+                metodos.add(self.ultimo_metodo)
+        self.ultimo_metodo = ("factorización" if "factorización" in metodos
+                              else "Sherman–Morrison" if metodos else "sin cambios")
+        return self.x
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+import cli
+
+
+@pytest.mark.parametrize("nombre, contenido", [
+    ("lista.json", "[[1, 2]]"),
+    ("numero.json", "[{\"operacion\": \"determinante\", \"matriz\": [[1]]}, 5]"),
+    ("lineas.jsonl", "{\"operacion\": \"determinante\", \"matriz\": [[1]]}\n[1, 2]\n"),
+    ("problemas.json", "{\"problemas\": 3}"),
+])
+def test_problema_que_no_es_objeto(tmp_path, capsys, nombre, contenido):
+    ruta = tmp_path / nombre
+    ruta.write_text(contenido, encoding="utf-8")
+    with pytest.raises(SystemExit) as salida:
+        cli.main([str(ruta)])
+    assert salida.value.code == 2
+    assert str(ruta) in capsys.readouterr().err
+
+
+def test_lote_valido(tmp_path, capsys):
+    ruta = tmp_path / "ok.jsonl"
+    ruta.write_text("{\"operacion\": \"determinante\", \"matriz\": [[1, 2], [3, 4]]}\n", encoding="utf-8")
+    assert cli.main([str(ruta)]) == 0
+    resultado = json.loads(capsys.readouterr().out)
+    assert resultado["ok"] and resultado["determinante"] == "-2"
+
+
+@pytest.mark.parametrize("funcion", [
+    "().__class__.__bases__[0].__subclasses__()",
+    "__import__('os').system('true')",
+    "x.__class__",
+    "math.__dict__",
+    "sqrt(x=2)",
+])
+def test_funcion_no_permitida(tmp_path, capsys, funcion):
+    ruta = tmp_path / "raices.jsonl"
+    problema = {"operacion": "biseccion", "funcion": funcion, "a": 0, "b": 2}
+    ruta.write_text(json.dumps(problema) + "\n", encoding="utf-8")
+    cli.main([str(ruta)])
+    resultado = json.loads(capsys.readouterr().out)
+    assert not resultado["ok"] and resultado["error"]
+
+
+def test_funcion_permitida(tmp_path, capsys):
+    ruta = tmp_path / "raices.jsonl"
+    problemas = [
+        {"operacion": "biseccion", "funcion": "x^2 - 2", "a": 0, "b": 2, "tol": 1e-10},
+        {"operacion": "newton-raphson", "funcion": "math.cos(x) - x", "x0": 1},
+        {"operacion": "secante", "funcion": "exp(-x) - x/pi + 7 // 2 - 3", "x0": 0, "x1": 1},
+    ]
+    ruta.write_text("".join(json.dumps(p) + "\n" for p in problemas), encoding="utf-8")
+    assert cli.main([str(ruta)]) == 0
+    raiz, coseno, exponencial = [json.loads(linea) for linea in capsys.readouterr().out.splitlines()]
+    assert raiz["ok"] and abs(raiz["raiz"] - 2 ** 0.5) < 1e-8
+    assert coseno["ok"] and abs(coseno["raiz"] - 0.7390851332) < 1e-6
+    assert exponencial["ok"]
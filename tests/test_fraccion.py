@@ -0,0 +1,98 @@
+import copy
+import pickle
+
+import pytest
+
+from fraccion import Fraccion
+
+
+def test_no_se_puede_modificar_un_valor_cacheado():
+    x = Fraccion(5)
+    with pytest.raises(AttributeError):
+        x._num = 7
+    with pytest.raises(AttributeError):
+        x._den = 2
+    with pytest.raises(AttributeError):
+        del x._num
+    with pytest.raises(AttributeError):
+        x.otro = 1
+    assert Fraccion(5) == 5
+    assert Fraccion(5) + Fraccion(1, 2) == Fraccion(11, 2)
+
+
+def test_copia_y_pickle_de_fraccion_inmutable():
+    x = Fraccion(-3, 4)
+    assert copy.deepcopy(x) is x
+    assert pickle.loads(pickle.dumps(x)) == x
+
+
+@pytest.mark.parametrize("n, d", [(7, 2), (-7, 2), (5, 2), (-5, 2), (1, 3), (-10, 4), (9, 1), (0, 1)])
+def test_interoperabilidad_con_fraction(n, d):
+    from fractions import Fraction
+    import math
+
+    x, f = Fraccion(n, d), Fraction(n, d)
+    assert round(x) == round(f)
+    assert round(x, 1) == round(f, 1)
+    assert round(x, -1) == round(f, -1)
+    assert math.trunc(x) == math.trunc(f)
+    assert math.floor(x) == math.floor(f)
+    assert math.ceil(x) == math.ceil(f)
+    for otro in (1, 3, -2, Fraction(2, 3), Fraccion(-3, 5)):
+        assert x // otro == f // otro
+        assert x % otro == f % otro
+        assert divmod(x, otro) == divmod(f, otro)
+        assert 7 // x == 7 // f if n else True
+        assert (7 % x == 7 % f) if n else True
+    assert x // 0.5 == f // 0.5
+    assert x.real == x and x.imag == 0 and x.conjugate() == x
+    assert complex(x) == complex(f)
+
+
+def test_potencias_con_exponente_fraccion():
+    assert 2 ** Fraccion(1) == 2
+    assert 2 ** Fraccion(3) == Fraccion(8)
+    assert Fraccion(1, 2) ** Fraccion(-2) == Fraccion(4)
+    assert 4 ** Fraccion(1, 2) == 2.0
+    assert isinstance(Fraccion(2) ** Fraccion(3), Fraccion)
+
+
+def test_registrada_como_rational():
+    import numbers
+    assert isinstance(Fraccion(1, 2), numbers.Rational)
+
+
+@pytest.fixture(params=["python", "gmpy2"])
+def backend(request):
+    import fraccion
+    anterior = fraccion.backend_actual()
+    try:
+        fraccion.usar_backend(request.param)
+    except ValueError:
+        pytest.skip("gmpy2 no está instalado")
+    yield request.param
+    fraccion.usar_backend(anterior)
+
+
+def test_backends_dan_los_mismos_resultados(backend):
+    from fractions import Fraction
+
+    valores = [(7, 3), (-5, 11), (0, 1), (12, -8), (10**20 + 1, 3), (4, 1)]
+    for a, b in valores:
+        for c, d in valores:
+            x, y = Fraccion(a, b), Fraccion(c, d)
+            fx, fy = Fraction(a, b), Fraction(c, d)
+            assert (x + y, x - y, x * y) == (fx + fy, fx - fy, fx * fy)
+            assert str(x * y) == str(fx * fy)
+            assert (x < y, x <= y, x == y) == (fx < fy, fx <= fy, fx == fy)
+            if c:
+                assert x / y == fx / fy
+                assert (x / y).numerador == (fx / fy).numerator
+        assert (x + 2, 2 - x, x * -3, x ** 2, -x, abs(x)) == (fx + 2, 2 - fx, fx * -3, fx ** 2, -fx, abs(fx))
+        assert hash(x) == hash(fx) and float(x) == float(fx) and int(x) == int(fx)
+    assert Fraccion("3/6") == Fraccion(1, 2) and repr(Fraccion(-2, 4)) == "Fraccion(-1, 2)"
+    assert Fraccion(Fraction(1, 2), 3) == Fraction(1, 6)
+    with pytest.raises(ZeroDivisionError):
+        Fraccion(1, 0)
+    with pytest.raises(ZeroDivisionError):
+        Fraccion(0).reciproco()
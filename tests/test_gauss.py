@@ -0,0 +1,379 @@
+import random
+
+import pytest
+
+import gauss
+from banda import MotorBanda, crear_motor, detectar_banda, resolver_banda, resolver_sistema, resolver_tridiagonal
+from fraccion import Fraccion
+from gauss import (FactorizacionLU, FormaReducida, GaussEngine, GaussJordanEngine, base_espacio_columnas, base_espacio_nulo,
+                   factorizar_lu, forma_reducida, info_cache_lu, limpiar_cache_lu, rango)
+from matrices import eliminacion_bareiss
+import sesion as modulo_sesion
+from sesion import SesionSistema
+
+
+def _aleatoria(rnd, m, n):
+    """Matriz m×n con fracciones, filas nulas, filas repetidas y columnas nulas."""
+    M = []
+    for _ in range(m):
+        tipo = rnd.random()
+        if tipo < 0.15:
+            fila = [Fraccion(0)] * n
+        elif tipo < 0.3 and M:
+            k = Fraccion(rnd.randint(-3, 3), rnd.randint(1, 4))
+            fila = [x * k for x in rnd.choice(M)]
+        else:
+            fila = [Fraccion(rnd.randint(-5, 5), rnd.choice([1, 2, 3, 7])) if rnd.random() > 0.2 else Fraccion(0)
+                    for _ in range(n)]
+        M.append(fila)
+    if rnd.random() < 0.3:
+        c = rnd.randrange(n)
+        for fila in M:
+            fila[c] = Fraccion(0)
+    return M
+
+
+def _estado(motor):
+    return [list(fila) for fila in motor.matriz_actual], (motor.fila_actual, motor.col_actual, motor.terminado)
+
+
+def _avanzar_registrando(motor):
+    """Avanza con siguiente() hasta terminar y devuelve el estado después de cada paso."""
+    estados = [_estado(motor)]
+    while not motor.terminado:
+        motor.siguiente()
+        estados.append(_estado(motor))
+    return estados
+
+
+@pytest.mark.parametrize("motor", [GaussJordanEngine, GaussEngine])
+@pytest.mark.parametrize("intervalo", [1, 3, None])
+def test_log_pasos_reconstruye_cada_paso(motor, intervalo):
+    rnd = random.Random(2)
+    hubo_deltas = False
+    for _ in range(40):
+        M = _aleatoria(rnd, rnd.randint(2, 6), rnd.randint(2, 7))
+        engine = motor(M, intervalo_checkpoint=intervalo)
+        estados = _avanzar_registrando(engine)
+        assert len(engine.log) == len(estados)
+        for k, (matriz, _) in enumerate(estados):
+            assert engine.log.matriz_en(k) == matriz
+            assert engine.log[k].matriz == matriz
+        assert engine.log.matriz_en(-1) == estados[-1][0]
+        hubo_deltas |= any(paso.checkpoint is None for paso in engine.log)
+    # Aun con intervalo 1, el paso que sigue a un checkpoint se guarda como delta
+    assert hubo_deltas
+
+
+@pytest.mark.parametrize("motor", [GaussJordanEngine, GaussEngine])
+def test_resolver_sin_pasos_igual_que_paso_a_paso(motor):
+    rnd = random.Random(1)
+    for _ in range(150):
+        M = _aleatoria(rnd, rnd.randint(1, 6), rnd.randint(1, 7))
+        con_pasos = motor(M)
+        con_pasos.resolver()
+        sin_pasos = motor(M)
+        sin_pasos.resolver(registrar=False)
+        assert sin_pasos.matriz_actual == con_pasos.matriz_actual
+        assert (sin_pasos.fila_actual, sin_pasos.col_actual) == (con_pasos.fila_actual, con_pasos.col_actual)
+        assert all(isinstance(x, Fraccion) for fila in sin_pasos.matriz_actual for x in fila)
+
+        # Retomar a mitad de camino da lo mismo
+        a_medias = motor(M)
+        for _ in range(rnd.randint(1, 5)):
+            a_medias.siguiente()
+        a_medias.resolver(registrar=False)
+        assert a_medias.matriz_actual == con_pasos.matriz_actual
+
+
+@pytest.mark.parametrize("motor", [GaussJordanEngine, GaussEngine])
+@pytest.mark.parametrize("ancho", [1, 2, 5])
+def test_resolver_sin_pasos_en_banda(motor, ancho):
+    # Tridiagonal: se elimina con Fraccion; más ancha, sin fracciones
+    rnd = random.Random(ancho)
+    n = 40
+    M = [[Fraccion(rnd.randint(1, 9), rnd.choice([1, 2])) if abs(i - j) <= ancho else Fraccion(0) for j in range(n)]
+         + [Fraccion(1)] for i in range(n)]
+    M[3][3] = Fraccion(0)
+    con_pasos = motor(M)
+    con_pasos.resolver()
+    sin_pasos = motor(M)
+    sin_pasos.resolver(registrar=False)
+    assert sin_pasos.matriz_actual == con_pasos.matriz_actual
+
+
+@pytest.mark.parametrize("motor", [GaussJordanEngine, GaussEngine])
+def test_ir_a_y_anterior_igual_que_avanzar(motor):
+    rnd = random.Random(3)
+    for _ in range(40):
+        M = _aleatoria(rnd, rnd.randint(2, 6), rnd.randint(2, 7))
+        estados = _avanzar_registrando(motor(M))
+        ultimo = len(estados) - 1
+
+        engine = motor(M)
+        k = rnd.randint(0, ultimo)
+        engine.ir_a(k)  # todavía no calculado: avanza hasta k
+        assert _estado(engine) == estados[k]
+        engine.ir_a(ultimo + 5)
+        assert engine.posicion == ultimo and _estado(engine) == estados[ultimo]
+
+        for _ in range(5):
+            k = rnd.randint(0, ultimo)
+            engine.ir_a(k)
+            assert _estado(engine) == estados[k]
+            if k > 0:
+                engine.anterior()
+                assert _estado(engine) == estados[k - 1]
+                engine.siguiente()
+                assert _estado(engine) == estados[k]
+
+        engine.ir_a(0)
+        assert engine.anterior() is None
+        assert _estado(engine) == estados[0]
+
+        # Retomar desde un paso anterior termina igual
+        engine.ir_a(rnd.randint(0, ultimo))
+        engine.resolver()
+        assert _estado(engine) == estados[ultimo]
+
+
+def _producto(A, B):
+    return [[sum((a * b for a, b in zip(fila, columna)), Fraccion(0)) for columna in zip(*B)] for fila in A]
+
+
+def _invertible(n, semilla):
+    rnd = random.Random(semilla)
+    while True:
+        A = [[Fraccion(rnd.randint(-5, 5), rnd.choice([1, 2, 3])) for _ in range(n)] for _ in range(n)]
+        A[0][0] = Fraccion(0)  # obliga a intercambiar filas
+        if not FactorizacionLU(A).singular:
+            return A
+
+
+def test_factorizacion_lu_y_resolver_varios():
+    A = _invertible(6, 4)
+    lu = FactorizacionLU(A)
+    assert lu.permutacion != list(range(6))
+    assert _producto(lu.L, lu.U) == [A[p] for p in lu.permutacion]
+    assert all(lu.L[i][j] == 0 for i in range(6) for j in range(i + 1, 6))
+    assert all(lu.U[i][j] == 0 for i in range(6) for j in range(i))
+
+    rnd = random.Random(5)
+    B = [[Fraccion(rnd.randint(-9, 9), rnd.randint(1, 4)) for _ in range(3)] for _ in range(6)]
+    X = lu.resolver_varios(B)
+    assert _producto(A, X) == B
+    assert [fila[1] for fila in X] == lu.resolver([fila[1] for fila in B])
+
+    singular = [fila[:] for fila in A]
+    singular[5] = [a - 2 * b for a, b in zip(A[1], A[3])]
+    lu = FactorizacionLU(singular)
+    assert lu.singular and lu.determinante() == 0
+    with pytest.raises(ValueError):
+        lu.resolver_varios(B)
+
+
+def test_cache_lu_descarta_la_menos_usada(monkeypatch):
+    monkeypatch.setattr(gauss, "MAX_CACHE_LU", 3)
+    limpiar_cache_lu()
+    A1, A2, A3, A4 = (_invertible(3, s) for s in range(4))
+    lu1, lu2, _ = factorizar_lu(A1), factorizar_lu(A2), factorizar_lu(A3)
+    # Misma clave por contenido, aunque sea otra lista
+    assert factorizar_lu([fila[:] for fila in A1]) is lu1
+    factorizar_lu(A4)  # descarta A2, la menos usada
+    assert info_cache_lu() == {"entradas": 3, "max_entradas": 3, "hits": 1, "misses": 4}
+    assert factorizar_lu(A1) is lu1
+    assert factorizar_lu(A2) is not lu2
+    assert info_cache_lu()["misses"] == 5
+    limpiar_cache_lu()
+    assert info_cache_lu()["entradas"] == 0
+
+
+def _aumentada(A, b=None):
+    return [[Fraccion(x) for x in fila] + [Fraccion(i + 1 if b is None else b[i])] for i, fila in enumerate(A)]
+
+
+def _en_banda(n, p, q, semilla):
+    rnd = random.Random(semilla)
+    return [[Fraccion(rnd.randint(1, 9) + (10 if i == j else 0)) if -p <= j - i <= q else Fraccion(0)
+             for j in range(n)] for i in range(n)]
+
+
+@pytest.mark.parametrize("A, banda", [
+    ([[3, 0, 0], [0, 2, 0], [0, 0, 1]], (0, 0)),
+    ([[2, 0, 0], [1, 2, 0], [0, 1, 2]], (1, 0)),
+    ([[2, 1, 0], [1, 2, 1], [0, 1, 2]], (1, 1)),
+    ([[1, 0, 5], [0, 1, 0], [0, 0, 1]], (0, 2)),
+    (_en_banda(7, 2, 1, 0), (2, 1)),
+])
+def test_detectar_banda(A, banda):
+    assert detectar_banda(A) == banda
+    # La columna del lado derecho no cuenta para la banda
+    assert detectar_banda(_aumentada(A, [9] * len(A)), columnas=len(A)) == banda
+
+
+@pytest.mark.parametrize("p, q", [(1, 1), (2, 1), (1, 3)])
+def test_resolver_sistema_en_banda(p, q):
+    A = _en_banda(9, p, q, p + q)
+    M = _aumentada(A)
+    x, log = resolver_sistema(M, pasos=True)
+    assert x == FactorizacionLU(A).resolver([fila[-1] for fila in M])
+    assert [fila[-1] for fila in log.matriz_en(-1)] == x
+    motor = crear_motor(M)
+    assert isinstance(motor, MotorBanda)
+    assert [fila[-1] for fila in motor.resolver()] == x
+
+
+# Regulares, pero sin intercambiar filas la eliminación encuentra un pivote nulo en la fila 2
+TRIDIAGONAL_PIVOTE_NULO = [[1, 1, 0, 0], [1, 1, 1, 0], [0, 1, 1, 1], [0, 0, 1, 1]]
+BANDA_PIVOTE_NULO = [[1, 1, 0, 0, 0, 0], [1, 1, 1, 0, 0, 0], [1, 2, 1, 1, 0, 0],
+                     [0, 1, 0, 1, 1, 0], [0, 0, 1, 2, 1, 1], [0, 0, 0, 1, 1, 3]]
+
+
+@pytest.mark.parametrize("A", [TRIDIAGONAL_PIVOTE_NULO, BANDA_PIVOTE_NULO], ids=["tridiagonal", "banda"])
+def test_pivote_nulo_vuelve_a_la_eliminacion_general(A):
+    M = _aumentada(A)
+    n = len(A)
+    if detectar_banda(A) == (1, 1):
+        diagonales = ([A[i][i - 1] for i in range(1, n)], [A[i][i] for i in range(n)], [A[i][i + 1] for i in range(n - 1)])
+        with pytest.raises(ValueError, match="Pivote nulo"):
+            resolver_tridiagonal(*diagonales, [fila[-1] for fila in M])
+    else:
+        with pytest.raises(ValueError, match="Pivote nulo"):
+            resolver_banda(M)
+    esperado = FactorizacionLU(A).resolver([fila[-1] for fila in M])
+    assert resolver_sistema(M)[0] == esperado
+    assert resolver_sistema(M, modo="flotante")[0] == pytest.approx([float(x) for x in esperado])
+    assert isinstance(crear_motor(M), GaussJordanEngine)
+
+
+def test_banda_singular():
+    A = [fila[:] for fila in TRIDIAGONAL_PIVOTE_NULO]
+    A[3] = [0, 0, 1, 0]  # F4 = F2 − F1: sin solución única
+    with pytest.raises(ValueError, match="singular"):
+        resolver_sistema(_aumentada(A))
+
+
+def _cambiar_al_azar(sesion, rnd):
+    n = sesion.n
+    que = rnd.choice(["entrada", "fila", "b"])
+    valor = lambda: Fraccion(rnd.randint(-9, 9), rnd.randint(1, 3))
+    if que == "entrada":
+        return sesion.cambiar_entrada(rnd.randrange(n), rnd.randrange(n), valor())
+    if que == "fila":
+        return sesion.cambiar_fila(rnd.randrange(n), [valor() for _ in range(n)])
+    return sesion.cambiar_b(rnd.randrange(n), valor())
+
+
+@pytest.mark.parametrize("max_actualizaciones", [32, 3])
+def test_sesion_exacta_igual_que_resolver_de_nuevo(max_actualizaciones):
+    rnd = random.Random(6)
+    A = _invertible(6, 6)
+    sesion = SesionSistema(A, [Fraccion(i) for i in range(6)], max_actualizaciones=max_actualizaciones)
+    metodos = set()
+    for _ in range(25):
+        x = _cambiar_al_azar(sesion, rnd)
+        metodos.add(sesion.ultimo_metodo)
+        lu = FactorizacionLU(sesion.A)
+        if lu.singular:
+            assert x is None and sesion.x is None
+        else:
+            assert x == sesion.x == lu.resolver(sesion.b)
+    assert "Sherman–Morrison" in metodos
+    assert (sesion.factorizaciones > 1) == (max_actualizaciones == 3)
+
+
+def test_sesion_exacta_singular_y_vuelta():
+    A = [[Fraccion(x) for x in fila] for fila in [[2, 1, 0], [1, 3, 1], [0, 1, 4]]]
+    b = [Fraccion(1), Fraccion(2), Fraccion(3)]
+    sesion = SesionSistema(A, b)
+    assert sesion.cambiar_fila(2, [3, 4, 1]) is None  # F3 = F1 + F2
+    assert sesion.cambiar_b(0, 5) is None
+    x = sesion.cambiar_entrada(2, 2, 7)
+    assert sesion.ultimo_metodo == "factorización"
+    assert x == FactorizacionLU(sesion.A).resolver(sesion.b)
+    assert sesion.cambiar_entrada(0, 0, 2) == x and sesion.ultimo_metodo == "sin cambios"
+
+
+def test_sesion_actualizar_varias_filas():
+    rnd = random.Random(7)
+    A = _invertible(5, 7)
+    sesion = SesionSistema(A, [Fraccion(1)] * 5)
+    nueva = [fila[:] for fila in A]
+    nueva[1][3] += 2
+    nueva[4] = [Fraccion(rnd.randint(-5, 5)) for _ in range(5)]
+    b = [Fraccion(i) for i in range(5)]
+    x = sesion.actualizar(nueva, b)
+    assert sesion.ultimo_metodo == "Sherman–Morrison"
+    assert x == FactorizacionLU(nueva).resolver(b)
+
+
+def test_sesion_flotante_igual_que_resolver_de_nuevo():
+    np = pytest.importorskip("numpy")
+    rnd = random.Random(8)
+    A = _invertible(6, 8)
+    sesion = SesionSistema(A, [Fraccion(i) for i in range(6)], modo="flotante")
+    for _ in range(25):
+        x = _cambiar_al_azar(sesion, rnd)
+        if abs(np.linalg.det(sesion.A)) > 1e-9:
+            assert x == pytest.approx(np.linalg.solve(sesion.A, sesion.b), rel=1e-8, abs=1e-8)
+
+
+@pytest.mark.parametrize("n", [1, 5, 32, 70])
+def test_lu_flotante_por_bloques(n):
+    np = pytest.importorskip("numpy")
+    import flotante
+    rng = np.random.default_rng(n)
+    A = rng.uniform(-1, 1, (n, n))
+    b = rng.uniform(-1, 1, n)
+    resolver = flotante.factorizar_lu(A)
+    assert resolver(b) == pytest.approx(np.linalg.solve(A, b), rel=1e-9, abs=1e-9)
+    if n > 2:
+        A[-1] = A[0] - 2 * A[1]  # el pivote nulo aparece en el último bloque
+        assert flotante.factorizar_lu(A) is None
+
+
+def test_sesion_flotante_singular_y_control_del_residuo(monkeypatch):
+    pytest.importorskip("numpy")
+    A = [[2, 1, 0], [1, 3, 1], [0, 1, 4]]
+    sesion = SesionSistema(A, [1, 2, 3], modo="flotante")
+    assert sesion.cambiar_fila(2, [3, 4, 1]) is None  # F3 = F1 + F2
+    assert sesion.cambiar_entrada(2, 2, 7) is not None
+    # Un residuo "grande" obliga a factorizar de nuevo, también al cambiar b
+    monkeypatch.setattr(modulo_sesion, "TOLERANCIA_RESIDUO", -1.0)
+    factorizaciones = sesion.factorizaciones
+    sesion.cambiar_b(0, 5)
+    assert sesion.ultimo_metodo == "factorización"
+    assert sesion.factorizaciones == factorizaciones + 1
+
+
+def test_forma_reducida_y_bases():
+    rnd = random.Random(9)
+    casos = [_aleatoria(rnd, rnd.randint(1, 6), rnd.randint(1, 7)) for _ in range(60)]
+    casos += [[[Fraccion(0)] * 4 for _ in range(3)], [[Fraccion(int(i == j)) for j in range(4)] for i in range(4)]]
+    for A in casos:
+        m, n = len(A), len(A[0])
+        fr = FormaReducida(A)
+        gj = GaussJordanEngine([fila + [Fraccion(0)] for fila in A])
+        gj.resolver()
+        assert fr.R == [fila[:n] for fila in gj.matriz_actual]
+        assert forma_reducida(A) == (fr.R, fr.pivotes)
+        assert fr.rango() == rango(A) == eliminacion_bareiss(A)["rango"]
+        assert sorted(fr.columnas_pivote() + fr.columnas_libres()) == list(range(n))
+
+        nulo = base_espacio_nulo(A)
+        assert nulo == fr.base_espacio_nulo()
+        assert len(nulo) == n - fr.rango()
+        for v in nulo:
+            assert all(sum((a * x for a, x in zip(fila, v)), Fraccion(0)) == 0 for fila in A)
+        if nulo:
+            assert eliminacion_bareiss(nulo)["rango"] == len(nulo)
+
+        columnas = base_espacio_columnas(A)
+        assert columnas == [[fila[j] for fila in A] for j in fr.pivotes]
+        if columnas:
+            # Independientes y generan todas las columnas de A
+            assert eliminacion_bareiss(columnas)["rango"] == fr.rango()
+            for j in range(n):
+                assert eliminacion_bareiss(columnas + [[fila[j] for fila in A]])["rango"] == fr.rango()
+        else:
+            assert all(x == 0 for fila in A for x in fila)
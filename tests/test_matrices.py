@@ -0,0 +1,231 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+import matrices
+from dispersa import MatrizDispersa, resolver_disperso
+from gauss import FactorizacionLU, GaussJordanEngine
+
+from fraccion import Fraccion
+from matrices import (A_por_u_mas_v, Au_mas_Av, VistaTranspuesta, _escalonada_fracciones, combinar_productos,
+                      determinante_cofactores, determinante_matriz, determinante_modular, eliminacion_bareiss,
+                      inversa_matriz, multiplicar_matrices, rango_modular)
+
+A5 = [[Fraccion(x) for x in fila] for fila in
+      [[2, 1, 0, 3, 1], [1, 4, 2, 0, 1], [0, 1, 3, 1, 2], [5, 0, 1, 2, 1], [1, 2, 1, 1, 3]]]
+
+
+def _aleatoria(m, n, semilla):
+    rnd = random.Random(semilla)
+    return [[Fraccion(rnd.randint(-9, 9), rnd.randint(1, 6)) for _ in range(n)] for _ in range(m)]
+
+
+def _singular(n, semilla):
+    # La última fila es combinación de las dos primeras
+    A = _aleatoria(n, n, semilla)
+    A[-1] = [a + Fraccion(2, 3) * b for a, b in zip(A[0], A[1])]
+    return A
+
+
+CASOS = {
+    "cuadrada": _aleatoria(6, 6, 1),
+    "singular": _singular(6, 2),
+    "ancha": _aleatoria(3, 7, 3),
+    "alta": _aleatoria(7, 3, 4),
+    "columna nula": [fila[:2] + [Fraccion(0)] + fila[2:] for fila in _aleatoria(4, 4, 5)],
+    "nula": [[Fraccion(0)] * 3 for _ in range(2)],
+}
+
+
+def _enteros_grandes(n, semilla):
+    rnd = random.Random(semilla)
+    return [[Fraccion(rnd.randint(-10 ** 15, 10 ** 15)) for _ in range(n)] for _ in range(n)]
+
+
+def _singular_grande(n, semilla):
+    A = _enteros_grandes(n, semilla)
+    A[-1] = [a - b for a, b in zip(A[0], A[1])]
+    return A
+
+
+# Entradas enteras grandes: hacen falta varios primos para el Teorema Chino del Resto
+CASOS_MODULARES = dict(CASOS, grande=_enteros_grandes(8, 6), grande_singular=_singular_grande(8, 7))
+
+
+def _referencia(A):
+    """Escalonada, rango, columnas pivote y determinante con fractions.Fraction."""
+    U = [[Fraction(str(x)) for x in fila] for fila in A]
+    m, n = len(U), len(U[0])
+    det, fila, columnas = Fraction(1), 0, []
+    for col in range(n):
+        p = next((i for i in range(fila, m) if U[i][col]), None)
+        if p is None:
+            continue
+        if p != fila:
+            U[fila], U[p] = U[p], U[fila]
+            det = -det
+        det *= U[fila][col]
+        for i in range(fila + 1, m):
+            factor = U[i][col] / U[fila][col]
+            U[i] = [a - factor * b for a, b in zip(U[i], U[fila])]
+        columnas.append(col)
+        fila += 1
+        if fila == m:
+            break
+    for i in range(fila, m):
+        U[i] = [Fraction(0)] * n
+    if m != n:
+        return U, fila, columnas, None
+    return U, fila, columnas, det if fila == n else Fraction(0)
+
+
+def _como_fraction(M):
+    return [[Fraction(str(x)) for x in fila] for fila in M]
+
+
+def test_cofactores_paralelo_con_pasos_detallados_falla():
+    with pytest.raises(ValueError):
+        determinante_cofactores(A5, paralelo=True)
+
+
+def test_cofactores_paralelo_en_resumen():
+    det, pasos = determinante_cofactores(A5, registro="resumen", paralelo=True, procesos=2)
+    assert det == determinante_matriz(A5, "ninguno")[0]
+    assert pasos
+
+
+def test_combinar_productos_nombres_por_defecto():
+    def F(filas):
+        return [[Fraccion(x) for x in fila] for fila in filas]
+    A, B = F([[1, 2], [3, 4]]), F([[0, 1], [1, 0]])
+    u, v, w = F([[1], [0]]), F([[0], [1]]), F([[1], [1]])
+    R, pasos = combinar_productos([(1, A, u), (2, B, v), (1, F([[1, 2], [3, 4]]), w)])
+    assert pasos[0] == "Operación: A1x1 + 2·A2x2 + A1x3"
+    assert R == [[Fraccion(6)], [Fraccion(10)]]
+
+
+def test_A_por_u_mas_v_y_Au_mas_Av():
+    A = [[Fraccion(x) for x in fila] for fila in [[1, 2], [3, 4]]]
+    u = [[Fraccion(1)], [Fraccion(2)]]
+    v = [[Fraccion(-1)], [Fraccion(5)]]
+    R1, pasos1 = A_por_u_mas_v(A, u, v)
+    R2, pasos2 = Au_mas_Av(A, u, v)
+    assert R1 == R2 == [[Fraccion(14)], [Fraccion(28)]]
+    assert pasos1[0] == "Operación: A(u + v)"
+    assert pasos2[0] == "Operación: Au + Av"
+    assert any("Au + Av = A(u + v)" in p for p in pasos2)
+
+
+@pytest.mark.parametrize("denominador", [1, 7])
+def test_producto_sin_pasos_enteros_y_fracciones(monkeypatch, denominador):
+    # Umbral bajo para que los enteros pasen por Strassen con dimensiones impares
+    monkeypatch.setattr(matrices, "UMBRAL_STRASSEN", 4)
+    rnd = random.Random(denominador)
+    A = [[Fraccion(rnd.randint(-9, 9), rnd.randint(1, denominador)) for _ in range(13)] for _ in range(11)]
+    B = [[Fraccion(rnd.randint(-9, 9), rnd.randint(1, denominador)) for _ in range(9)] for _ in range(13)]
+    C, _ = multiplicar_matrices(A, B, "ninguno")
+    esperado = [[sum(Fraction(str(A[i][k])) * Fraction(str(B[k][j])) for k in range(13)) for j in range(9)]
+                for i in range(11)]
+    assert all(type(x) is Fraccion for fila in C for x in fila)
+    assert [[Fraction(str(x)) for x in fila] for fila in C] == esperado
+    Ct, _ = multiplicar_matrices(VistaTranspuesta(B), VistaTranspuesta(A), "ninguno")
+    assert Ct == [list(columna) for columna in zip(*C)]
+
+
+@pytest.mark.parametrize("caso", CASOS)
+def test_eliminacion_bareiss_igual_que_fraction(caso):
+    A = CASOS[caso]
+    U, rango, columnas, det = _referencia(A)
+    info = eliminacion_bareiss(A)
+    assert info["rango"] == rango
+    assert [c for _, c in info["pivotes"]] == columnas
+    assert _como_fraction(_escalonada_fracciones(info)) == U
+    assert (info["det"] is None) if det is None else (Fraction(str(info["det"])) == det)
+
+
+@pytest.mark.parametrize("con_numpy", [True, False])
+@pytest.mark.parametrize("caso", CASOS_MODULARES)
+def test_determinante_y_rango_modular_igual_que_fraction(monkeypatch, caso, con_numpy):
+    if con_numpy and matrices.np is None:
+        pytest.skip("NumPy no está instalado")
+    if not con_numpy:
+        monkeypatch.setattr(matrices, "np", None)
+    A = CASOS_MODULARES[caso]
+    _, rango, _, det = _referencia(A)
+    assert rango_modular(A, "ninguno")[0] == rango
+    if det is None:
+        with pytest.raises(ValueError):
+            determinante_modular(A, "ninguno")
+    else:
+        assert Fraction(str(determinante_modular(A, "ninguno")[0])) == det
+
+
+def _dispersa_aleatoria(n, semilla):
+    rnd = random.Random(semilla)
+    entradas = {(i, i): Fraccion(rnd.randint(1, 9)) for i in range(n)}
+    for _ in range(2 * n):
+        entradas[rnd.randrange(n), rnd.randrange(n)] = Fraccion(rnd.randint(-9, 9), rnd.randint(1, 4))
+    return MatrizDispersa.desde_entradas(n, n, entradas)
+
+
+def test_resolver_disperso_resuelve():
+    A = _dispersa_aleatoria(30, 8)
+    b = [Fraccion(i % 5 - 2) for i in range(30)]
+    x, _ = resolver_disperso(A, b, "ninguno")
+    assert A.multiplicar_vector(x) == b
+    assert resolver_disperso(A.a_listas(), b, "ninguno")[0] == x
+
+
+def _combinacion_de_filas():
+    A = _dispersa_aleatoria(12, 9).a_listas()
+    A[7] = [a + Fraccion(3, 2) * b for a, b in zip(A[2], A[5])]
+    return A
+
+
+@pytest.mark.parametrize("A", [
+    [[1, 0, 2], [0, 0, 0], [3, 0, 1]],                       # columna y fila nulas
+    [[1, -1, 0], [-1, 2, -1], [0, -1, 1]],                  # tridiagonal singular
+    [[1, 2, 0, 0], [0, 1, 1, 0], [1, 3, 1, 0], [0, 0, 0, 5]],  # F3 = F1 + F2: se anula al eliminar
+    _combinacion_de_filas(),
+], ids=["nula", "tridiagonal", "cancelacion", "combinacion"])
+def test_resolver_disperso_singular(A):
+    with pytest.raises(ValueError, match="singular"):
+        resolver_disperso(A, [Fraccion(1)] * len(A), "ninguno")
+
+
+def _identidad(n):
+    return [[Fraccion(int(i == j)) for j in range(n)] for i in range(n)]
+
+
+def test_inversa_por_lu():
+    A = _aleatoria(6, 6, 10)
+    A[0][0] = Fraccion(0)  # obliga a intercambiar filas
+    inversa, _ = inversa_matriz(A, "ninguno")
+    assert multiplicar_matrices(A, inversa, "ninguno")[0] == _identidad(6)
+    assert inversa == FactorizacionLU(A).inversa()
+    gj = GaussJordanEngine([fila + identidad for fila, identidad in zip(A, _identidad(6))])
+    gj.resolver(registrar=False)
+    assert inversa == [fila[6:] for fila in gj.matriz_actual]
+
+
+def test_inversa_singular():
+    columna_nula = [fila[:2] + [Fraccion(0)] + fila[3:] for fila in _aleatoria(4, 4, 12)]
+    for A in (CASOS["singular"], columna_nula):
+        with pytest.raises(ValueError, match="no es invertible"):
+            inversa_matriz(A, "ninguno")
+    with pytest.raises(ValueError, match="cuadrada"):
+        inversa_matriz(CASOS["ancha"], "ninguno")
+
+
+@pytest.mark.parametrize("maximo", [0, 1, 3, 6, 100])
+def test_inversa_limita_las_matrices_intermedias(maximo):
+    n = 8
+    A = _aleatoria(n, n, 11)
+    inversa, pasos = inversa_matriz(A, "completo", max_instantaneas=maximo)
+    titulos = ("L =", "U =", "L⁻¹ (columnas", "U⁻¹ (columnas")
+    instantaneas = [p for p in pasos if p.startswith(titulos)]
+    assert len(instantaneas) == min(maximo, 2 + 2 * n)
+    if maximo:
+        assert instantaneas[-1].startswith(f"U⁻¹ (columnas 1 a {n}):")
+    assert inversa == inversa_matriz(A, "ninguno")[0]
@@ -0,0 +1,42 @@
+import pytest
+
+from fraccion import Fraccion
+from racional import MatrizRacional
+
+
+def test_escalar_fila_nula_con_escalar_enorme():
+    M = MatrizRacional.desde_listas([[0, 0], [1, 2]])
+    M.escalar_fila(0, 2 ** 70)
+    assert M.a_listas()[0] == [Fraccion(0), Fraccion(0)]
+    M.escalar_fila(1, Fraccion(1, 2 ** 70))
+    assert M[1, 1] == Fraccion(2, 2 ** 70)
+
+
+def test_sumar_fila_nula_con_escalar_enorme():
+    M = MatrizRacional.desde_listas([[0, 0], [0, 0]])
+    M.sumar_fila(0, 1, 2 ** 70)
+    assert M.a_listas() == [[Fraccion(0)] * 2] * 2
+    M = MatrizRacional.desde_listas([[1, 0], [0, 0]])
+    M.sumar_fila(0, 1, Fraccion(1, 2 ** 70))
+    assert M[0, 0] == Fraccion(1)
+
+
+@pytest.mark.parametrize("vista", [lambda M: M[0:2], lambda M: M.T, lambda M: M[:, 0:2]],
+                         ids=["filas", "transpuesta", "columnas"])
+def test_vista_no_se_promueve(vista):
+    M = MatrizRacional.desde_listas([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    V = vista(M)
+    V.escalar_fila(0, 3)  # entra en int64: cambia también M
+    assert vista(M) == V and M[0, 0] == 3
+    antes = M.copia()
+    for operacion in (lambda: V.escalar_fila(1, 2 ** 70), lambda: V.sumar_fila(0, 1, 2 ** 70),
+                      lambda: V.__setitem__((0, 0), 2 ** 70)):
+        with pytest.raises(ValueError, match="vista"):
+            operacion()
+    assert M == antes and M.es_int64
+
+    # Sobre una copia sí se promueve
+    C = V.copia()
+    C.escalar_fila(1, 2 ** 70)
+    assert not C.es_int64
+    assert C[1, 0] == V[1, 0] * 2 ** 70